@@ -1,5 +1,11 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class ContentConfig(AppConfig):
     name = 'content'
+
+    def ready(self):
+        import content.signals
+        from content.search import restore_search_index
+        post_migrate.connect(restore_search_index, sender=self)
@@ -0,0 +1,433 @@
+"""
+content.audio_cache
+~~~~~~~~~~~~~~~~~~~
+Disk-backed byte-range cache for proxied episode audio.
+
+Upstream files are cached in fixed-size blocks (``AUDIO_CACHE_BLOCK_SIZE``)
+keyed by URL and block index::
+
+    <AUDIO_CACHE_DIR>/<sha256(url)[:2]>/<sha256(url)>/meta.json
+    <AUDIO_CACHE_DIR>/<sha256(url)[:2]>/<sha256(url)>/<index>.blk
+
+A player's ``Range`` request is mapped onto blocks; cached blocks are read
+from disk and only the missing ones are fetched upstream, each with its own
+``Range`` request.  Concurrent requests for the same block in this process
+share one upstream fetch.  Block files are written atomically (temp file +
+rename), so processes sharing the directory never see partial blocks.
+
+A block's mtime is its last use.  When the directory grows past
+``AUDIO_CACHE_MAX_BYTES``, the least recently used blocks are deleted
+until it is back under 90 % of the cap.  An entry left without blocks
+loses its ``meta.json`` and directory with them, and metadata-only
+entries (upstreams without ``Range``) unused for longer than the evicted
+blocks go too.
+
+Upstreams that ignore ``Range`` are remembered in ``meta.json`` and
+streamed straight through :func:`content.audio_proxy.proxy_audio`.
+
+``meta.json`` also keeps the upstream's ``ETag`` / ``Last-Modified``.
+Once it is older than ``AUDIO_CACHE_MAX_AGE`` the next request
+revalidates it with a conditional ranged GET for block 0: a 304 just
+renews it, while a changed validator, size or first block drops every
+block of the entry, since an enclosure replaced at the same URL must not
+be served from the old file's bytes.  Block fetches send ``If-Range``, so
+a file that changes between revalidations comes back as a 200 and also
+drops the entry.  A block shorter than its place in the file calls for
+(anything but the last) is treated as a failed fetch and never cached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+import httpx
+from django.conf import settings
+from django.http import HttpResponse, StreamingHttpResponse
+
+from .audio_proxy import CHUNK_SIZE, get_client, proxy_audio
+
+logger = logging.getLogger(__name__)
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+_CONTENT_RANGE_RE = re.compile(r"^bytes (\d+)-(\d+)/(\d+|\*)$")
+
+# Fraction of the cap eviction shrinks the cache to.
+_LOW_WATER = 0.9
+
+# In-flight block / metadata fetches, keyed by (url digest, block index or "meta").
+_inflight: Dict[Tuple[str, object], asyncio.Future] = {}
+# Approximate bytes on disk per cache root, as seen by this process.
+_disk_usage: Dict[str, int] = {}
+_evicting = False
+
+
+class AudioBlockCache:
+    """Block-level LRU disk cache in front of the streaming audio proxy."""
+
+    def __init__(self):
+        self.root = Path(getattr(
+            settings, "AUDIO_CACHE_DIR", os.path.join(tempfile.gettempdir(), "podvault-audio-cache")
+        ))
+        self.block_size: int = getattr(settings, "AUDIO_CACHE_BLOCK_SIZE", 1024 * 1024)
+        self.max_bytes: int = getattr(settings, "AUDIO_CACHE_MAX_BYTES", 2 * 1024 ** 3)
+        self.max_age: int = getattr(settings, "AUDIO_CACHE_MAX_AGE", 3600)
+
+    # ------------------------------------------------------------------
+    # Entry point
+    # ------------------------------------------------------------------
+
+    async def serve(self, request, url: str):
+        """Answer *request* (optionally ranged) for *url* from cached blocks."""
+        digest = hashlib.sha256(url.encode()).hexdigest()
+        meta = await self._meta(url, digest)
+        if meta is None or not meta.get("ranges"):
+            return await proxy_audio(request, url)
+
+        size = meta["size"]
+        span = self.parse_range(request.headers.get("Range"), size)
+        if span is False:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+
+        start, end = span or (0, size - 1)
+        response = StreamingHttpResponse(
+            self._stream(url, digest, meta, start, end),
+            status=206 if span else 200,
+            content_type=meta.get("content_type") or "audio/mpeg",
+        )
+        response["Content-Length"] = str(end - start + 1)
+        response["Accept-Ranges"] = "bytes"
+        if span:
+            response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response["Access-Control-Allow-Origin"] = "*"
+        return response
+
+    @staticmethod
+    def parse_range(header: Optional[str], size: int):
+        """
+        Resolve a single ``bytes=`` range against *size*.
+
+        :returns: ``(start, end)`` inclusive, ``None`` for "whole file"
+                  (no header, or a form we don't serve partially), or
+                  ``False`` when unsatisfiable.
+        """
+        match = _RANGE_RE.match((header or "").strip())
+        if not match or not any(match.groups()):
+            return None
+        first, last = match.groups()
+        if not first:                                   # suffix: last N bytes
+            length = int(last)
+            if length == 0:
+                return False
+            return max(0, size - length), size - 1
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if start >= size or start > end:
+            return False
+        return start, end
+
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
+
+    async def _stream(self, url: str, digest: str, meta: dict, start: int, end: int) -> AsyncIterator[bytes]:
+        for index in range(start // self.block_size, end // self.block_size + 1):
+            block = await self._block(url, digest, index, meta)
+            if block is None:
+                return                                  # upstream failed mid-stream
+            block_start = index * self.block_size
+            lo = max(start - block_start, 0)
+            hi = min(end - block_start + 1, len(block))
+            for offset in range(lo, hi, CHUNK_SIZE):
+                yield block[offset:min(offset + CHUNK_SIZE, hi)]
+
+    async def _block(self, url: str, digest: str, index: int, meta: Optional[dict] = None) -> Optional[bytes]:
+        meta = meta or {}
+        expected = self._block_length(index, meta.get("size"))
+        path = self._entry_dir(digest) / f"{index}.blk"
+        data = await asyncio.to_thread(self._read_and_touch, path)
+        if data is not None and (expected is None or len(data) == expected):
+            return data
+        return await self._coalesced((digest, index), lambda: self._fetch_block(url, digest, index, meta))
+
+    async def _fetch_block(self, url: str, digest: str, index: int, meta: dict) -> Optional[bytes]:
+        start = index * self.block_size
+        headers = {"Range": f"bytes={start}-{start + self.block_size - 1}"}
+        if_range = self._if_range(meta)
+        if if_range:
+            headers["If-Range"] = if_range
+        try:
+            upstream = await get_client().get(url, headers=headers)
+        except httpx.HTTPError as exc:
+            logger.warning("[AudioCache] Block %d fetch failed for %s: %s", index, url, exc)
+            return None
+        if upstream.status_code != 206:
+            logger.warning("[AudioCache] Block %d of %s answered %s", index, url, upstream.status_code)
+            if upstream.status_code == 200 and if_range:
+                # If-Range failed: the file changed under us.
+                await self._drop_entry(digest)
+            return None
+        expected = self._block_length(index, meta.get("size"))
+        if expected is not None and len(upstream.content) != expected:
+            logger.warning(
+                "[AudioCache] Block %d of %s is %d bytes, expected %d — not cached.",
+                index, url, len(upstream.content), expected,
+            )
+            return None
+        await self._store(digest, f"{index}.blk", upstream.content)
+        return upstream.content
+
+    def _block_length(self, index: int, size: Optional[int]) -> Optional[int]:
+        """Bytes block *index* must hold for a file of *size* (``None`` if unknown)."""
+        if size is None:
+            return None
+        return max(0, min(self.block_size, size - index * self.block_size))
+
+    @staticmethod
+    def _if_range(meta: dict) -> Optional[str]:
+        """A strong validator for ``If-Range`` (weak ETags are not allowed there)."""
+        etag = meta.get("etag")
+        if etag and not etag.startswith("W/"):
+            return etag
+        return meta.get("last_modified")
+
+    # ------------------------------------------------------------------
+    # Metadata
+    # ------------------------------------------------------------------
+
+    async def _meta(self, url: str, digest: str) -> Optional[dict]:
+        path = self._entry_dir(digest) / "meta.json"
+        raw = await asyncio.to_thread(self._read_and_touch, path)
+        cached = json.loads(raw) if raw is not None else None
+        if cached is not None and time.time() - cached.get("checked", 0) < self.max_age:
+            return cached
+        return await self._coalesced((digest, "meta"), lambda: self._probe(url, digest, cached))
+
+    async def _probe(self, url: str, digest: str, cached: Optional[dict] = None) -> Optional[dict]:
+        """
+        Learn the size and validators with a ranged request for block 0
+        (which is kept).  Returns ``{"ranges": False}`` for upstreams that
+        ignore ``Range``.
+
+        With *cached* (expired) metadata the request is conditional: a 304
+        renews it, and a different file drops the entry's blocks.  If the
+        upstream cannot be reached the expired metadata is used as is.
+        """
+        headers = {"Range": f"bytes=0-{self.block_size - 1}"}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+        client = get_client()
+        request = client.build_request("GET", url, headers=headers)
+        try:
+            upstream = await client.send(request, stream=True)
+        except httpx.HTTPError as exc:
+            logger.warning("[AudioCache] Probe failed for %s: %s", url, exc)
+            return cached
+
+        block = None
+        try:
+            match = _CONTENT_RANGE_RE.match(upstream.headers.get("Content-Range", ""))
+            if upstream.status_code == 304 and cached is not None:
+                meta = dict(cached)
+            elif upstream.status_code != 206 or not match or match.group(3) == "*":
+                meta = {"ranges": False}
+            else:
+                meta = {
+                    "ranges": True,
+                    "size": int(match.group(3)),
+                    "content_type": upstream.headers.get("Content-Type", "audio/mpeg"),
+                    "etag": upstream.headers.get("ETag"),
+                    "last_modified": upstream.headers.get("Last-Modified"),
+                }
+                block = await upstream.aread()
+        finally:
+            await upstream.aclose()
+
+        if upstream.status_code >= 400:
+            return meta
+        changed = (
+            cached is not None and upstream.status_code != 304
+            and await self._changed(digest, cached, meta, block)
+        )
+        if changed:
+            logger.info("[AudioCache] %s changed upstream — dropping its cached blocks.", url)
+            await self._drop_entry(digest)
+        if block is not None and (cached is None or changed) and len(block) == self._block_length(0, meta["size"]):
+            await self._store(digest, "0.blk", block)
+        meta["checked"] = time.time()
+        await self._store(digest, "meta.json", json.dumps(meta).encode())
+        return meta
+
+    async def _changed(self, digest: str, cached: dict, meta: dict, block: Optional[bytes]) -> bool:
+        """Whether *meta* / first *block* describe a different file than *cached*."""
+        if not meta.get("ranges") or not cached.get("ranges"):
+            return True
+        fields = ("size", "etag", "last_modified")
+        if any(cached.get(field) != meta.get(field) for field in fields):
+            return True
+        stored = await asyncio.to_thread(self._read_and_touch, self._entry_dir(digest) / "0.blk")
+        return stored is not None and block is not None and stored != block
+
+    # ------------------------------------------------------------------
+    # Disk
+    # ------------------------------------------------------------------
+
+    def _entry_dir(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    async def _drop_entry(self, digest: str) -> None:
+        """Delete every cached file of one URL (its blocks and ``meta.json``)."""
+        freed = await asyncio.to_thread(self._unlink_entry, self._entry_dir(digest))
+        root = str(self.root)
+        if root in _disk_usage:
+            _disk_usage[root] = max(0, _disk_usage[root] - freed)
+
+    @staticmethod
+    def _unlink_entry(entry: Path) -> int:
+        freed = 0
+        for path in entry.glob("*"):
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            if path.suffix == ".blk":
+                freed += size
+        return freed
+
+    @staticmethod
+    def _read_and_touch(path: Path) -> Optional[bytes]:
+        try:
+            data = path.read_bytes()
+            os.utime(path)                              # mtime = last use (LRU)
+            return data
+        except FileNotFoundError:
+            return None
+
+    async def _store(self, digest: str, name: str, data: bytes) -> None:
+        await asyncio.to_thread(self._write_atomic, self._entry_dir(digest) / name, data)
+        root = str(self.root)
+        if root not in _disk_usage:
+            _disk_usage[root] = await asyncio.to_thread(self._scan_usage)
+        else:
+            _disk_usage[root] += len(data)
+        if _disk_usage[root] > self.max_bytes:
+            await self.evict()
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+    def _files(self):
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                if name.endswith(".blk"):
+                    path = os.path.join(dirpath, name)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    yield path, stat.st_size, stat.st_mtime
+
+    def _scan_usage(self) -> int:
+        return sum(size for _, size, _ in self._files())
+
+    def _evict_sync(self) -> int:
+        files = sorted(self._files(), key=lambda f: f[2])
+        usage = sum(size for _, size, _ in files)
+        target = int(self.max_bytes * _LOW_WATER)
+        cutoff = None
+        for path, size, mtime in files:
+            if usage <= target:
+                break
+            try:
+                os.unlink(path)
+                usage -= size
+            except FileNotFoundError:
+                pass
+            cutoff = mtime
+        if cutoff is not None:
+            self._prune_entries(cutoff)
+        return usage
+
+    def _prune_entries(self, cutoff: float) -> None:
+        """
+        Remove entries without blocks — ``meta.json``, the entry directory
+        and an emptied prefix directory — unless the metadata was used
+        after *cutoff* (the newest evicted block) and is worth keeping.
+        """
+        for prefix in (p for p in self.root.iterdir() if p.is_dir()):
+            for entry in (e for e in prefix.iterdir() if e.is_dir()):
+                names = os.listdir(entry)
+                if any(name.endswith((".blk", ".tmp")) for name in names):
+                    continue                            # still cached, or being written
+                meta = entry / "meta.json"
+                try:
+                    if meta.stat().st_mtime > cutoff:
+                        continue
+                    meta.unlink()
+                except FileNotFoundError:
+                    pass
+                try:
+                    entry.rmdir()
+                except OSError:
+                    pass
+            try:
+                prefix.rmdir()
+            except OSError:
+                pass                                    # other entries share the prefix
+
+    async def evict(self) -> None:
+        """
+        Delete least-recently-used blocks until under the low-water mark,
+        then the entries they leave empty.
+        """
+        global _evicting
+        if _evicting:                                   # another request is already on it
+            return
+        _evicting = True
+        try:
+            _disk_usage[str(self.root)] = await asyncio.to_thread(self._evict_sync)
+        finally:
+            _evicting = False
+
+    # ------------------------------------------------------------------
+    # Coalescing
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    async def _coalesced(key, factory):
+        """Run ``factory()`` once per *key* at a time; concurrent callers await it."""
+        future = _inflight.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+        future = asyncio.ensure_future(factory())
+        _inflight[key] = future
+        try:
+            return await asyncio.shield(future)
+        finally:
+            if future.done():
+                _inflight.pop(key, None)
+            else:
+                future.add_done_callback(lambda _: _inflight.pop(key, None))
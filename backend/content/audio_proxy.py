@@ -0,0 +1,126 @@
+"""
+content.audio_proxy
+~~~~~~~~~~~~~~~~~~~
+Streaming proxy for externally hosted episode audio.
+
+The old proxy downloaded the whole upstream file (``requests.get(...,
+stream=False)``) before replying, so a 100 MB episode cost 100 MB of RAM
+per listener and the full download time before the first byte.  This one
+is ASGI-native (run under Daphne):
+
+* one pooled ``httpx.AsyncClient`` per event loop, so connections to the
+  usual CDNs stay warm across listeners;
+* ``Range`` / ``If-Range`` are forwarded and the upstream status
+  (200 / 206 / 416) and range headers are passed back, so seeking works;
+* a stream holds its upstream connection until the listener stops, so the
+  pool has no connection cap unless ``AUDIO_PROXY_MAX_CONNECTIONS`` sets
+  one; a listener who cannot get a connection within
+  ``AUDIO_PROXY_POOL_TIMEOUT`` gets a 503 instead of a late 502;
+* the body is relayed ``AUDIO_PROXY_CHUNK_SIZE`` bytes at a time.  The ASGI
+  server awaits each send, so a slow player pauses the upstream read
+  (backpressure) and memory per stream stays bounded by one chunk.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from typing import AsyncIterator
+
+import httpx
+from django.conf import settings
+from django.http import HttpResponse, StreamingHttpResponse
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE: int = getattr(settings, "AUDIO_PROXY_CHUNK_SIZE", 64 * 1024)
+
+# Request headers passed upstream, and upstream headers passed back.
+FORWARD_REQUEST_HEADERS = ("Range", "If-Range")
+FORWARD_RESPONSE_HEADERS = (
+    "Content-Length", "Content-Range", "Content-Encoding", "Accept-Ranges",
+    "ETag", "Last-Modified",
+)
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _build_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        follow_redirects=True,          # enclosure URLs usually bounce through trackers
+        timeout=httpx.Timeout(
+            getattr(settings, "AUDIO_PROXY_READ_TIMEOUT", 20.0),
+            connect=getattr(settings, "AUDIO_PROXY_CONNECT_TIMEOUT", 5.0),
+            pool=getattr(settings, "AUDIO_PROXY_POOL_TIMEOUT", 1.0),
+        ),
+        limits=httpx.Limits(
+            max_connections=getattr(settings, "AUDIO_PROXY_MAX_CONNECTIONS", None),
+            max_keepalive_connections=getattr(settings, "AUDIO_PROXY_MAX_KEEPALIVE", 20),
+        ),
+        headers={"User-Agent": "PodVault/1.0 (audio proxy)"},
+    )
+
+
+def get_client() -> httpx.AsyncClient:
+    """Pooled client for the running event loop (clients cannot cross loops)."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = _clients[loop] = _build_client()
+    return client
+
+
+async def _relay(upstream: httpx.Response) -> AsyncIterator[bytes]:
+    """Yield the upstream body chunk by chunk, closing it however the stream ends."""
+    try:
+        async for chunk in upstream.aiter_raw(CHUNK_SIZE):
+            yield chunk
+    except httpx.HTTPError as exc:
+        # Headers are already sent; all we can do is cut the stream short.
+        logger.warning("[AudioProxy] Upstream stream broke for %s: %s", upstream.url, exc)
+    finally:
+        await upstream.aclose()
+
+
+async def proxy_audio(request, url: str):
+    """
+    Open *url* upstream and return a response that streams it through.
+
+    Only the status line and headers are awaited here; the body is pulled
+    as the client consumes it.
+    """
+    headers = {
+        name: request.headers[name]
+        for name in FORWARD_REQUEST_HEADERS
+        if name in request.headers
+    }
+    client = get_client()
+    try:
+        upstream = await client.send(client.build_request("GET", url, headers=headers), stream=True)
+    except httpx.PoolTimeout:
+        logger.warning("[AudioProxy] Connection pool full — shedding stream of %s", url)
+        response = HttpResponse("Audio proxy busy", status=503)
+        response["Retry-After"] = "5"
+        return response
+    except httpx.HTTPError as exc:
+        logger.warning("[AudioProxy] Upstream request failed for %s: %s", url, exc)
+        return HttpResponse("Error fetching audio", status=502)
+
+    if upstream.status_code >= 400 and upstream.status_code != 416:
+        await upstream.aclose()
+        logger.warning("[AudioProxy] Upstream returned %s for %s", upstream.status_code, url)
+        return HttpResponse("Error fetching audio", status=502)
+
+    response = StreamingHttpResponse(
+        _relay(upstream),
+        status=upstream.status_code,
+        content_type=upstream.headers.get("Content-Type", "audio/mpeg"),
+    )
+    for name in FORWARD_RESPONSE_HEADERS:
+        if name in upstream.headers:
+            response[name] = upstream.headers[name]
+    response["Access-Control-Allow-Origin"] = "*"
+    return response
@@ -0,0 +1,93 @@
+"""
+content.conditional
+~~~~~~~~~~~~~~~~~~~
+Conditional GET (``ETag`` / ``Last-Modified``) for the catalog viewsets.
+
+Podcast, Episode and Category carry an ``updated_at`` column (``auto_now``,
+indexed).  Writes that change what a podcast renders — its episodes, its
+category — bump the podcast's ``updated_at`` too (see
+:mod:`content.signals`), so one column is enough to validate a response.
+
+* detail: the version is a single primary-key lookup of ``updated_at``;
+* list: the catalog generation of :mod:`content.generation`, which every
+  Podcast / Episode / Category write (deletes and bulk ingest included)
+  moves forward.  It costs one cache read and no query, so keyset pages
+  stay free of ``COUNT`` and full scans.  Any catalog write invalidates
+  every list validator; when the cache is unreachable lists are served
+  without validators rather than with a stale one.
+
+The ETag is strong and also covers the full path and ``Accept`` header, so
+``?fields=``, pagination and format variants never share a validator.  A
+matching ``If-None-Match`` / ``If-Modified-Since`` is answered with 304
+before anything is fetched or serialized.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Optional
+
+from django.core.exceptions import ValidationError
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from .generation import catalog_version
+
+
+class ConditionalGetMixin:
+    """ViewSet mixin adding validators and 304 handling to ``list`` / ``retrieve``."""
+
+    version_field = 'updated_at'
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        model = self.get_queryset().model
+        try:
+            version = (
+                model._default_manager
+                .filter(**{self.lookup_field: kwargs[lookup_url_kwarg]})
+                .values_list(self.version_field, flat=True)
+                .first()
+            )
+        except (ValueError, ValidationError):
+            version = None
+        if version is None:
+            # Unknown or malformed key: let the normal path produce the 404.
+            return super().retrieve(request, *args, **kwargs)
+        return self.conditional_response(
+            request, f'{kwargs[lookup_url_kwarg]}:{version.isoformat()}', version,
+            lambda: super(ConditionalGetMixin, self).retrieve(request, *args, **kwargs),
+        )
+
+    def list(self, request, *args, **kwargs):
+        if not self.list_is_cacheable(request):
+            return super().list(request, *args, **kwargs)
+        version = catalog_version()
+        if version is None:
+            return super().list(request, *args, **kwargs)
+        generation, modified = version
+        return self.conditional_response(
+            request, f"catalog:{generation}", modified,
+            lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs),
+        )
+
+    def list_is_cacheable(self, request) -> bool:
+        # Trending order comes from Redis, not from rows, so it has no row version.
+        return request.query_params.get('ordering') != 'trending'
+
+    @staticmethod
+    def conditional_response(request, version: str, last_modified: Optional[object], render):
+        """Return 304 when the client's validators match, else ``render()`` with validators set."""
+        variant = f"{version}|{request.get_full_path()}|{request.headers.get('Accept', '')}"
+        etag = quote_etag(hashlib.sha1(variant.encode()).hexdigest())
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is None:
+            response = render()
+            if response.status_code != 200:
+                return response
+        response['ETag'] = etag
+        if timestamp is not None:
+            response['Last-Modified'] = http_date(timestamp)
+        return response
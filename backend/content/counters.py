@@ -0,0 +1,91 @@
+"""
+content.counters
+~~~~~~~~~~~~~~~~
+Denormalized engagement counters.
+
+* ``Podcast.subscriber_count`` — number of ``Follow`` rows;
+* ``Episode.like_count``       — number of ``Like`` rows;
+* ``Episode.comment_count``    — number of comment ``UserActivity`` rows.
+
+The signal handlers in :mod:`content.signals` adjust them with a single
+``UPDATE ... SET n = n ± 1`` inside the writer's transaction, so concurrent
+likes never lose an increment and a rolled-back follow never leaves a
+stale count.  Cards and detail responses then read plain columns instead
+of running a ``COUNT`` per row.  Every adjustment also bumps the catalog
+generation (:mod:`content.generation`), which list validators are built on.
+
+``reconcile_counters()`` (``manage.py reconcile_counters``) recomputes all
+three in bulk from the source tables, for drift after raw SQL or bulk
+deletes that bypass signals.
+"""
+
+from __future__ import annotations
+
+from typing import Dict
+
+from django.db import transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from users.models import UserActivity
+
+from . import generation
+from .models import Episode, Follow, Like, Podcast
+
+
+def adjust_subscriber_count(podcast_id, delta: int) -> None:
+    """Add ``delta`` to a podcast's follower count (never below zero)."""
+    if podcast_id is None:
+        return
+    Podcast.objects.filter(pk=podcast_id).update(
+        subscriber_count=Greatest(F('subscriber_count') + delta, Value(0)),
+        updated_at=timezone.now(),
+    )
+    generation.bump_generation()
+
+
+def adjust_episode_counter(episode_id, field: str, delta: int) -> None:
+    """Add ``delta`` to ``like_count`` or ``comment_count`` of one episode."""
+    if episode_id is None:
+        return
+    now = timezone.now()
+    Episode.objects.filter(pk=episode_id).update(
+        **{field: Greatest(F(field) + delta, Value(0))}, updated_at=now,
+    )
+    # Podcast responses embed their episodes' counts.
+    Podcast.objects.filter(episodes__pk=episode_id).update(updated_at=now)
+    generation.bump_generation()
+
+
+def _count_of(queryset, column: str) -> Coalesce:
+    """Correlated ``COUNT(*)`` of ``queryset`` rows whose ``column`` is the outer pk."""
+    counts = (
+        queryset.filter(**{column: OuterRef('pk')})
+        .order_by().values(column).annotate(n=Count('pk')).values('n')
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+
+def reconcile_counters() -> Dict[str, int]:
+    """
+    Recompute every counter from its source table.
+
+    One ``UPDATE`` per counter, touching only rows whose stored value is
+    wrong.  Returns the number of rows corrected per counter.
+    """
+    targets = (
+        ('subscriber_count', Podcast, _count_of(Follow.objects.all(), 'podcast')),
+        ('like_count', Episode, _count_of(Like.objects.all(), 'episode')),
+        ('comment_count', Episode,
+         _count_of(UserActivity.objects.filter(activity_type='comment'), 'episode')),
+    )
+    fixed = {}
+    with transaction.atomic():
+        for field, model, expected in targets:
+            stale = model.objects.annotate(expected=expected).exclude(**{field: F('expected')})
+            fixed[field] = model.objects.filter(pk__in=stale.values('pk')).update(
+                **{field: expected}, updated_at=timezone.now(),
+            )
+        generation.bump_generation()
+    return fixed
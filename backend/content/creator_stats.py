@@ -0,0 +1,149 @@
+"""
+content.creator_stats
+~~~~~~~~~~~~~~~~~~~~~
+Maintenance of the :class:`~content.models.CreatorStats` read model.
+
+``CreatorViewSet`` used to list ``User`` rows joined to their podcasts
+with ``DISTINCT`` and had no numbers to show.  It now reads one
+``CreatorStats`` row per creator, so listing, ordering and search are a
+single query on that table.
+
+Rows are kept current incrementally:
+
+* podcast created / deleted        → ``podcast_count ± 1`` (a creator's
+  first podcast, or a change of creator, recomputes the affected rows);
+* episode created / deleted        → ``episode_count ± 1`` (and its plays);
+* follow created / deleted         → ``follower_count ± 1``;
+* tip created / deleted            → ``tips_received ± amount``;
+* subscription saved / deleted     → ``active_subscriptions`` recounted;
+* play-count flush                 → ``total_plays + n`` per creator.
+
+Each adjustment is one ``UPDATE ... SET f = f + n`` whose creator is
+resolved by a subquery, so no row is read first.  Migration
+``0014_creatorstats`` seeds the table; ``refresh()`` (``manage.py
+rebuild_creator_stats``) recomputes rows from the source tables after
+drift.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from decimal import Decimal
+from typing import Dict, Iterable, Optional
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import (
+    Case, Count, DecimalField, F, IntegerField, OuterRef, Subquery, Sum, Value, When,
+)
+from django.db.models.functions import Coalesce
+
+from .models import CreatorStats, CreatorSubscription, Episode, Follow, Podcast, Tip
+
+STAT_FIELDS = (
+    'podcast_count', 'episode_count', 'total_plays', 'follower_count',
+    'tips_received', 'active_subscriptions',
+)
+
+
+def adjust(creator, **deltas) -> int:
+    """
+    Add *deltas* to one creator's row.
+
+    *creator* is a user id or an expression yielding one (see
+    :func:`creator_of_podcast`).  Returns the number of rows updated.
+    """
+    deltas = {field: delta for field, delta in deltas.items() if delta}
+    if creator is None or not deltas:
+        return 0
+    return CreatorStats.objects.filter(user_id=creator).update(
+        **{field: F(field) + delta for field, delta in deltas.items()}
+    )
+
+
+def creator_of_podcast(podcast_id) -> Subquery:
+    return Subquery(Podcast.objects.filter(pk=podcast_id).values('creator_id')[:1])
+
+
+def add_plays(deltas: Dict[str, int]) -> None:
+    """
+    Credit flushed per-episode play deltas to the episodes' creators.
+
+    One ``UPDATE``: each creator's increment is a correlated ``SUM`` over
+    the batch's episodes, with the delta picked by a ``CASE`` that has one
+    branch per distinct delta value.
+    """
+    by_delta = defaultdict(list)
+    for episode_id, delta in deltas.items():
+        if delta:
+            by_delta[delta].append(episode_id)
+    if not by_delta:
+        return
+    ids = [episode_id for episode_ids in by_delta.values() for episode_id in episode_ids]
+    plays = Case(
+        *[When(pk__in=episode_ids, then=Value(delta)) for delta, episode_ids in by_delta.items()],
+        default=Value(0), output_field=IntegerField(),
+    )
+    batch = Episode.objects.filter(pk__in=ids)
+    per_creator = (
+        batch.filter(podcast__creator=OuterRef('user_id'))
+        .order_by().values('podcast__creator').annotate(n=Sum(plays)).values('n')
+    )
+    CreatorStats.objects.filter(user_id__in=batch.values('podcast__creator_id')).update(
+        total_plays=F('total_plays') + Subquery(per_creator, output_field=IntegerField())
+    )
+
+
+def recount_subscriptions(creator_id) -> None:
+    if creator_id is None:
+        return
+    active = CreatorSubscription.objects.filter(creator_id=creator_id, active=True).count()
+    CreatorStats.objects.filter(user_id=creator_id).update(active_subscriptions=active)
+
+
+def _per_user(queryset, user_lookup: str, aggregate, output_field):
+    """Correlated subquery aggregating *queryset* per outer user."""
+    values = (
+        queryset.filter(**{user_lookup: OuterRef('pk')})
+        .order_by().values(user_lookup).annotate(v=aggregate).values('v')
+    )
+    zero = Decimal('0') if isinstance(output_field, DecimalField) else 0
+    return Coalesce(Subquery(values, output_field=output_field), Value(zero), output_field=output_field)
+
+
+def refresh(user_ids: Optional[Iterable] = None) -> int:
+    """
+    Recompute stats rows from the source tables.
+
+    With *user_ids*, only those users; otherwise every creator, dropping
+    rows for users who no longer own a podcast.  Returns rows written.
+    """
+    integer, money = IntegerField(), DecimalField(max_digits=12, decimal_places=2)
+    creators = Podcast.objects.filter(creator__isnull=False).values('creator_id')
+    users = get_user_model().objects.all()
+    users = users.filter(pk__in=list(user_ids)) if user_ids is not None else users.filter(pk__in=creators)
+
+    # Aliased: some stat names are also reverse relations on User
+    # (``Tip.recipient`` is ``related_name='tips_received'``).
+    rows = users.annotate(
+        stat_podcast_count=_per_user(Podcast.objects.all(), 'creator', Count('pk'), integer),
+        stat_episode_count=_per_user(Episode.objects.all(), 'podcast__creator', Count('pk'), integer),
+        stat_total_plays=_per_user(Episode.objects.all(), 'podcast__creator', Sum('plays'), integer),
+        stat_follower_count=_per_user(Follow.objects.all(), 'podcast__creator', Count('pk'), integer),
+        stat_tips_received=_per_user(Tip.objects.all(), 'recipient', Sum('amount'), money),
+        stat_active_subscriptions=_per_user(
+            CreatorSubscription.objects.filter(active=True), 'creator', Count('pk'), integer),
+    ).values('pk', 'username', *(f'stat_{f}' for f in STAT_FIELDS))
+
+    stats = [
+        CreatorStats(user_id=row['pk'], username=row['username'], **{f: row[f'stat_{f}'] for f in STAT_FIELDS})
+        for row in rows
+    ]
+    with transaction.atomic():
+        CreatorStats.objects.bulk_create(
+            stats, update_conflicts=True, unique_fields=['user'],
+            update_fields=['username', *STAT_FIELDS, 'updated_at'],
+        )
+        if user_ids is None:
+            CreatorStats.objects.exclude(user_id__in=creators).delete()
+    return len(stats)
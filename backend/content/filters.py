@@ -0,0 +1,58 @@
+from django.db.models import Case, IntegerField, When
+from rest_framework import filters
+from rest_framework.pagination import LimitOffsetPagination
+from .search import get_search_backend
+from .trending import TrendingEngine
+
+
+class TrendingOrderingFilter(filters.OrderingFilter):
+    """
+    OrderingFilter that also understands ``?ordering=trending``.
+
+    The ranked IDs come from the Redis sorted sets maintained by
+    :class:`content.trending.TrendingEngine`, so only the window needed for
+    the requested page is read.  Views declare which ranking to use with
+    ``trending_kind`` ('episodes' or 'podcasts') and the DB ordering to fall
+    back on when Redis has no ranking with ``trending_fallback``.
+    """
+    trending_value = 'trending'
+
+    def filter_queryset(self, request, queryset, view):
+        if request.query_params.get(self.ordering_param) != self.trending_value:
+            return super().filter_queryset(request, queryset, view)
+
+        category = (request.query_params.get('category') or '').lower() or None
+        ids = TrendingEngine().top_ids(view.trending_kind, category, 0, self._window_stop(request, view))
+        if not ids:
+            return queryset.order_by(*view.trending_fallback)
+
+        rank = Case(*[When(pk=pk, then=pos) for pos, pk in enumerate(ids)], output_field=IntegerField())
+        return queryset.filter(pk__in=ids).annotate(trending_rank=rank).order_by('trending_rank')
+
+    def _window_stop(self, request, view):
+        """
+        Last rank needed for the current page, plus one so the paginator
+        can still tell there is a next page.
+        """
+        paginator = getattr(view, 'paginator', None)
+        if isinstance(paginator, LimitOffsetPagination):
+            limit = paginator.get_limit(request) or TrendingEngine.MAX_ENTRIES
+            return paginator.get_offset(request) + limit
+        return TrendingEngine.MAX_ENTRIES - 1
+
+
+class FullTextSearchFilter(filters.BaseFilterBackend):
+    """
+    ``?search=`` backed by the full-text index in :mod:`content.search`.
+
+    Results come back in relevance order unless the client asked for an
+    explicit ``?ordering=``, so list it after the ordering filter.
+    """
+    search_param = 'search'
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, '').strip()
+        if not query:
+            return queryset
+        explicit_ordering = bool(request.query_params.get('ordering'))
+        return get_search_backend().filter(queryset, query, order=not explicit_ordering)
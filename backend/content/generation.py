@@ -0,0 +1,75 @@
+"""
+content.generation
+~~~~~~~~~~~~~~~~~~
+Catalog generation: a single counter that moves forward on every Podcast,
+Episode or Category write.
+
+Keys::
+
+    podvault:catalog:generation     ← integer, INCR on writes
+    podvault:catalog:modified       ← time of the last INCR
+
+Writers (the catalog signals and the bulk ingest paths, which skip
+``post_save``) call :func:`bump_generation`; readers compare generations
+instead of scanning tables.  :class:`content.conditional.ConditionalGetMixin`
+builds its list validators from :func:`catalog_version`, so revalidating a
+list costs one cache read and no query.  If the counter itself is evicted
+it restarts from the current time in milliseconds, which is always past
+any generation handed out before.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+
+from django.core.cache import cache
+from django.db import transaction
+
+GENERATION_KEY = "catalog:generation"
+MODIFIED_KEY = "catalog:modified"
+
+
+def current_generation() -> int:
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        cache.add(GENERATION_KEY, int(time.time() * 1000), timeout=None)
+        generation = cache.get(GENERATION_KEY, 0)
+    return generation
+
+
+def catalog_version() -> Optional[Tuple[int, Optional[datetime]]]:
+    """
+    ``(generation, last catalog write)``, or ``None`` when the cache cannot
+    be reached and no version can be vouched for.
+    """
+    state = cache.get_many([GENERATION_KEY, MODIFIED_KEY])
+    if GENERATION_KEY not in state:
+        cache.add(GENERATION_KEY, int(time.time() * 1000), timeout=None)
+        state = cache.get_many([GENERATION_KEY, MODIFIED_KEY])
+        if GENERATION_KEY not in state:
+            return None
+    modified = state.get(MODIFIED_KEY)
+    return state[GENERATION_KEY], datetime.fromtimestamp(modified, tz=timezone.utc) if modified else None
+
+
+def bump_generation() -> None:
+    """
+    Move every reader to a new catalog generation.
+
+    Bumped now and again on commit: anything derived from the catalog while
+    the write was still uncommitted holds the old rows under the
+    intermediate generation.
+    """
+    _incr_generation()
+    transaction.on_commit(_incr_generation)
+
+
+def _incr_generation() -> None:
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        # Counter evicted: restart above anything handed out before.
+        cache.add(GENERATION_KEY, int(time.time() * 1000), timeout=None)
+    cache.set(MODIFIED_KEY, time.time(), timeout=None)
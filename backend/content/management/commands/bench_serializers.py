@@ -0,0 +1,55 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from content.models import Episode, Podcast
+from content.serializers import EpisodeSerializer, PodcastCardSerializer
+from podvault_api.fastjson import FastJSONRenderer, ValuesSerializer
+
+
+class Command(BaseCommand):
+    help = 'Compares DRF serialization with the values()/orjson fast path on list pages.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1000, help='Rows per page.')
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per path; the best is reported.')
+
+    def handle(self, *args, **options):
+        rows, repeat = options['rows'], options['repeat']
+        # Seed rows inside a transaction that is always rolled back.
+        with transaction.atomic():
+            podcast = Podcast.objects.create(title='bench')
+            Episode.objects.bulk_create(
+                Episode(podcast=podcast, title=f'Episode {n}', description='lorem ipsum ' * 20, duration=n)
+                for n in range(rows)
+            )
+            Podcast.objects.bulk_create(Podcast(title=f'Podcast {n}') for n in range(rows))
+
+            episodes = Episode.objects.prefetch_related('cast').order_by('-published_at', '-id')[:rows]
+            cards = Podcast.objects.select_related('creator', 'category').order_by('-created_at')[:rows]
+            omit = EpisodeSerializer.heavy_fields
+            self.compare('episodes', repeat,
+                         lambda: JSONRenderer().render(EpisodeSerializer(episodes, many=True, omit=omit).data),
+                         lambda: FastJSONRenderer().render(ValuesSerializer(EpisodeSerializer(omit=omit)).serialize(episodes)))
+            self.compare('podcast cards', repeat,
+                         lambda: JSONRenderer().render(PodcastCardSerializer(cards, many=True).data),
+                         lambda: FastJSONRenderer().render(ValuesSerializer(PodcastCardSerializer()).serialize(cards)))
+            transaction.set_rollback(True)
+
+    def compare(self, label, repeat, drf, fast):
+        if drf() != fast():
+            self.stderr.write(self.style.WARNING(f"{label}: outputs differ"))
+        slow_ms, fast_ms = self.best(drf, repeat), self.best(fast, repeat)
+        self.stdout.write(
+            f"{label:<14} DRF {slow_ms:8.1f} ms   fast {fast_ms:8.1f} ms   {slow_ms / fast_ms:5.1f}x")
+
+    @staticmethod
+    def best(fn, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            timings.append((time.perf_counter() - start) * 1000)
+        return min(timings)
@@ -0,0 +1,44 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from content.models import Episode, Podcast
+from podvault_api.ids import uuid7
+
+
+class Command(BaseCommand):
+    help = 'Compares bulk insert and primary-key range-scan throughput for uuid4 vs uuid7 episode keys.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=20000, help='Episodes inserted per run.')
+        parser.add_argument('--batch', type=int, default=500, help='bulk_create batch size (ingest uses one batch per feed).')
+
+    def handle(self, *args, **options):
+        for label, make_id in (('uuid4', uuid.uuid4), ('uuid7', uuid7)):
+            insert_rate, scan_rate = self.run(make_id, options['rows'], options['batch'])
+            self.stdout.write(f"{label}  insert {insert_rate:10,.0f} rows/s   pk range scan {scan_rate:10,.0f} rows/s")
+
+    def run(self, make_id, rows, batch):
+        # Everything happens in a transaction that is rolled back.
+        with transaction.atomic():
+            podcast = Podcast.objects.create(title='bench')
+            start = time.perf_counter()
+            for offset in range(0, rows, batch):
+                Episode.objects.bulk_create(
+                    Episode(id=make_id(), podcast=podcast, title=f'Episode {n}', remote_id=f'bench-{n}')
+                    for n in range(offset, min(offset + batch, rows))
+                )
+            insert_rate = rows / (time.perf_counter() - start)
+
+            start, scanned, last = time.perf_counter(), 0, None
+            episodes = Episode.objects.filter(podcast=podcast).order_by('id').values_list('id', flat=True)
+            while True:
+                page = list((episodes.filter(id__gt=last) if last else episodes)[:batch])
+                if not page:
+                    break
+                scanned, last = scanned + len(page), page[-1]
+            scan_rate = scanned / (time.perf_counter() - start)
+            transaction.set_rollback(True)
+        return insert_rate, scan_rate
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from content.models import Episode
+from content.transcripts import index_episode
+
+
+class Command(BaseCommand):
+    help = 'Builds transcript search segments for episodes that have a transcript but no segments yet.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help='Re-index every transcribed episode.')
+
+    def handle(self, *args, **options):
+        episodes = Episode.objects.exclude(transcript_content='')
+        if not options['all']:
+            episodes = episodes.filter(transcript_segments__isnull=True)
+
+        total = 0
+        for episode in episodes.only('id', 'duration', 'transcript_content').iterator(chunk_size=100):
+            index_episode(episode)
+            total += 1
+        self.stdout.write(self.style.SUCCESS(f"Indexed transcripts for {total} episodes."))
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from content.creator_stats import refresh
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the CreatorStats read model from podcasts, episodes, follows, tips and subscriptions.'
+
+    def handle(self, *args, **options):
+        rows = refresh()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt stats for {rows} creator(s)."))
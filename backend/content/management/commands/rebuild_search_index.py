@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from content.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = (
+        'Recreates the full-text index triggers and repopulates the index from the podcast, '
+        'episode and transcript tables (e.g. after a SQLite VACUUM or table rebuild).'
+    )
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        backend.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Search index rebuilt ({backend.vendor} backend)."))
@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+from content.models import Episode, Like, Follow
+from content.trending import TrendingEngine
+from sync.models import ListeningSession
+
+
+class Command(BaseCommand):
+    help = 'Resets the Redis trending rankings and re-seeds them from the database.'
+
+    def handle(self, *args, **options):
+        engine = TrendingEngine()
+        engine.reset()
+        self.stdout.write("Cleared existing trending rankings.")
+
+        # Play totals have no per-play timestamps; credit them at publish time
+        # so old back-catalogue plays decay instead of dominating the ranking.
+        plays = (
+            Episode.objects.filter(plays__gt=0)
+            .values_list('id', 'podcast_id', 'podcast__category__slug', 'plays', 'published_at')
+        )
+        for episode_id, podcast_id, slug, count, published_at in plays.iterator():
+            engine.record_episode_event('play', episode_id, podcast_id, slug, scale=count, at=published_at)
+
+        likes = Like.objects.values_list('episode_id', 'episode__podcast_id', 'episode__podcast__category__slug', 'created_at')
+        for episode_id, podcast_id, slug, created_at in likes.iterator():
+            engine.record_episode_event('like', episode_id, podcast_id, slug, at=created_at)
+
+        follows = Follow.objects.values_list('podcast_id', 'podcast__category__slug', 'created_at')
+        for podcast_id, slug, created_at in follows.iterator():
+            engine.record_podcast_event('follow', podcast_id, slug, at=created_at)
+
+        sessions = (
+            ListeningSession.objects.filter(episode__duration__gt=0)
+            .values_list('episode_id', 'episode__podcast_id', 'episode__podcast__category__slug',
+                         'duration_seconds', 'episode__duration', 'verified_at')
+        )
+        for episode_id, podcast_id, slug, listened, duration, verified_at in sessions.iterator():
+            completion = min(listened / duration, 1.0)
+            engine.record_episode_event('listen', episode_id, podcast_id, slug, scale=completion, at=verified_at)
+
+        self.stdout.write(self.style.SUCCESS("Trending rankings rebuilt."))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+from content.counters import reconcile_counters
+
+
+class Command(BaseCommand):
+    help = 'Recomputes follower, like and comment counters from their source tables.'
+
+    def handle(self, *args, **options):
+        for field, rows in reconcile_counters().items():
+            self.stdout.write(f"{field}: corrected {rows} row(s)")
+        self.stdout.write(self.style.SUCCESS("Engagement counters reconciled."))
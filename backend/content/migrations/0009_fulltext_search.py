@@ -0,0 +1,84 @@
+"""
+Full-text indexes for content.search.
+
+SQLite: FTS5 tables mirrored from the base tables by triggers (the FTS
+rowid tracks the base-table rowid, so updates/deletes are indexed lookups).
+Postgres: stored generated tsvector columns with GIN indexes.
+Other vendors are skipped; content.search falls back to icontains.
+
+SQLite drops these triggers whenever Django rebuilds a table, which it does
+for most AddField/AlterField operations; content.search restores them after
+every migrate (post_migrate).
+"""
+
+from django.db import migrations
+
+INDEXED_TABLES = ['content_podcast', 'content_episode']
+
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE {t}_fts USING fts5(id UNINDEXED, title, description)",
+    "INSERT INTO {t}_fts(rowid, id, title, description) SELECT rowid, id, title, description FROM {t}",
+    """CREATE TRIGGER {t}_fts_ai AFTER INSERT ON {t} BEGIN
+        INSERT INTO {t}_fts(rowid, id, title, description) VALUES (new.rowid, new.id, new.title, new.description);
+    END""",
+    """CREATE TRIGGER {t}_fts_ad AFTER DELETE ON {t} BEGIN
+        DELETE FROM {t}_fts WHERE rowid = old.rowid;
+    END""",
+    """CREATE TRIGGER {t}_fts_au AFTER UPDATE OF title, description ON {t} BEGIN
+        DELETE FROM {t}_fts WHERE rowid = old.rowid;
+        INSERT INTO {t}_fts(rowid, id, title, description) VALUES (new.rowid, new.id, new.title, new.description);
+    END""",
+]
+
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS {t}_fts_ai",
+    "DROP TRIGGER IF EXISTS {t}_fts_ad",
+    "DROP TRIGGER IF EXISTS {t}_fts_au",
+    "DROP TABLE IF EXISTS {t}_fts",
+]
+
+POSTGRES_FORWARD = [
+    """ALTER TABLE {t} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED""",
+    "CREATE INDEX {t}_search_vector_gin ON {t} USING GIN (search_vector)",
+]
+
+POSTGRES_REVERSE = [
+    "DROP INDEX IF EXISTS {t}_search_vector_gin",
+    "ALTER TABLE {t} DROP COLUMN IF EXISTS search_vector",
+]
+
+SQL = {
+    'sqlite': (SQLITE_FORWARD, SQLITE_REVERSE),
+    'postgresql': (POSTGRES_FORWARD, POSTGRES_REVERSE),
+}
+
+
+def _run(schema_editor, template_index):
+    templates = SQL.get(schema_editor.connection.vendor)
+    if not templates:
+        return
+    for table in INDEXED_TABLES:
+        for statement in templates[template_index]:
+            schema_editor.execute(statement.format(t=table), params=None)
+
+
+def create_indexes(apps, schema_editor):
+    _run(schema_editor, 0)
+
+
+def drop_indexes(apps, schema_editor):
+    _run(schema_editor, 1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0008_merchandise_playlist_tip_creatorsubscription_follow_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
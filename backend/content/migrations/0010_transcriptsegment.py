@@ -0,0 +1,94 @@
+"""
+Transcript segments and their full-text index (see content.transcripts).
+
+The index follows the same scheme as 0009_fulltext_search: an FTS5 table
+kept in sync by triggers on SQLite, a generated tsvector column with a GIN
+index on Postgres.
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+TABLE = 'content_transcriptsegment'
+
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE {t}_fts USING fts5(id UNINDEXED, text)",
+    """CREATE TRIGGER {t}_fts_ai AFTER INSERT ON {t} BEGIN
+        INSERT INTO {t}_fts(rowid, id, text) VALUES (new.rowid, new.id, new.text);
+    END""",
+    """CREATE TRIGGER {t}_fts_ad AFTER DELETE ON {t} BEGIN
+        DELETE FROM {t}_fts WHERE rowid = old.rowid;
+    END""",
+    """CREATE TRIGGER {t}_fts_au AFTER UPDATE OF text ON {t} BEGIN
+        DELETE FROM {t}_fts WHERE rowid = old.rowid;
+        INSERT INTO {t}_fts(rowid, id, text) VALUES (new.rowid, new.id, new.text);
+    END""",
+]
+
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS {t}_fts_ai",
+    "DROP TRIGGER IF EXISTS {t}_fts_ad",
+    "DROP TRIGGER IF EXISTS {t}_fts_au",
+    "DROP TABLE IF EXISTS {t}_fts",
+]
+
+POSTGRES_FORWARD = [
+    """ALTER TABLE {t} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        to_tsvector('english', coalesce(text, ''))
+    ) STORED""",
+    "CREATE INDEX {t}_search_vector_gin ON {t} USING GIN (search_vector)",
+]
+
+POSTGRES_REVERSE = [
+    "DROP INDEX IF EXISTS {t}_search_vector_gin",
+    "ALTER TABLE {t} DROP COLUMN IF EXISTS search_vector",
+]
+
+SQL = {
+    'sqlite': (SQLITE_FORWARD, SQLITE_REVERSE),
+    'postgresql': (POSTGRES_FORWARD, POSTGRES_REVERSE),
+}
+
+
+def _run(schema_editor, template_index):
+    templates = SQL.get(schema_editor.connection.vendor)
+    if not templates:
+        return
+    for statement in templates[template_index]:
+        schema_editor.execute(statement.format(t=TABLE), params=None)
+
+
+def create_index(apps, schema_editor):
+    _run(schema_editor, 0)
+
+
+def drop_index(apps, schema_editor):
+    _run(schema_editor, 1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0009_fulltext_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranscriptSegment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveIntegerField()),
+                ('start_char', models.PositiveIntegerField(help_text='Offset into Episode.transcript_content')),
+                ('end_char', models.PositiveIntegerField()),
+                ('start_seconds', models.FloatField(blank=True, help_text='Cue time, or estimated from the episode duration', null=True)),
+                ('end_seconds', models.FloatField(blank=True, null=True)),
+                ('text', models.TextField()),
+                ('episode', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='transcript_segments', to='content.episode')),
+            ],
+            options={
+                'ordering': ['episode', 'position'],
+                'unique_together': {('episode', 'position')},
+            },
+        ),
+        migrations.RunPython(create_index, drop_index),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0010_transcriptsegment'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='episode',
+            index=models.Index(fields=['-published_at', '-id'], name='episode_published_keyset'),
+        ),
+        migrations.AddIndex(
+            model_name='episode',
+            index=models.Index(fields=['podcast', '-published_at', '-id'], name='episode_podcast_keyset'),
+        ),
+    ]
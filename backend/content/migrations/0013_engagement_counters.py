@@ -0,0 +1,48 @@
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def _count_of(queryset, column):
+    counts = (
+        queryset.filter(**{column: OuterRef('pk')})
+        .order_by().values(column).annotate(n=Count('pk')).values('n')
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+
+def backfill_counters(apps, schema_editor):
+    """Seed the counters from their source tables (frozen copy of content.counters)."""
+    Podcast = apps.get_model('content', 'Podcast')
+    Episode = apps.get_model('content', 'Episode')
+    Follow = apps.get_model('content', 'Follow')
+    Like = apps.get_model('content', 'Like')
+    UserActivity = apps.get_model('users', 'UserActivity')
+
+    Podcast.objects.update(subscriber_count=_count_of(Follow.objects.all(), 'podcast'))
+    Episode.objects.update(
+        like_count=_count_of(Like.objects.all(), 'episode'),
+        comment_count=_count_of(UserActivity.objects.filter(activity_type='comment'), 'episode'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0012_updated_at'),
+        ('users', '0002_useractivity'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='episode',
+            name='like_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='episode',
+            name='comment_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
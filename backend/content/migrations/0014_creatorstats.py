@@ -0,0 +1,78 @@
+from decimal import Decimal
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, DecimalField, IntegerField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+STAT_FIELDS = (
+    'podcast_count', 'episode_count', 'total_plays', 'follower_count',
+    'tips_received', 'active_subscriptions',
+)
+
+
+def _per_user(queryset, user_lookup, aggregate, output_field):
+    values = (
+        queryset.filter(**{user_lookup: OuterRef('pk')})
+        .order_by().values(user_lookup).annotate(v=aggregate).values('v')
+    )
+    zero = Decimal('0') if isinstance(output_field, DecimalField) else 0
+    return Coalesce(Subquery(values, output_field=output_field), Value(zero), output_field=output_field)
+
+
+def backfill_creator_stats(apps, schema_editor):
+    """One row per podcast creator (frozen copy of content.creator_stats.refresh)."""
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    Podcast = apps.get_model('content', 'Podcast')
+    Episode = apps.get_model('content', 'Episode')
+    Follow = apps.get_model('content', 'Follow')
+    Tip = apps.get_model('content', 'Tip')
+    CreatorSubscription = apps.get_model('content', 'CreatorSubscription')
+    CreatorStats = apps.get_model('content', 'CreatorStats')
+
+    integer, money = IntegerField(), DecimalField(max_digits=12, decimal_places=2)
+    creators = Podcast.objects.filter(creator__isnull=False).values('creator_id')
+    rows = User.objects.filter(pk__in=creators).annotate(
+        stat_podcast_count=_per_user(Podcast.objects.all(), 'creator', Count('pk'), integer),
+        stat_episode_count=_per_user(Episode.objects.all(), 'podcast__creator', Count('pk'), integer),
+        stat_total_plays=_per_user(Episode.objects.all(), 'podcast__creator', Sum('plays'), integer),
+        stat_follower_count=_per_user(Follow.objects.all(), 'podcast__creator', Count('pk'), integer),
+        stat_tips_received=_per_user(Tip.objects.all(), 'recipient', Sum('amount'), money),
+        stat_active_subscriptions=_per_user(
+            CreatorSubscription.objects.filter(active=True), 'creator', Count('pk'), integer),
+    ).values('pk', 'username', *(f'stat_{f}' for f in STAT_FIELDS))
+
+    CreatorStats.objects.bulk_create(
+        [
+            CreatorStats(user_id=row['pk'], username=row['username'], **{f: row[f'stat_{f}'] for f in STAT_FIELDS})
+            for row in rows.iterator()
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('content', '0013_engagement_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CreatorStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='creator_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('username', models.CharField(db_index=True, max_length=150)),
+                ('podcast_count', models.IntegerField(db_index=True, default=0)),
+                ('episode_count', models.IntegerField(default=0)),
+                ('total_plays', models.BigIntegerField(db_index=True, default=0)),
+                ('follower_count', models.IntegerField(db_index=True, default=0)),
+                ('tips_received', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('active_subscriptions', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(backfill_creator_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,47 @@
+# New rows get time-ordered (UUIDv7) keys.  Existing uuid4 keys are kept:
+# both are plain UUIDs in the same column, and rewriting them would mean
+# rewriting every foreign key that points at them.
+
+from django.db import migrations, models
+
+import podvault_api.ids
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0014_creatorstats'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='podcast',
+            name='id',
+            field=models.UUIDField(default=podvault_api.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='episode',
+            name='id',
+            field=models.UUIDField(default=podvault_api.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='playlist',
+            name='id',
+            field=models.UUIDField(default=podvault_api.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='tip',
+            name='id',
+            field=models.UUIDField(default=podvault_api.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='merchandise',
+            name='id',
+            field=models.UUIDField(default=podvault_api.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='creatorsubscription',
+            name='id',
+            field=models.UUIDField(default=podvault_api.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
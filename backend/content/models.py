@@ -1,30 +1,33 @@
 from django.db import models
 from django.conf import settings
-import uuid
+from podvault_api.ids import uuid7
 
 class Category(models.Model):
     name = models.CharField(max_length=100)
     slug = models.SlugField(unique=True)
     icon = models.CharField(max_length=50, blank=True)  # simple string for icon name
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     def __str__(self):
         return self.name
 
 class Podcast(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     title = models.CharField(max_length=255)
     creator = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name='podcasts')
     description = models.TextField(blank=True)
     cover_image = models.URLField(blank=True)
     category = models.ForeignKey(Category, on_delete=models.SET_NULL, null=True, related_name='podcasts')
     tier = models.CharField(max_length=20, choices=[('free', 'Free'), ('premium', 'Premium')], default='free')
-    subscriber_count = models.IntegerField(default=0)
+    subscriber_count = models.IntegerField(default=0)  # Follow rows; see content.counters
     created_at = models.DateTimeField(auto_now_add=True)
     remote_id = models.CharField(max_length=100, unique=True, null=True, blank=True)
     custom_rss_url = models.URLField(blank=True) # Renamed from generic or just kept as is? Added for explicit RSS track
     funding_url = models.URLField(blank=True)
     value = models.JSONField(default=dict, blank=True)
     last_ingested_at = models.DateTimeField(null=True, blank=True)
+    # Response version for conditional GET; also bumped by episode/category writes.
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     @property
     def creator_name(self):
@@ -61,7 +64,7 @@ class Follow(models.Model):
 
 class Playlist(models.Model):
     """User-created playlists"""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='playlists')
     name = models.CharField(max_length=255)
     description = models.TextField(blank=True)
@@ -78,7 +81,7 @@ class Playlist(models.Model):
 
 class Tip(models.Model):
     """Supporter tips for creators"""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     sender = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, related_name='tips_sent')
     recipient = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='tips_received')
     amount = models.DecimalField(max_digits=10, decimal_places=2)
@@ -95,7 +98,7 @@ class Tip(models.Model):
 
 class Merchandise(models.Model):
     """Creator merchandise"""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     creator = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='merchandise')
     name = models.CharField(max_length=255)
     description = models.TextField(blank=True)
@@ -114,7 +117,7 @@ class Merchandise(models.Model):
 
 class CreatorSubscription(models.Model):
     """Creator subscription tiers"""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     creator = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='subscriptions')
     subscriber = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='subscribed_to')
     tier = models.CharField(max_length=50, blank=True, help_text="e.g., 'Pro', 'VIP'")
@@ -130,6 +133,24 @@ class CreatorSubscription(models.Model):
     
     def __str__(self):
         return f"{self.subscriber.username} subscribed to {self.creator.username}"
+class CreatorStats(models.Model):
+    """
+    Per-creator read model behind CreatorViewSet, kept current by
+    content.creator_stats (signals plus the play-count flush).
+    """
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, primary_key=True, related_name='creator_stats')
+    username = models.CharField(max_length=150, db_index=True)  # denormalized for ordering / search
+    podcast_count = models.IntegerField(default=0, db_index=True)
+    episode_count = models.IntegerField(default=0)
+    total_plays = models.BigIntegerField(default=0, db_index=True)
+    follower_count = models.IntegerField(default=0, db_index=True)
+    tips_received = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    active_subscriptions = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Stats for {self.username}"
+
 class Person(models.Model):
     name = models.CharField(max_length=255)
     image_url = models.URLField(null=True, blank=True)
@@ -139,7 +160,7 @@ class Person(models.Model):
         return self.name
 
 class Episode(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     podcast = models.ForeignKey(Podcast, on_delete=models.CASCADE, related_name='episodes')
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True)
@@ -159,7 +180,39 @@ class Episode(models.Model):
     transcript_content = models.TextField(blank=True, help_text="AI-generated transcript content")
     summary = models.TextField(blank=True, help_text="AI-generated concise summary")
     plays = models.IntegerField(default=0, help_text="Total number of plays")
+    # Denormalized from Like / comment UserActivity rows; see content.counters
+    like_count = models.IntegerField(default=0)
+    comment_count = models.IntegerField(default=0)
     value = models.JSONField(default=dict, blank=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        indexes = [
+            # Keyset pagination seeks (podvault_api.pagination.KeysetPagination)
+            models.Index(fields=['-published_at', '-id'], name='episode_published_keyset'),
+            models.Index(fields=['podcast', '-published_at', '-id'], name='episode_podcast_keyset'),
+        ]
 
     def __str__(self):
         return self.title
+
+class TranscriptSegment(models.Model):
+    """
+    A ~paragraph-sized slice of an episode transcript.  Segments are the
+    unit the transcript full-text index is built over; each remembers the
+    span it covers in ``Episode.transcript_content`` and in the audio.
+    """
+    episode = models.ForeignKey(Episode, on_delete=models.CASCADE, related_name='transcript_segments')
+    position = models.PositiveIntegerField()
+    start_char = models.PositiveIntegerField(help_text="Offset into Episode.transcript_content")
+    end_char = models.PositiveIntegerField()
+    start_seconds = models.FloatField(null=True, blank=True, help_text="Cue time, or estimated from the episode duration")
+    end_seconds = models.FloatField(null=True, blank=True)
+    text = models.TextField()
+
+    class Meta:
+        ordering = ['episode', 'position']
+        unique_together = ('episode', 'position')
+
+    def __str__(self):
+        return f"{self.episode_id} #{self.position}"
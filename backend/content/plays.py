@@ -0,0 +1,163 @@
+"""
+content.plays
+~~~~~~~~~~~~~
+Buffered play counting.
+
+``record_play`` used to do ``episode.plays += 1; episode.save()`` — a
+read-modify-write that loses increments under concurrency and rewrites the
+whole row per play.  Plays now land in a Redis hash with ``HINCRBY``::
+
+    podvault:plays:pending       ← HASH episode_id → plays not yet in the DB
+    podvault:plays:flush_lease   ← token of the flush currently running
+
+:meth:`PlayCounter.flush` (beat task ``content.tasks.flush_play_counts``)
+takes a lease (``SET NX PX``) so flushes never overlap, reads *and*
+clears the pending hash in one Lua script, and applies the deltas with
+one ``UPDATE … SET plays = plays + n`` per distinct *n*, so the DB write
+rate follows the number of distinct episodes played, not the number of
+plays.
+
+A batch leaves Redis before it is applied, so it can never be applied
+twice.  If the DB transaction fails the deltas are added back to the
+pending hash; only a flush killed between the two steps loses its batch.
+When Redis is unavailable the counter degrades to a single atomic ``F()``
+update per play.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from collections import defaultdict
+from typing import Dict
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+
+from podvault_api.redis_client import get_connection
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "podvault:plays"
+PENDING_KEY = f"{_KEY_PREFIX}:pending"
+LEASE_KEY = f"{_KEY_PREFIX}:flush_lease"
+
+# Longest a flush may hold the lease if it dies without releasing it.
+_LEASE_MS: int = getattr(settings, "PLAY_FLUSH_LEASE_MS", 60_000)
+
+# KEYS[1] = pending hash.  Returns its flat field/value list and deletes it.
+_TAKE_SCRIPT = """
+local raw = redis.call('HGETALL', KEYS[1])
+redis.call('DEL', KEYS[1])
+return raw
+"""
+
+# KEYS[1] = lease; ARGV[1] = token.  Deletes the lease only if still ours.
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class PlayCounter:
+    """Atomic play increments buffered in Redis and flushed in bulk."""
+
+    def incr(self, episode_id, stored_plays: int = 0) -> int:
+        """
+        Count one play and return the approximate total
+        (*stored_plays* from the DB row plus the buffered delta).
+        """
+        conn = get_connection()
+        if conn is not None:
+            try:
+                return stored_plays + int(conn.hincrby(PENDING_KEY, str(episode_id), 1))
+            except Exception as exc:                                # noqa: BLE001
+                logger.warning("[Plays] Buffer write failed, writing through: %s", exc)
+
+        from content import creator_stats
+        from content.models import Episode
+        Episode.objects.filter(pk=episode_id).update(plays=F("plays") + 1)
+        creator_stats.add_plays({str(episode_id): 1})
+        return stored_plays + 1
+
+    def pending(self, episode_id) -> int:
+        """Plays recorded for *episode_id* but not yet flushed."""
+        conn = get_connection()
+        if conn is None:
+            return 0
+        try:
+            return int(conn.hget(PENDING_KEY, str(episode_id)) or 0)
+        except Exception as exc:                                    # noqa: BLE001
+            logger.warning("[Plays] Buffer read failed: %s", exc)
+            return 0
+
+    def flush(self) -> int:
+        """
+        Apply buffered deltas to ``Episode.plays``.
+
+        Returns 0 without touching the buffer while another flush holds
+        the lease.
+
+        :returns: Number of episodes updated.
+        """
+        conn = get_connection()
+        if conn is None:
+            return 0
+        token = uuid.uuid4().hex
+        try:
+            if not conn.set(LEASE_KEY, token, nx=True, px=_LEASE_MS):
+                logger.info("[Plays] Another flush holds the lease — skipping.")
+                return 0
+            raw = conn.eval(_TAKE_SCRIPT, 1, PENDING_KEY)
+        except Exception as exc:                                    # noqa: BLE001
+            logger.warning("[Plays] Flush could not read the buffer: %s", exc)
+            return 0
+
+        try:
+            deltas = self._decode(raw)
+            try:
+                self.apply(deltas)
+            except Exception:
+                # Nothing was committed: hand the batch to the next flush.
+                self._restore(conn, deltas)
+                raise
+            return len(deltas)
+        finally:
+            try:
+                conn.eval(_RELEASE_SCRIPT, 1, LEASE_KEY, token)
+            except Exception as exc:                                # noqa: BLE001
+                logger.warning("[Plays] Could not release the flush lease: %s", exc)
+
+    @staticmethod
+    def apply(deltas: Dict[str, int]) -> None:
+        """One ``UPDATE`` per distinct delta value, in a single transaction."""
+        from content import creator_stats
+        from content.models import Episode
+
+        by_delta = defaultdict(list)
+        for episode_id, delta in deltas.items():
+            if delta:
+                by_delta[delta].append(episode_id)
+        with transaction.atomic():
+            for delta, ids in by_delta.items():
+                Episode.objects.filter(pk__in=ids).update(plays=F("plays") + delta)
+            creator_stats.add_plays(deltas)
+
+    @staticmethod
+    def _decode(raw) -> Dict[str, int]:
+        """``HGETALL`` reply from a script (flat field/value list) → deltas."""
+        return {
+            (k.decode() if isinstance(k, bytes) else str(k)): int(v)
+            for k, v in zip(raw[::2], raw[1::2])
+        }
+
+    @staticmethod
+    def _restore(conn, deltas: Dict[str, int]) -> None:
+        try:
+            for episode_id, delta in deltas.items():
+                conn.hincrby(PENDING_KEY, episode_id, delta)
+        except Exception as exc:                                    # noqa: BLE001
+            logger.error("[Plays] Lost a batch of %d episode(s): %s", len(deltas), exc)
@@ -0,0 +1,94 @@
+"""
+content.response_cache
+~~~~~~~~~~~~~~~~~~~~~~
+Shared cache of rendered anonymous list responses for the public catalog
+(``/podcasts/``, ``/episodes/``, ``/search``).
+
+Keys combine the *catalog generation* (:mod:`content.generation`) with
+the view and a digest of the host, normalized query string and rendering
+mode (the accepted renderer and ``FAST_JSON_RENDERING``, whose two paths
+must never serve each other's bytes)::
+
+    podvault:catalog:resp:<gen>:<view>:<sha1(variant)>  ← (body, headers)
+
+Any Podcast, Episode or Category write (signals, counter updates and the
+bulk ingest paths) bumps the generation, which moves every reader to fresh
+keys with one ``INCR`` — nothing is scanned or deleted; old entries simply
+age out after ``RESPONSE_CACHE_TTL``.
+
+Entries hold the rendered bytes plus ``ETag`` / ``Last-Modified``, so a hit
+(including a 304 revalidation) touches neither the ORM nor a serializer.
+Only anonymous JSON requests are cached, and ``?ordering=trending`` is
+skipped because its order lives in Redis rather than in the catalog.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+from rest_framework.response import Response
+
+from podvault_api.fastjson import fast_json_enabled
+
+from .generation import current_generation
+
+TTL: int = getattr(settings, "RESPONSE_CACHE_TTL", 300)
+
+_CACHED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+class ResponseCacheMixin:
+    """
+    List-view mixin serving anonymous catalog lists from the response cache.
+    List it before ``ConditionalGetMixin`` so hits skip its validator lookup.
+    """
+
+    def list(self, request, *args, **kwargs):
+        self._response_cache_key = None
+        if not self.response_is_cacheable(request):
+            return super().list(request, *args, **kwargs)
+
+        key = self.response_cache_key(request)
+        entry = cache.get(key)
+        if entry is None:
+            self._response_cache_key = key
+            return super().list(request, *args, **kwargs)
+
+        content, headers = entry
+        last_modified = parse_http_date_safe(headers.get("Last-Modified", ""))
+        response = get_conditional_response(request, etag=headers.get("ETag"), last_modified=last_modified)
+        if response is None:
+            response = HttpResponse(content, content_type=headers["Content-Type"])
+        for name in ("ETag", "Last-Modified"):
+            if name in headers:
+                response[name] = headers[name]
+        return response
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        key = getattr(self, "_response_cache_key", None)
+        if key and isinstance(response, Response) and response.status_code == 200:
+            response.render()
+            headers = {name: response[name] for name in _CACHED_HEADERS if name in response}
+            cache.set(key, (response.content, headers), timeout=TTL)
+        return response
+
+    def response_is_cacheable(self, request) -> bool:
+        if not TTL or request.method != "GET" or request.user.is_authenticated:
+            return False
+        if getattr(request, "accepted_renderer", None) is None or request.accepted_renderer.format != "json":
+            return False
+        return request.query_params.get("ordering") != "trending"
+
+    def response_cache_key(self, request) -> str:
+        # Host too: pagination links in the body are absolute URLs.
+        params = urlencode(sorted(request.query_params.lists()), doseq=True)
+        mode = f"{type(request.accepted_renderer).__name__}:{int(fast_json_enabled())}"
+        digest = hashlib.sha1(f"{request.get_host()}?{params}|{mode}".encode()).hexdigest()
+        return f"catalog:resp:{current_generation()}:{type(self).__name__}:{digest}"
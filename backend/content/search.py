@@ -0,0 +1,278 @@
+"""
+content.search
+~~~~~~~~~~~~~~
+Full-text search over podcast and episode titles/descriptions.
+
+Two database-native backends share one interface:
+
+* :class:`SQLiteFTSBackend` — FTS5 virtual tables ``<table>_fts`` ranked
+  with BM25 (podcast/episode titles weighted 10×).
+* :class:`PostgresSearchBackend` — stored, generated ``search_vector``
+  tsvector columns with GIN indexes, ranked with ``ts_rank_cd``.
+
+The indexes are created by migrations (``0009_fulltext_search`` for
+podcasts/episodes, ``0010_transcriptsegment`` for transcript segments) and
+kept in sync *by the database itself* (SQLite triggers / Postgres generated
+columns), so ``save()``, ``bulk_create`` and ``bulk_update`` during ingest
+never leave the index stale.
+
+On SQLite the triggers and the FTS rowids belong to the base table, and
+Django *rebuilds* a table (create copy → drop → rename) for most
+``AddField`` / ``AlterField`` operations: the triggers are dropped with the
+old table and the rowids are reassigned.  :func:`restore_search_index`
+runs after every ``migrate`` (``post_migrate``, see :mod:`content.apps`):
+it recreates missing triggers with ``CREATE TRIGGER IF NOT EXISTS`` and
+repopulates only the indexes whose triggers were gone, so a migrate that
+touched no indexed table costs one ``sqlite_master`` read (a no-op on
+Postgres).  ``manage.py rebuild_search_index`` recreates and repopulates
+every index by hand.  The migrations carry their own frozen copy of the
+DDL and never import this module.
+
+Usage::
+
+    from content.search import get_search_backend
+
+    queryset = get_search_backend().filter(Podcast.objects.all(), "tech news")
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connection, connections
+from django.db.models import Case, IntegerField, Q, QuerySet, When
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# insert / delete / update sync triggers on each indexed table.
+_TRIGGER_SUFFIXES = ("ai", "ad", "au")
+
+# Upper bound on ranked IDs pulled from the index per query.
+_MAX_RESULTS: int = getattr(settings, "SEARCH_MAX_RESULTS", 500)
+
+# Indexed tables → (column, BM25 weight) in FTS column order.
+INDEXED_FIELDS: Dict[str, Tuple[Tuple[str, float], ...]] = {
+    "content_podcast": (("title", 10.0), ("description", 1.0)),
+    "content_episode": (("title", 10.0), ("description", 1.0)),
+    "content_transcriptsegment": (("text", 1.0),),
+}
+
+
+def tokenize(query: str) -> List[str]:
+    """Split free text into plain word tokens (drops all query syntax)."""
+    return _TOKEN_RE.findall((query or "").lower())
+
+
+class SearchBackend:
+    """
+    Base interface.  Subclasses implement :meth:`ranked_ids`; everything
+    else (filtering, rank ordering, fallback) is shared.
+    """
+
+    #: ``connection.vendor`` this backend serves.
+    vendor = "generic"
+
+    def ranked_ids(self, model, query: str, limit: int = _MAX_RESULTS) -> Optional[List[str]]:
+        """
+        Return primary keys matching *query*, best match first.
+
+        ``None`` means the index is unavailable and callers should fall back
+        to :meth:`fallback_filter`.
+        """
+        return None
+
+    def filter(self, queryset: QuerySet, query: str, order: bool = True) -> QuerySet:
+        """
+        Restrict *queryset* to rows matching *query*.
+
+        :param order: Order by relevance.  Pass ``False`` when the caller
+                      applies an explicit ordering of its own.
+        """
+        if not tokenize(query):
+            return queryset.none()
+
+        ids = self.ranked_ids(queryset.model, query)
+        if ids is None:
+            return self.fallback_filter(queryset, query)
+        if not ids:
+            return queryset.none()
+
+        queryset = queryset.filter(pk__in=ids)
+        if not order:
+            return queryset
+        rank = Case(*[When(pk=pk, then=pos) for pos, pk in enumerate(ids)], output_field=IntegerField())
+        return queryset.annotate(search_rank=rank).order_by("search_rank")
+
+    @staticmethod
+    def fallback_filter(queryset: QuerySet, query: str) -> QuerySet:
+        """Unranked ``icontains`` scan — the pre-index behaviour."""
+        condition = Q()
+        for column, _ in INDEXED_FIELDS[queryset.model._meta.db_table]:
+            condition |= Q(**{f"{column}__icontains": query})
+        return queryset.filter(condition)
+
+    def rebuild(self, conn=None) -> None:
+        """Repopulate the index from the base tables (no-op by default)."""
+
+    def restore(self, conn=None) -> None:
+        """Recreate whatever a migration dropped from the index (no-op by default)."""
+
+
+class SQLiteFTSBackend(SearchBackend):
+    """
+    FTS5 backend.  ``id`` is stored UNINDEXED (weight 0) ahead of the
+    columns in :data:`INDEXED_FIELDS`.  Lower bm25 is better, hence
+    ``ORDER BY`` ASC.
+    """
+
+    vendor = "sqlite"
+
+    @staticmethod
+    def match_expression(query: str) -> str:
+        """
+        Build an FTS5 MATCH string: every token must appear, and the last
+        one is a prefix so search-as-you-type works.
+        """
+        tokens = [f'"{t}"' for t in tokenize(query)]
+        if tokens:
+            tokens[-1] += "*"
+        return " ".join(tokens)
+
+    def ranked_ids(self, model, query: str, limit: int = _MAX_RESULTS) -> Optional[List[str]]:
+        table = f"{model._meta.db_table}_fts"
+        weights = ", ".join(str(w) for _, w in INDEXED_FIELDS[model._meta.db_table])
+        sql = (
+            f"SELECT id FROM {table} WHERE {table} MATCH %s "
+            f"ORDER BY bm25({table}, 0.0, {weights}) LIMIT %s"
+        )
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(sql, [self.match_expression(query), limit])
+                return [row[0] for row in cursor.fetchall()]
+        except DatabaseError as exc:
+            logger.warning("[Search] FTS5 query on %s failed, falling back: %s", table, exc)
+            return None
+
+    def rebuild(self, conn=None) -> None:
+        """
+        Recreate each index's sync triggers and repopulate it from its base
+        table.  Tables not created yet (earlier migration state) are skipped.
+        """
+        conn = conn or connection
+        existing = set(conn.introspection.table_names())
+        with conn.cursor() as cursor:
+            for table in INDEXED_FIELDS:
+                if table not in existing:
+                    continue
+                statements = [f"DROP TRIGGER IF EXISTS {table}_fts_{suffix}" for suffix in _TRIGGER_SUFFIXES]
+                for statement in statements + self.create_sql(table) + self.repopulate_sql(table):
+                    cursor.execute(statement)
+
+    def restore(self, conn=None) -> None:
+        """
+        Recreate the index of every table whose triggers are missing and
+        repopulate it (the table rebuild that dropped them also reassigned
+        its rowids).  Intact indexes are left alone.
+        """
+        conn = conn or connection
+        existing = set(conn.introspection.table_names())
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+            triggers = {row[0] for row in cursor.fetchall()}
+            for table in INDEXED_FIELDS:
+                if table not in existing:
+                    continue
+                wanted = {f"{table}_fts_{suffix}" for suffix in _TRIGGER_SUFFIXES}
+                if f"{table}_fts" in existing and wanted <= triggers:
+                    continue
+                logger.info("[Search] Restoring the full-text index of %s.", table)
+                for statement in self.create_sql(table) + self.repopulate_sql(table):
+                    cursor.execute(statement)
+
+    @staticmethod
+    def create_sql(table: str) -> List[str]:
+        """Idempotent DDL for one table's FTS index and its sync triggers."""
+        fields = [column for column, _ in INDEXED_FIELDS[table]]
+        columns = ", ".join(["id"] + fields)
+        new_values = ", ".join(f"new.{column}" for column in ["id"] + fields)
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {table}_fts USING fts5(id UNINDEXED, {', '.join(fields)})",
+            f"""CREATE TRIGGER IF NOT EXISTS {table}_fts_ai AFTER INSERT ON {table} BEGIN
+                INSERT INTO {table}_fts(rowid, {columns}) VALUES (new.rowid, {new_values});
+            END""",
+            f"""CREATE TRIGGER IF NOT EXISTS {table}_fts_ad AFTER DELETE ON {table} BEGIN
+                DELETE FROM {table}_fts WHERE rowid = old.rowid;
+            END""",
+            f"""CREATE TRIGGER IF NOT EXISTS {table}_fts_au AFTER UPDATE OF {', '.join(fields)} ON {table} BEGIN
+                DELETE FROM {table}_fts WHERE rowid = old.rowid;
+                INSERT INTO {table}_fts(rowid, {columns}) VALUES (new.rowid, {new_values});
+            END""",
+        ]
+
+    @staticmethod
+    def repopulate_sql(table: str) -> List[str]:
+        """Refill one table's FTS index from the base table."""
+        columns = ", ".join(["id"] + [column for column, _ in INDEXED_FIELDS[table]])
+        return [
+            # The FTS tables store their own copy of the text (not
+            # external-content), so 'rebuild' means delete + reinsert.
+            f"DELETE FROM {table}_fts",
+            f"INSERT INTO {table}_fts(rowid, {columns}) SELECT rowid, {columns} FROM {table}",
+        ]
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    tsvector backend.  Title terms carry weight A and description terms
+    weight B in the generated ``search_vector`` column.
+    """
+
+    vendor = "postgresql"
+
+    @staticmethod
+    def tsquery(query: str) -> str:
+        """AND every token; the last one is a prefix (``:*``)."""
+        tokens = tokenize(query)
+        if tokens:
+            tokens[-1] += ":*"
+        return " & ".join(tokens)
+
+    def ranked_ids(self, model, query: str, limit: int = _MAX_RESULTS) -> Optional[List[str]]:
+        table = model._meta.db_table
+        sql = (
+            f"SELECT id FROM {table}, to_tsquery('english', %s) query "
+            f"WHERE search_vector @@ query "
+            f"ORDER BY ts_rank_cd(search_vector, query) DESC LIMIT %s"
+        )
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(sql, [self.tsquery(query), limit])
+                return [str(row[0]) for row in cursor.fetchall()]
+        except DatabaseError as exc:
+            logger.warning("[Search] tsvector query on %s failed, falling back: %s", table, exc)
+            return None
+
+
+_BACKENDS = {
+    SQLiteFTSBackend.vendor: SQLiteFTSBackend,
+    PostgresSearchBackend.vendor: PostgresSearchBackend,
+}
+
+
+def get_search_backend(conn=None) -> SearchBackend:
+    """Return the backend for the vendor of *conn* (default database)."""
+    return _BACKENDS.get((conn or connection).vendor, SearchBackend)()
+
+
+def restore_search_index(sender, using=DEFAULT_DB_ALIAS, **kwargs) -> None:
+    """
+    ``post_migrate`` receiver restoring the full-text index after migrations
+    rebuilt an indexed table (see the module docstring).
+    """
+    conn = connections[using]
+    get_search_backend(conn).restore(conn)
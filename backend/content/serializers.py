@@ -1,5 +1,9 @@
+from urllib.parse import urlencode
+
+from django.urls import reverse
 from rest_framework import serializers
-from .models import Podcast, Episode, Category, Person, Like, Follow, Playlist, Tip, Merchandise, CreatorSubscription
+from .fieldsets import SparseFieldsetSerializerMixin
+from .models import Podcast, Episode, Category, Person, Like, Follow, Playlist, Tip, Merchandise, CreatorSubscription, CreatorStats
 
 class CategorySerializer(serializers.ModelSerializer):
     class Meta:
@@ -13,13 +17,25 @@ class UserSerializer(serializers.ModelSerializer):
         model = get_user_model()
         fields = ['id', 'username', 'email'] # Enhance with profile fields later
 
+class CreatorSerializer(serializers.ModelSerializer):
+    """A creator as listed by CreatorViewSet, read from the CreatorStats row."""
+    id = serializers.ReadOnlyField(source='user_id')
+    email = serializers.ReadOnlyField(source='user.email')
+
+    class Meta:
+        model = CreatorStats
+        fields = ['id', 'username', 'email', 'podcast_count', 'episode_count', 'total_plays',
+                  'follower_count', 'tips_received', 'active_subscriptions']
+
 class PersonSerializer(serializers.ModelSerializer):
     class Meta:
         model = Person
         fields = ['id', 'name', 'image_url', 'role']
 
-class EpisodeSerializer(serializers.ModelSerializer):
+class EpisodeSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     cast = PersonSerializer(many=True, read_only=True)
+    # Left out of list responses unless asked for with ?fields=
+    heavy_fields = ('transcript_content', 'value')
 
     class Meta:
         model = Episode
@@ -27,13 +43,16 @@ class EpisodeSerializer(serializers.ModelSerializer):
             'id', 'title', 'description', 'audio_url', 'duration', 
             'episode_number', 'published_at', 'is_downloadable',
             'remote_id', 'guid', 'transcript_url', 'chapters_url', 'transcript_content', 'summary', 'value',
-            'cast'
+            'like_count', 'comment_count', 'cast'
         ]
 
-class PodcastSerializer(serializers.ModelSerializer):
+class PodcastSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     creator_name = serializers.ReadOnlyField(source='creator.username')
     category = serializers.StringRelatedField() # Or nested serializer if needed
-    episodes = EpisodeSerializer(many=True, read_only=True)
+    # Nested episodes never carry transcripts; fetch those from /episodes/<id>/
+    episodes = EpisodeSerializer(many=True, read_only=True, omit=EpisodeSerializer.heavy_fields)
+    # Column behind each non-model field, for podvault_api.fastjson.ValuesSerializer
+    values_lookups = {'category': 'category__name'}
 
     class Meta:
         model = Podcast
@@ -46,6 +65,48 @@ class PodcastSerializer(serializers.ModelSerializer):
     def get_tags(self, obj):
         return ["Trending", "New"] # Dummy implementation for now
 
+class PodcastDetailSerializer(PodcastSerializer):
+    """
+    Podcast detail: only the newest episodes are embedded (the view limits
+    the prefetch into ``latest_episodes``); ``episodes_next`` pages through
+    the rest of the list.
+    """
+    episodes = EpisodeSerializer(source='latest_episodes', many=True, read_only=True,
+                                 omit=EpisodeSerializer.heavy_fields)
+    episode_count = serializers.IntegerField(read_only=True, default=0)
+    episodes_next = serializers.SerializerMethodField()
+
+    class Meta(PodcastSerializer.Meta):
+        fields = PodcastSerializer.Meta.fields + ['episode_count', 'episodes_next']
+
+    def get_episodes_next(self, obj):
+        from podvault_api.pagination import KeysetPagination
+        from .views import EpisodeViewSet
+
+        params = {'podcast_id': obj.pk, 'cursor': ''}
+        if hasattr(obj, 'latest_episodes'):
+            window = obj.latest_episodes
+            if len(window) >= (obj.episode_count or 0):
+                return None
+            params['cursor'] = KeysetPagination.cursor_for(EpisodeViewSet.cursor_ordering, window[-1])
+        url = f"{reverse('episode-list')}?{urlencode(params)}"
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
+
+class PodcastCardSerializer(serializers.ModelSerializer):
+    """Compact podcast shape for feeds and grids — no nested episodes."""
+    creator_name = serializers.ReadOnlyField(source='creator.username')
+    category = serializers.StringRelatedField()
+    tags = serializers.SerializerMethodField()
+    values_lookups = {'category': 'category__name'}
+
+    class Meta:
+        model = Podcast
+        fields = ['id', 'title', 'creator_name', 'description', 'cover_image', 'category', 'tier', 'subscriber_count', 'tags']
+
+    def get_tags(self, obj):
+        return ["Trending", "New"] # Mirrors PodcastSerializer.get_tags
+
 class LikeSerializer(serializers.ModelSerializer):
     username = serializers.CharField(source='user.username', read_only=True)
     episode_title = serializers.CharField(source='episode.title', read_only=True)
@@ -74,7 +135,9 @@ class PlaylistSerializer(serializers.ModelSerializer):
         read_only_fields = ['user', 'created_at', 'updated_at']
     
     def get_episode_count(self, obj):
-        return obj.episodes.count()
+        # Annotated by PlaylistViewSet; falls back to a COUNT for bare instances.
+        count = getattr(obj, 'episode_count', None)
+        return count if count is not None else obj.episodes.count()
 
 class TipSerializer(serializers.ModelSerializer):
     sender_username = serializers.CharField(source='sender.username', read_only=True)
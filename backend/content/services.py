@@ -1,15 +1,19 @@
 import os
 import logging
 import uuid
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
-import requests
 from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
 from django.utils.text import slugify
 from django.utils.dateparse import parse_datetime
 
+from podvault_api import http_client
+from podvault_api.ids import uuid7
+
 from .models import Podcast, Episode, Category
+from .trending import TrendingEngine
 
 logger = logging.getLogger(__name__)
 
@@ -54,7 +58,7 @@ class AIService:
                 "max_tokens": 150,
             }
 
-            response = requests.post(
+            response = http_client.post(
                 "https://api.openai.com/v1/chat/completions",
                 headers=headers,
                 json=payload,
@@ -165,7 +169,7 @@ class NewsService:
     def fetch_from_spaceflight(self, limit: int = 15) -> List[Dict[str, Any]]:
         """Spaceflight News API v4 — public, no key required."""
         try:
-            resp = requests.get(
+            resp = http_client.get(
                 self.SPACEFLIGHT_URL,
                 params={"limit": limit, "ordering": "-published_at"},
                 timeout=self.DEFAULT_TIMEOUT,
@@ -197,7 +201,7 @@ class NewsService:
             return []
 
         try:
-            resp = requests.get(
+            resp = http_client.get(
                 self.MEDIASTACK_URL,
                 params={
                     "access_key": self.mediastack_key,
@@ -348,7 +352,7 @@ class NewsService:
 
                 episodes_to_create.append(
                     Episode(
-                        id=uuid.uuid4(),
+                        id=uuid7(),
                         podcast=podcast,
                         title=(item.get("title") or "")[:255],
                         description=item.get("description") or "",
@@ -366,6 +370,11 @@ class NewsService:
             episodes_to_create, ignore_conflicts=True
         )
         count = len(created)
+        if count:
+            # bulk_create skips post_save, so refresh the feed explicitly.
+            transaction.on_commit(FeedSnapshotService.schedule_rebuild)
+            from .generation import bump_generation
+            bump_generation()
         logger.info("[NewsService] Ingested %d new episode(s).", count)
         return count
 
@@ -378,3 +387,123 @@ class NewsService:
         if not slugs:
             return "news"
         return Counter(slugs).most_common(1)[0][0]
+
+
+# ---------------------------------------------------------------------------
+# Home Feed Snapshot
+# ---------------------------------------------------------------------------
+
+class FeedSnapshotService:
+    """
+    Pre-rendered home feed kept in Redis.
+
+    ``trending`` is read from :class:`content.trending.TrendingEngine`; the
+    beat schedule rebuilds the snapshot every few minutes so it tracks the
+    live rankings.
+
+    ``FeedView`` only ever reads the snapshot key, so serving the feed is a
+    single cache GET regardless of catalog size.  Writes to Podcast, Episode
+    or Category (see ``content.signals``) call :meth:`schedule_rebuild`,
+    which enqueues one debounced Celery rebuild per burst of changes.
+
+    Cache keys::
+
+        podvault:feed:snapshot          ← serialized feed payload
+        podvault:feed:rebuild-pending   ← debounce flag (REBUILD_DELAY s)
+    """
+
+    SNAPSHOT_KEY = "feed:snapshot"
+    PENDING_KEY = "feed:rebuild-pending"
+
+    SNAPSHOT_TTL = getattr(settings, "FEED_SNAPSHOT_TTL", 86_400)
+    SECTION_SIZE = getattr(settings, "FEED_SECTION_SIZE", 50)
+    REBUILD_DELAY = getattr(settings, "FEED_REBUILD_DELAY", 10)
+
+    # ------------------------------------------------------------------
+    # Read path
+    # ------------------------------------------------------------------
+
+    def get_snapshot(self) -> Dict[str, Any]:
+        """Return the cached feed, building it synchronously on a cold miss."""
+        snapshot = cache.get(self.SNAPSHOT_KEY)
+        if snapshot is not None:
+            return snapshot
+
+        logger.info("[FeedSnapshot] COLD MISS — building feed synchronously.")
+        return self.rebuild()
+
+    # ------------------------------------------------------------------
+    # Build
+    # ------------------------------------------------------------------
+
+    def build(self) -> Dict[str, Any]:
+        """Serialize every feed section from the database."""
+        from .serializers import CategorySerializer, PodcastCardSerializer
+
+        podcasts = Podcast.objects.select_related("creator", "category")
+        recommended = podcasts.order_by("-created_at")[: self.SECTION_SIZE]
+
+        ranked_ids = TrendingEngine().top_ids("podcasts", stop=self.SECTION_SIZE - 1)
+        if ranked_ids:
+            trending = podcasts.filter(pk__in=ranked_ids)
+            rank = {pk: pos for pos, pk in enumerate(map(uuid.UUID, ranked_ids))}
+        else:
+            trending = podcasts.order_by("-subscriber_count", "-created_at")[: self.SECTION_SIZE]
+            rank = None
+
+        return {
+            "categories": self._serialize(CategorySerializer, Category.objects.all()),
+            "trending": self._serialize(PodcastCardSerializer, trending, rank),
+            "recommended": self._serialize(PodcastCardSerializer, recommended),
+        }
+
+    @staticmethod
+    def _serialize(serializer_class, queryset, rank: Optional[Dict[uuid.UUID, int]] = None) -> List[Dict[str, Any]]:
+        """Serialize *queryset*, through the values() fast path when FAST_JSON_RENDERING is on."""
+        from podvault_api.fastjson import ValuesSerializer, fast_json_enabled
+
+        if fast_json_enabled():
+            fast = ValuesSerializer(serializer_class())
+            rows = list(fast.values(queryset))
+            if rank is not None:
+                rows.sort(key=lambda row: rank[row["id"]])
+            return fast.to_representation(rows)
+        items = list(queryset)
+        if rank is not None:
+            items.sort(key=lambda obj: rank[obj.pk])
+        return serializer_class(items, many=True).data
+
+    def rebuild(self) -> Dict[str, Any]:
+        """Build the feed and store it under :attr:`SNAPSHOT_KEY`."""
+        snapshot = self.build()
+        cache.set(self.SNAPSHOT_KEY, snapshot, timeout=self.SNAPSHOT_TTL)
+        logger.info(
+            "[FeedSnapshot] Stored snapshot (%d trending, %d recommended).",
+            len(snapshot["trending"]),
+            len(snapshot["recommended"]),
+        )
+        return snapshot
+
+    # ------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def schedule_rebuild(cls) -> None:
+        """
+        Enqueue a background rebuild, at most once per ``REBUILD_DELAY``.
+
+        ``cache.add`` only succeeds for the first caller in the window, so a
+        bulk ingest touching thousands of rows still produces one task.  If
+        Celery is unreachable the snapshot is dropped instead, and the next
+        request rebuilds it synchronously.
+        """
+        if not cache.add(cls.PENDING_KEY, True, timeout=cls.REBUILD_DELAY):
+            return
+
+        try:
+            from content.tasks import rebuild_feed_snapshot
+            rebuild_feed_snapshot.apply_async(countdown=cls.REBUILD_DELAY)
+        except Exception as exc:                                    # noqa: BLE001
+            logger.warning("[FeedSnapshot] Could not dispatch rebuild task: %s", exc)
+            cache.delete_many([cls.SNAPSHOT_KEY, cls.PENDING_KEY])
@@ -0,0 +1,153 @@
+from decimal import Decimal
+
+from django.db import transaction
+from django.conf import settings
+from django.db.models.signals import post_init, post_save, post_delete, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from users.models import UserActivity
+from .models import Podcast, Episode, Category, Like, Follow, Tip, CreatorSubscription, CreatorStats
+from .counters import adjust_episode_counter, adjust_subscriber_count
+from . import creator_stats, generation
+from .services import FeedSnapshotService
+from .trending import TrendingEngine
+
+@receiver([post_save, post_delete], sender=Podcast)
+@receiver([post_save, post_delete], sender=Episode)
+@receiver([post_save, post_delete], sender=Category)
+def refresh_feed_snapshot(sender, instance, **kwargs):
+    """
+    Schedule a feed snapshot rebuild once the surrounding transaction commits,
+    and move the catalog to a new generation.
+    """
+    transaction.on_commit(FeedSnapshotService.schedule_rebuild)
+    generation.bump_generation()
+
+@receiver([post_save, post_delete], sender=Episode)
+def touch_podcast_on_episode_change(sender, instance, **kwargs):
+    # Podcast responses embed their episodes, so the podcast's version moves too.
+    # update() skips signals, so this doesn't re-trigger the feed rebuild.
+    Podcast.objects.filter(pk=instance.podcast_id).update(updated_at=timezone.now())
+
+@receiver(post_save, sender=Category)
+def touch_podcasts_on_category_change(sender, instance, created, **kwargs):
+    if not created:
+        Podcast.objects.filter(category=instance).update(updated_at=timezone.now())
+
+@receiver(pre_delete, sender=Category)
+def touch_podcasts_on_category_delete(sender, instance, **kwargs):
+    # Before SET_NULL detaches them (that bulk update leaves updated_at alone).
+    Podcast.objects.filter(category=instance).update(updated_at=timezone.now())
+
+@receiver(post_save, sender=Like)
+def trend_on_like(sender, instance, created, **kwargs):
+    if created:
+        transaction.on_commit(lambda: TrendingEngine().record_episode(
+            'like', instance.episode_id, at=instance.created_at))
+
+@receiver(post_delete, sender=Like)
+def untrend_on_unlike(sender, instance, **kwargs):
+    # Retract at the original timestamp so exactly the decayed weight is removed.
+    transaction.on_commit(lambda: TrendingEngine().record_episode(
+        'like', instance.episode_id, scale=-1.0, at=instance.created_at))
+
+@receiver(post_save, sender=Follow)
+def trend_on_follow(sender, instance, created, **kwargs):
+    if created:
+        transaction.on_commit(lambda: TrendingEngine().record_podcast(
+            'follow', instance.podcast_id, at=instance.created_at))
+
+@receiver(post_delete, sender=Follow)
+def untrend_on_unfollow(sender, instance, **kwargs):
+    transaction.on_commit(lambda: TrendingEngine().record_podcast(
+        'follow', instance.podcast_id, scale=-1.0, at=instance.created_at))
+
+@receiver(post_save, sender=Like)
+def count_like(sender, instance, created, **kwargs):
+    if created:
+        adjust_episode_counter(instance.episode_id, 'like_count', 1)
+
+@receiver(post_delete, sender=Like)
+def uncount_like(sender, instance, **kwargs):
+    adjust_episode_counter(instance.episode_id, 'like_count', -1)
+
+@receiver(post_save, sender=Follow)
+def count_follow(sender, instance, created, **kwargs):
+    if created:
+        adjust_subscriber_count(instance.podcast_id, 1)
+
+@receiver(post_delete, sender=Follow)
+def uncount_follow(sender, instance, **kwargs):
+    adjust_subscriber_count(instance.podcast_id, -1)
+
+@receiver(post_save, sender=UserActivity)
+def count_comment(sender, instance, created, **kwargs):
+    if created and instance.activity_type == 'comment':
+        adjust_episode_counter(instance.episode_id, 'comment_count', 1)
+
+@receiver(post_delete, sender=UserActivity)
+def uncount_comment(sender, instance, **kwargs):
+    if instance.activity_type == 'comment':
+        adjust_episode_counter(instance.episode_id, 'comment_count', -1)
+
+# --- CreatorStats read model (content.creator_stats) ---
+
+@receiver(post_init, sender=Podcast)
+def remember_podcast_creator(sender, instance, **kwargs):
+    # __dict__ so a deferred creator_id is not fetched just to remember it.
+    instance._loaded_creator_id = instance.__dict__.get('creator_id')
+
+@receiver(post_save, sender=Podcast)
+def stats_on_podcast_save(sender, instance, created, **kwargs):
+    previous, current = instance._loaded_creator_id, instance.creator_id
+    instance._loaded_creator_id = current
+    if created:
+        # A creator's first podcast has no stats row yet to increment.
+        if current and not creator_stats.adjust(current, podcast_count=1):
+            creator_stats.refresh([current])
+    elif previous != current:
+        creator_stats.refresh([pk for pk in (previous, current) if pk])
+
+@receiver(post_delete, sender=Podcast)
+def stats_on_podcast_delete(sender, instance, **kwargs):
+    # Its episodes and follows were already subtracted by their own cascade signals.
+    creator_stats.adjust(instance.creator_id, podcast_count=-1)
+
+@receiver(post_save, sender=Episode)
+def stats_on_episode_create(sender, instance, created, **kwargs):
+    if created:
+        creator_stats.adjust(creator_stats.creator_of_podcast(instance.podcast_id),
+                             episode_count=1, total_plays=instance.plays)
+
+@receiver(post_delete, sender=Episode)
+def stats_on_episode_delete(sender, instance, **kwargs):
+    creator_stats.adjust(creator_stats.creator_of_podcast(instance.podcast_id),
+                         episode_count=-1, total_plays=-instance.plays)
+
+@receiver(post_save, sender=Follow)
+def stats_on_follow(sender, instance, created, **kwargs):
+    if created:
+        creator_stats.adjust(creator_stats.creator_of_podcast(instance.podcast_id), follower_count=1)
+
+@receiver(post_delete, sender=Follow)
+def stats_on_unfollow(sender, instance, **kwargs):
+    creator_stats.adjust(creator_stats.creator_of_podcast(instance.podcast_id), follower_count=-1)
+
+@receiver(post_save, sender=Tip)
+def stats_on_tip(sender, instance, created, **kwargs):
+    if created:
+        creator_stats.adjust(instance.recipient_id, tips_received=Decimal(instance.amount))
+
+@receiver(post_delete, sender=Tip)
+def stats_on_tip_delete(sender, instance, **kwargs):
+    creator_stats.adjust(instance.recipient_id, tips_received=-Decimal(instance.amount))
+
+@receiver([post_save, post_delete], sender=CreatorSubscription)
+def stats_on_subscription(sender, instance, **kwargs):
+    creator_stats.recount_subscriptions(instance.creator_id)
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def stats_on_username_change(sender, instance, update_fields=None, **kwargs):
+    if update_fields is None or 'username' in update_fields:
+        CreatorStats.objects.filter(user_id=instance.pk).exclude(username=instance.username).update(
+            username=instance.username)
@@ -0,0 +1,60 @@
+"""
+content.streaming
+~~~~~~~~~~~~~~~~~
+Signed stream tokens.
+
+``stream-token`` issues a ``TimestampSigner`` token whose payload carries
+everything the stream endpoint needs — the episode id, the stored file
+name and the external URL — so ``/stream/<pk>?token=...`` verifies the
+HMAC and picks a source without touching the database:
+
+* file in :class:`~podvault_api.storage_backends.BunnyStorage` → 302 to a
+  time-limited, token-authenticated pull-zone URL, so the CDN serves the
+  bytes instead of our workers;
+* file in local storage → served directly;
+* external enclosure → the cached streaming proxy.
+"""
+
+from __future__ import annotations
+
+from typing import Dict
+
+from django.conf import settings
+from django.core import signing
+
+SALT = "content.stream"
+MAX_AGE: int = getattr(settings, "STREAM_TOKEN_MAX_AGE", 7200)
+
+
+def issue_stream_token(episode) -> str:
+    """Sign the episode's audio location (compressed, URL-safe)."""
+    payload = {
+        "e": str(episode.pk),
+        "f": episode.audio_file.name if episode.audio_file else "",
+        "u": episode.audio_url or "",
+    }
+    return signing.TimestampSigner(salt=SALT).sign_object(payload, compress=True)
+
+
+def read_stream_token(token: str, pk) -> Dict[str, str]:
+    """
+    Verify *token* for episode *pk* and return its payload.
+
+    :raises signing.BadSignature: Tampered, expired
+                                  (:class:`~django.core.signing.SignatureExpired`)
+                                  or issued for another episode.
+    """
+    payload = signing.TimestampSigner(salt=SALT).unsign_object(token, max_age=MAX_AGE)
+    if payload.get("e") != str(pk):
+        raise signing.BadSignature("Stream token was issued for another episode.")
+    return payload
+
+
+def stream_token_response(episode) -> Dict:
+    """Body returned by the ``stream-token`` actions."""
+    token = issue_stream_token(episode)
+    return {
+        'token': token,
+        'expires_in': MAX_AGE,
+        'stream_url': f'/api/v1/content/stream/{episode.pk}?token={token}',
+    }
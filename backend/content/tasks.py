@@ -0,0 +1,72 @@
+"""
+content.tasks
+~~~~~~~~~~~~~
+Celery background tasks for the content catalog.
+
+``rebuild_feed_snapshot``
+    Re-serializes the home feed and stores it in Redis.  Dispatched
+    (debounced) by :meth:`content.services.FeedSnapshotService.schedule_rebuild`
+    whenever Podcast, Episode or Category rows change, and periodically by
+    beat so the trending section tracks the live rankings.
+
+``rebase_trending_scores``
+    Applies accumulated decay to the trending sorted sets and moves their
+    epoch forward (see :mod:`content.trending`).
+
+``flush_play_counts``
+    Applies the play counts buffered in Redis to ``Episode.plays`` in bulk
+    (see :mod:`content.plays`).
+"""
+
+from __future__ import annotations
+
+import logging
+
+from celery import shared_task
+from django.core.cache import cache
+
+from content.plays import PlayCounter
+from content.services import FeedSnapshotService
+from content.trending import TrendingEngine
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    name="content.tasks.rebuild_feed_snapshot",
+    acks_late=True,
+    ignore_result=True,
+)
+def rebuild_feed_snapshot() -> None:
+    """
+    Background task: rebuild the cached home feed.
+
+    The debounce flag is cleared *before* building so that writes landing
+    mid-build schedule another pass instead of being lost.
+    """
+    cache.delete(FeedSnapshotService.PENDING_KEY)
+    FeedSnapshotService().rebuild()
+    logger.info("[rebuild_feed_snapshot] ✓ Feed snapshot refreshed.")
+
+
+@shared_task(
+    name="content.tasks.rebase_trending_scores",
+    acks_late=True,
+    ignore_result=True,
+)
+def rebase_trending_scores() -> None:
+    """Background task: fold elapsed decay into the stored trending scores."""
+    rebased = TrendingEngine().rebase()
+    logger.info("[rebase_trending_scores] ✓ Rebased %d ranking(s).", rebased)
+
+
+@shared_task(
+    name="content.tasks.flush_play_counts",
+    acks_late=True,
+    ignore_result=True,
+)
+def flush_play_counts() -> None:
+    """Background task: write buffered play deltas to the episodes table."""
+    flushed = PlayCounter().flush()
+    if flushed:
+        logger.info("[flush_play_counts] ✓ Flushed plays for %d episode(s).", flushed)
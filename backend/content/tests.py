@@ -1,3 +1,1133 @@
-from django.test import TestCase
+"""
+content.tests
+~~~~~~~~~~~~~
+Unit tests for the content catalog.
 
-# Create your tests here.
+Caches are swapped for local memory so no Redis instance is needed.
+Run with::
+
+    python manage.py test content --verbosity=2
+"""
+
+from __future__ import annotations
+
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from content.models import Category, Episode, Podcast
+from podvault_api.testing import QueryBudgetMixin
+
+_LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+# ---------------------------------------------------------------------------
+# Home feed snapshot
+# ---------------------------------------------------------------------------
+
+@override_settings(CACHES=_LOCMEM_CACHE)
+class TestFeedSnapshot(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.category = Category.objects.create(name="Tech", slug="tech")
+        self.podcast = Podcast.objects.create(title="Vault Cast", category=self.category)
+        Episode.objects.create(podcast=self.podcast, title="Ep 1", transcript_content="x" * 1000)
+
+    def test_feed_cards_have_no_nested_episodes(self):
+        response = self.client.get("/api/feed")
+        self.assertEqual(response.status_code, 200)
+        card = response.json()["trending"][0]
+        self.assertEqual(card["title"], "Vault Cast")
+        self.assertEqual(card["category"], "Tech")
+        self.assertNotIn("episodes", card)
+
+    def test_warm_snapshot_is_served_without_queries(self):
+        from content.services import FeedSnapshotService
+        FeedSnapshotService().rebuild()
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/feed")
+        self.assertEqual(response.status_code, 200)
+
+    @patch("content.tasks.rebuild_feed_snapshot.apply_async")
+    def test_catalog_write_schedules_one_debounced_rebuild(self, mock_apply):
+        with self.captureOnCommitCallbacks(execute=True):
+            Podcast.objects.create(title="Second")
+            Podcast.objects.create(title="Third")
+        mock_apply.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# Trending rankings
+# ---------------------------------------------------------------------------
+
+@override_settings(CACHES=_LOCMEM_CACHE)
+class TestTrending(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.podcast = Podcast.objects.create(title="Vault Cast")
+        self.quiet = Episode.objects.create(podcast=self.podcast, title="Quiet", plays=1)
+        self.loud = Episode.objects.create(podcast=self.podcast, title="Loud", plays=50)
+
+    def test_decay_rate_halves_weight_after_one_half_life(self):
+        import math
+        from content.trending import decay_rate
+        self.assertAlmostEqual(math.exp(-decay_rate(3600) * 3600), 0.5)
+
+    @patch("content.filters.TrendingEngine.top_ids")
+    def test_ordering_trending_follows_redis_rank(self, mock_top_ids):
+        mock_top_ids.return_value = [str(self.quiet.pk), str(self.loud.pk)]
+        response = self.client.get("/api/episodes/", {"ordering": "trending", "limit": 10})
+        titles = [ep["title"] for ep in response.json()["results"]]
+        self.assertEqual(titles, ["Quiet", "Loud"])
+        mock_top_ids.assert_called_once_with("episodes", None, 0, 10)
+
+    def test_reset_pins_the_epoch_to_now(self):
+        from content.trending import _EPOCH_KEY, TrendingEngine
+        conn = MagicMock()
+        conn.smembers.return_value = []
+        with patch("content.trending.get_connection", return_value=conn), \
+                patch("content.trending.time.time", return_value=1_700_000_000.0):
+            TrendingEngine().reset()
+        conn.set.assert_called_once_with(_EPOCH_KEY, 1_700_000_000.0)
+
+    def test_events_decayed_past_the_floor_are_not_recorded(self):
+        from datetime import timedelta
+        from django.utils import timezone
+        from content.trending import TrendingEngine
+        conn = MagicMock()
+        engine = TrendingEngine()
+        long_ago = timezone.now() - timedelta(seconds=engine.HALF_LIFE * 40)
+        with patch("content.trending.get_connection", return_value=conn):
+            engine.record_episode_event("play", self.loud.pk, self.podcast.pk, scale=50, at=long_ago)
+            conn.eval.assert_not_called()
+            engine.record_episode_event("play", self.loud.pk, self.podcast.pk, at=timezone.now())
+        conn.eval.assert_called_once()
+
+    def test_ordering_trending_falls_back_to_plays_without_redis(self):
+        response = self.client.get("/api/episodes/", {"ordering": "trending"})
+        titles = [ep["title"] for ep in response.json()["results"]]
+        self.assertEqual(titles, ["Loud", "Quiet"])
+
+
+# ---------------------------------------------------------------------------
+# Full-text search
+# ---------------------------------------------------------------------------
+
+@override_settings(CACHES=_LOCMEM_CACHE)
+class TestFullTextSearch(TestCase):
+
+    def setUp(self):
+        self.podcast = Podcast.objects.create(
+            title="Kenyan Tech Weekly", description="Startups and technology in Nairobi"
+        )
+        self.other = Podcast.objects.create(
+            title="Cooking Hour", description="Recipes, with the odd tech gadget review"
+        )
+
+    def test_match_expression_strips_query_syntax(self):
+        from content.search import SQLiteFTSBackend
+        self.assertEqual(SQLiteFTSBackend.match_expression('tech "OR" news*'), '"tech" "or" "news"*')
+
+    def test_title_hits_rank_above_description_hits(self):
+        response = self.client.get("/api/podcasts/", {"search": "tech"})
+        titles = [p["title"] for p in response.json()["results"]]
+        self.assertEqual(titles, ["Kenyan Tech Weekly", "Cooking Hour"])
+
+    def test_index_follows_updates_and_bulk_creates(self):
+        self.other.title = "Gadget Kitchen"
+        self.other.save()
+        Episode.objects.bulk_create([Episode(podcast=self.podcast, title="Gadget roundup")])
+
+        podcasts = self.client.get("/api/search", {"query": "gadget kit"}).json()["results"]
+        self.assertEqual([p["title"] for p in podcasts], ["Gadget Kitchen"])
+        episodes = self.client.get("/api/episodes/", {"search": "gadget"}).json()["results"]
+        self.assertEqual([e["title"] for e in episodes], ["Gadget roundup"])
+
+    def test_triggers_survive_migrations_and_index_new_rows(self):
+        from django.db import connection
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE '%_fts_%'")
+            triggers = {row[0] for row in cursor.fetchall()}
+        for table in ("content_podcast", "content_episode", "content_transcriptsegment"):
+            for suffix in ("ai", "ad", "au"):
+                self.assertIn(f"{table}_fts_{suffix}", triggers)
+
+        Podcast.objects.create(title="Solar Sailing", description="Created after migrate")
+        podcasts = self.client.get("/api/search", {"query": "solar"}).json()["results"]
+        self.assertEqual([p["title"] for p in podcasts], ["Solar Sailing"])
+
+    def test_post_migrate_restore_only_touches_tables_that_lost_triggers(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from content.search import restore_search_index
+        with CaptureQueriesContext(connection) as untouched:
+            restore_search_index(sender=None)
+        self.assertFalse([q for q in untouched.captured_queries if "_fts" in q["sql"] and "sqlite_master" not in q["sql"]])
+
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TRIGGER content_podcast_fts_ai")
+        with CaptureQueriesContext(connection) as restored:
+            restore_search_index(sender=None)
+        refilled = [q["sql"] for q in restored.captured_queries if q["sql"].startswith("DELETE FROM")]
+        self.assertEqual(refilled, ["DELETE FROM content_podcast_fts"])
+
+        Podcast.objects.create(title="Solar Sailing")
+        podcasts = self.client.get("/api/search", {"query": "solar"}).json()["results"]
+        self.assertEqual([p["title"] for p in podcasts], ["Solar Sailing"])
+
+    def test_rebuild_command_restores_dropped_triggers(self):
+        from django.core.management import call_command
+        from django.db import connection
+        with connection.cursor() as cursor:
+            for suffix in ("ai", "ad", "au"):
+                cursor.execute(f"DROP TRIGGER IF EXISTS content_podcast_fts_{suffix}")
+            cursor.execute("DELETE FROM content_podcast_fts")
+
+        call_command("rebuild_search_index", stdout=StringIO())
+        Podcast.objects.create(title="Gadget Kitchen")
+
+        podcasts = self.client.get("/api/search", {"query": "gadget kit"}).json()["results"]
+        self.assertEqual([p["title"] for p in podcasts], ["Gadget Kitchen"])
+        titles = [p["title"] for p in self.client.get("/api/podcasts/", {"search": "tech"}).json()["results"]]
+        self.assertEqual(titles, ["Kenyan Tech Weekly", "Cooking Hour"])
+
+
+# ---------------------------------------------------------------------------
+# Transcript search
+# ---------------------------------------------------------------------------
+
+@override_settings(CACHES=_LOCMEM_CACHE)
+class TestTranscriptSearch(TestCase):
+
+    def setUp(self):
+        self.podcast = Podcast.objects.create(title="Vault Cast")
+
+    def _episode(self, title, transcript, duration=0):
+        from content.transcripts import index_episode
+        episode = Episode.objects.create(
+            podcast=self.podcast, title=title, transcript_content=transcript, duration=duration
+        )
+        index_episode(episode)
+        return episode
+
+    def test_plain_text_hit_has_exact_char_offset_and_estimated_seconds(self):
+        filler = "word " * 200
+        transcript = filler + "Today we talk about mobile money in Kenya. " + filler
+        self._episode("M-Pesa deep dive", transcript, duration=600)
+
+        response = self.client.get("/api/transcripts/search", {"query": "mobile money"})
+        result = response.json()["results"][0]
+        hit = result["hits"][0]
+        self.assertEqual(result["episode_title"], "M-Pesa deep dive")
+        self.assertEqual(hit["char_offset"], transcript.index("mobile"))
+        self.assertIn("<mark>mobile</mark> <mark>money</mark>", hit["snippet"])
+        self.assertAlmostEqual(hit["seconds"], hit["char_offset"] / len(transcript) * 600, delta=1)
+
+    def test_vtt_hits_use_cue_timings(self):
+        transcript = (
+            "WEBVTT\n\n"
+            "00:00:01.000 --> 00:00:04.000\n<v Host>Welcome to the show.\n\n"
+            "00:01:30.000 --> 00:01:35.000\nLet's talk about <b>solar</b> power.\n"
+        )
+        with patch("content.transcripts.SEGMENT_WORDS", 3):   # one cue per segment
+            self._episode("Energy", transcript)
+
+        hit = self.client.get("/api/transcripts/search", {"query": "solar"}).json()["results"][0]["hits"][0]
+        self.assertTrue(90.0 <= hit["seconds"] < 95.0)
+        self.assertIn("<mark>solar</mark>", hit["snippet"])
+        self.assertNotIn("-->", hit["snippet"])
+
+    def test_reindex_replaces_segments(self):
+        episode = self._episode("Ep", "An episode about gardening.")
+        episode.transcript_content = "An episode about astronomy."
+        episode.save()
+        from content.transcripts import index_episode
+        index_episode(episode)
+
+        results = self.client.get("/api/transcripts/search", {"query": "gardening"}).json()["results"]
+        self.assertEqual(results, [])
+        results = self.client.get("/api/transcripts/search", {"query": "astro"}).json()["results"]
+        self.assertEqual(len(results), 1)
+
+
+# ---------------------------------------------------------------------------
+# Buffered play counting
+# ---------------------------------------------------------------------------
+
+class _FakeRedisHashes:
+    """Just enough of the Redis hash/key API for PlayCounter."""
+
+    def __init__(self):
+        self.data = {}
+
+    def hincrby(self, key, field, amount):
+        bucket = self.data.setdefault(key, {})
+        bucket[field] = bucket.get(field, 0) + amount
+        return bucket[field]
+
+    def hget(self, key, field):
+        return self.data.get(key, {}).get(field)
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def set(self, key, value, nx=False, px=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def eval(self, script, numkeys, *args):
+        from content import plays
+        key = args[0]
+        if script == plays._TAKE_SCRIPT:
+            raw = self.data.pop(key, {})
+            return [item for pair in raw.items() for item in pair]
+        if script == plays._RELEASE_SCRIPT:
+            if self.data.get(key) == args[1]:
+                self.data.pop(key)
+                return 1
+            return 0
+        raise NotImplementedError(script)
+
+
+@override_settings(CACHES=_LOCMEM_CACHE)
+class TestPlayCounter(TestCase):
+
+    def setUp(self):
+        podcast = Podcast.objects.create(title="Vault Cast")
+        self.hot = Episode.objects.create(podcast=podcast, title="Hot", plays=10)
+        self.cold = Episode.objects.create(podcast=podcast, title="Cold")
+
+    def test_plays_are_buffered_then_flushed_in_bulk(self):
+        from content.plays import PlayCounter
+        fake = _FakeRedisHashes()
+        with patch("content.plays.get_connection", return_value=fake):
+            for _ in range(5):
+                response = self.client.post(f"/api/episodes/{self.hot.pk}/record-play/")
+            self.client.post(f"/api/episodes/{self.cold.pk}/record-play/")
+
+            self.assertEqual(response.json()["plays"], 15)
+            self.hot.refresh_from_db()
+            self.assertEqual(self.hot.plays, 10)            # nothing written yet
+
+            # savepoint + 2 episode UPDATEs + 1 creator-stats UPDATE + release
+            with self.assertNumQueries(5):
+                self.assertEqual(PlayCounter().flush(), 2)
+
+        self.hot.refresh_from_db()
+        self.cold.refresh_from_db()
+        self.assertEqual((self.hot.plays, self.cold.plays), (15, 1))
+        self.assertEqual(fake.data, {})
+
+    def test_flush_skips_while_another_flush_holds_the_lease(self):
+        from content.plays import LEASE_KEY, PENDING_KEY, PlayCounter
+        fake = _FakeRedisHashes()
+        fake.data = {PENDING_KEY: {str(self.hot.pk): 3}, LEASE_KEY: "other-flush"}
+        with patch("content.plays.get_connection", return_value=fake):
+            self.assertEqual(PlayCounter().flush(), 0)
+
+        self.hot.refresh_from_db()
+        self.assertEqual(self.hot.plays, 10)
+        self.assertEqual(fake.data[PENDING_KEY], {str(self.hot.pk): 3})
+        self.assertEqual(fake.data[LEASE_KEY], "other-flush")
+
+    def test_failed_apply_returns_the_batch_to_the_buffer(self):
+        from content.plays import PENDING_KEY, PlayCounter
+        fake = _FakeRedisHashes()
+        fake.data = {PENDING_KEY: {str(self.hot.pk): 3}}
+        with patch("content.plays.get_connection", return_value=fake), \
+                patch.object(PlayCounter, "apply", side_effect=RuntimeError("db down")):
+            with self.assertRaises(RuntimeError):
+                PlayCounter().flush()
+
+        self.assertEqual(fake.data, {PENDING_KEY: {str(self.hot.pk): 3}})
+
+    def test_without_redis_each_play_is_an_atomic_update(self):
+        response = self.client.post(f"/api/episodes/{self.hot.pk}/record-play/")
+        self.assertEqual(response.json()["plays"], 11)
+        self.hot.refresh_from_db()
+        self.assertEqual(self.hot.plays, 11)
+
+
+# ---------------------------------------------------------------------------
+# Streaming audio proxy
+# ---------------------------------------------------------------------------
+
+@override_settings(AUDIO_CACHE_ENABLED=False)
+class TestAudioProxy(TestCase):
+
+    def setUp(self):
+        podcast = Podcast.objects.create(title="Vault Cast")
+        self.episode = Episode.objects.create(
+            podcast=podcast, title="Ep 1", audio_url="https://cdn.example.com/ep1.mp3"
+        )
+        self.seen_headers = []
+
+    @staticmethod
+    async def _body(data):
+        for i in range(0, len(data), 4):
+            yield data[i:i + 4]
+
+    def _upstream(self, request):
+        import httpx
+        self.seen_headers.append(request.headers)
+        if "range" in request.headers:
+            return httpx.Response(
+                206, content=self._body(b"0123"),
+                headers={"Content-Type": "audio/mpeg", "Content-Range": "bytes 0-3/10", "Accept-Ranges": "bytes"},
+            )
+        return httpx.Response(200, content=self._body(b"0123456789"), headers={"Content-Type": "audio/mpeg"})
+
+    def _client(self):
+        import httpx
+        return httpx.AsyncClient(transport=httpx.MockTransport(self._upstream))
+
+    async def _get(self, **headers):
+        with patch("content.audio_proxy._build_client", self._client):
+            response = await self.async_client.get(f"/api/episodes/{self.episode.pk}/audio/", headers=headers)
+            body = b"".join([chunk async for chunk in response.streaming_content])
+        return response, body
+
+    async def test_body_is_streamed_not_buffered(self):
+        response, body = await self._get()
+        self.assertTrue(response.streaming)
+        self.assertEqual((response.status_code, body), (200, b"0123456789"))
+
+    async def test_range_is_forwarded_both_ways(self):
+        response, body = await self._get(Range="bytes=0-3")
+        self.assertEqual(self.seen_headers[0]["range"], "bytes=0-3")
+        self.assertEqual((response.status_code, body), (206, b"0123"))
+        self.assertEqual(response["Content-Range"], "bytes 0-3/10")
+
+    async def test_full_pool_fails_fast_with_503(self):
+        import httpx
+
+        def full_pool(request):
+            raise httpx.PoolTimeout("no connection available", request=request)
+
+        with patch("content.audio_proxy._build_client",
+                   lambda: httpx.AsyncClient(transport=httpx.MockTransport(full_pool))):
+            response = await self.async_client.get(f"/api/episodes/{self.episode.pk}/audio/")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], "5")
+
+
+# ---------------------------------------------------------------------------
+# Audio block cache
+# ---------------------------------------------------------------------------
+
+class TestAudioBlockCache(TestCase):
+
+    AUDIO = bytes(range(10))
+
+    def setUp(self):
+        import tempfile
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        override = override_settings(AUDIO_CACHE_DIR=tmp.name, AUDIO_CACHE_BLOCK_SIZE=4)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        podcast = Podcast.objects.create(title="Vault Cast")
+        self.episode = Episode.objects.create(
+            podcast=podcast, title="Ep 1", audio_url="https://cdn.example.com/ep1.mp3"
+        )
+        self.upstream_ranges = []
+        self.etag = '"v1"'
+        self.truncate = False
+
+    def _upstream(self, request):
+        """A range-honouring origin with an ETag that records what it was asked for."""
+        import httpx
+        from content.audio_cache import AudioBlockCache
+        start, end = AudioBlockCache.parse_range(request.headers.get("range"), len(self.AUDIO))
+        self.upstream_ranges.append((start, end))
+        if request.headers.get("if-none-match") == self.etag:
+            return httpx.Response(304, headers={"ETag": self.etag})
+        if request.headers.get("if-range", self.etag) != self.etag:
+            return httpx.Response(200, content=self.AUDIO, headers={"ETag": self.etag})
+
+        async def body():
+            yield self.AUDIO[start:end + (0 if self.truncate else 1)]
+        return httpx.Response(206, content=body(), headers={
+            "Content-Type": "audio/mpeg", "Content-Range": f"bytes {start}-{end}/{len(self.AUDIO)}",
+            "ETag": self.etag,
+        })
+
+    def _client(self):
+        import httpx
+        return httpx.AsyncClient(transport=httpx.MockTransport(self._upstream))
+
+    async def _get(self, range_header):
+        with patch("content.audio_proxy._build_client", self._client):
+            response = await self.async_client.get(
+                f"/api/episodes/{self.episode.pk}/audio/", headers={"Range": range_header}
+            )
+            body = b"".join([chunk async for chunk in response.streaming_content])
+        return response, body
+
+    def test_parse_range(self):
+        from content.audio_cache import AudioBlockCache
+        self.assertEqual(AudioBlockCache.parse_range("bytes=2-", 10), (2, 9))
+        self.assertEqual(AudioBlockCache.parse_range("bytes=-3", 10), (7, 9))
+        self.assertIsNone(AudioBlockCache.parse_range(None, 10))
+        self.assertIs(AudioBlockCache.parse_range("bytes=10-", 10), False)
+
+    async def test_only_missing_blocks_are_fetched(self):
+        response, body = await self._get("bytes=2-9")
+        self.assertEqual((response.status_code, body), (206, self.AUDIO[2:]))
+        self.assertEqual(response["Content-Range"], "bytes 2-9/10")
+        self.assertEqual(self.upstream_ranges, [(0, 3), (4, 7), (8, 9)])   # probe + 2 blocks
+
+        response, body = await self._get("bytes=1-6")
+        self.assertEqual(body, self.AUDIO[1:7])
+        self.assertEqual(len(self.upstream_ranges), 3)                      # all from disk
+
+    async def test_concurrent_block_requests_share_one_fetch(self):
+        import asyncio
+        from content.audio_cache import AudioBlockCache
+        cache = AudioBlockCache()
+        with patch("content.audio_proxy._build_client", self._client):
+            blocks = await asyncio.gather(*[
+                cache._block(self.episode.audio_url, "d" * 64, 1) for _ in range(5)
+            ])
+        self.assertEqual(blocks, [self.AUDIO[4:8]] * 5)
+        self.assertEqual(self.upstream_ranges, [(4, 7)])
+
+    async def test_unchanged_upstream_revalidates_with_one_304(self):
+        await self._get("bytes=0-9")
+        with override_settings(AUDIO_CACHE_MAX_AGE=0):
+            response, body = await self._get("bytes=0-9")
+        self.assertEqual(body, self.AUDIO)
+        self.assertEqual(self.upstream_ranges, [(0, 3), (4, 7), (8, 9), (0, 3)])   # + conditional probe
+
+    async def test_replaced_upstream_drops_cached_blocks(self):
+        await self._get("bytes=0-9")
+        self.AUDIO, self.etag = bytes(range(10, 20)), '"v2"'
+
+        response, body = await self._get("bytes=0-9")
+        self.assertEqual(body, bytes(range(10)))                            # still within max-age
+        with override_settings(AUDIO_CACHE_MAX_AGE=0):
+            response, body = await self._get("bytes=0-9")
+        self.assertEqual(body, bytes(range(10, 20)))
+
+    async def test_truncated_block_is_not_cached(self):
+        import hashlib
+        from content.audio_cache import AudioBlockCache
+        cache = AudioBlockCache()
+        digest = hashlib.sha256(self.episode.audio_url.encode()).hexdigest()
+        self.truncate = True
+        with patch("content.audio_proxy._build_client", self._client):
+            block = await cache._block(self.episode.audio_url, digest, 1, {"size": len(self.AUDIO)})
+        self.assertIsNone(block)
+        self.assertFalse((cache._entry_dir(digest) / "1.blk").exists())
+
+    async def test_lru_eviction_keeps_recent_blocks(self):
+        with override_settings(AUDIO_CACHE_MAX_BYTES=8):
+            await self._get("bytes=0-9")            # 3 blocks = 10 bytes > cap
+        from content.audio_cache import AudioBlockCache
+        remaining = sum(size for _, size, _ in AudioBlockCache()._files())
+        self.assertLessEqual(remaining, 8)
+
+    def test_eviction_removes_emptied_entries_with_their_metadata(self):
+        import os
+        from content.audio_cache import AudioBlockCache
+        cache = AudioBlockCache()
+        cold, warm = "a" * 64, "b" * 64
+        for digest, when in ((cold, 1_000), (warm, 2_000)):
+            for name in ("meta.json", "0.blk"):
+                path = cache._entry_dir(digest) / name
+                cache._write_atomic(path, b"1234")
+                os.utime(path, (when, when))
+
+        with override_settings(AUDIO_CACHE_MAX_BYTES=5):       # low water: 4 bytes
+            AudioBlockCache()._evict_sync()
+
+        self.assertFalse(cache._entry_dir(cold).parent.exists())
+        self.assertTrue((cache._entry_dir(warm) / "0.blk").exists())
+        self.assertTrue((cache._entry_dir(warm) / "meta.json").exists())
+
+
+# ---------------------------------------------------------------------------
+# Signed stream tokens
+# ---------------------------------------------------------------------------
+
+@override_settings(
+    BUNNY_STORAGE_ZONE_NAME="vault", BUNNY_STORAGE_PASSWORD="pw",
+    BUNNY_PULL_ZONE_URL="https://vault.b-cdn.net", BUNNY_PULL_ZONE_SECURITY_KEY="secret",
+)
+class TestStreamTokens(TestCase):
+
+    def setUp(self):
+        self.podcast = Podcast.objects.create(title="Vault Cast")
+        self.episode = Episode.objects.create(podcast=self.podcast, title="Ep 1", audio_file="episodes/ep1.mp3")
+
+    def _stream_url(self, pk):
+        return self.client.get(f"/api/podcasts/{pk}/stream-token/").json()["stream_url"]
+
+    def test_bunny_files_redirect_to_signed_pull_zone_url_without_queries(self):
+        from podvault_api.storage_backends import BunnyStorage
+        url = self._stream_url(self.episode.pk)
+        with patch("content.views.default_storage", BunnyStorage()), self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(response["Location"].startswith("https://vault.b-cdn.net/episodes/ep1.mp3?token="))
+        self.assertIn("&expires=", response["Location"])
+
+    def test_podcast_id_streams_newest_episode(self):
+        url = self._stream_url(self.podcast.pk)
+        self.assertIn(f"/stream/{self.episode.pk}?", url)
+
+    def test_tampered_or_foreign_tokens_are_rejected(self):
+        other = Episode.objects.create(podcast=self.podcast, title="Ep 2")
+        url = self._stream_url(self.episode.pk)
+        self.assertEqual(self.client.get(url + "x").status_code, 403)
+        foreign = url.replace(str(self.episode.pk), str(other.pk), 1)
+        self.assertEqual(self.client.get(foreign).status_code, 403)
+
+
+# ---------------------------------------------------------------------------
+# Keyset pagination
+# ---------------------------------------------------------------------------
+
+class TestKeysetPagination(TestCase):
+
+    def setUp(self):
+        from django.utils import timezone
+        podcast = Podcast.objects.create(title="Vault Cast")
+        Episode.objects.bulk_create([Episode(podcast=podcast, title=f"Ep {i}") for i in range(7)])
+        # Three share a timestamp so the id tie-breaker matters.
+        same = timezone.now()
+        ids = list(Episode.objects.values_list("pk", flat=True))
+        Episode.objects.filter(pk__in=ids[:3]).update(published_at=same)
+
+    def _walk(self):
+        titles, url, params = [], "/api/episodes/", {"cursor": "", "limit": 2}
+        while url:
+            body = self.client.get(url, params).json()
+            self.assertNotIn("count", body)
+            titles += [e["title"] for e in body["results"]]
+            url, params = body["next"], None
+        return titles
+
+    def test_cursor_pages_cover_every_row_once_in_order(self):
+        expected = list(
+            Episode.objects.order_by("-published_at", "-id").values_list("title", flat=True)
+        )
+        self.assertEqual(self._walk(), expected)
+
+    def test_deep_page_seeks_instead_of_offset_and_count(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        first = self.client.get("/api/episodes/", {"cursor": "", "limit": 2}).json()
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(first["next"])
+        sql = ctx.captured_queries[0]["sql"]
+        self.assertNotIn("COUNT(", sql)
+        self.assertNotIn("OFFSET", sql)
+        self.assertIn("LIMIT 3", sql)
+
+    def test_limit_offset_remains_the_default(self):
+        body = self.client.get("/api/episodes/", {"limit": 2, "offset": 2}).json()
+        self.assertEqual(body["count"], 7)
+
+
+# ---------------------------------------------------------------------------
+# Query budgets
+# ---------------------------------------------------------------------------
+
+class TestQueryBudgets(QueryBudgetMixin, TestCase):
+    """Every list endpoint runs a constant number of queries."""
+
+    def setUp(self):
+        from django.contrib.auth import get_user_model
+        self.User = get_user_model()
+        self.n = 0
+        self.grow()
+
+    def grow(self):
+        from decimal import Decimal
+        from content.models import CreatorSubscription, Follow, Like, Person, Playlist, Tip
+        from users.models import UserActivity
+        self.n += 1
+        user = self.User.objects.create(username=f"user{self.n}")
+        podcast = Podcast.objects.create(title=f"Show {self.n}", creator=user)
+        episode = Episode.objects.create(podcast=podcast, title=f"Ep {self.n}")
+        episode.cast.add(Person.objects.create(name=f"Host {self.n}"))
+        Like.objects.create(user=user, episode=episode)
+        Follow.objects.create(user=user, podcast=podcast)
+        Tip.objects.create(sender=user, recipient=user, amount=Decimal("5"), episode=episode)
+        CreatorSubscription.objects.create(creator=user, subscriber=user, amount=Decimal("1"))
+        Playlist.objects.create(user=user, name="Mix", is_public=True).episodes.add(episode)
+        UserActivity.objects.create(user=user, episode=episode, activity_type="comment")
+
+    def test_list_endpoints_have_constant_query_counts(self):
+        budgets = {
+            "/api/podcasts/": 5,
+            "/api/episodes/": 3,
+            "/api/search": 5,
+            "/api/likes/": 2,
+            "/api/follows/": 2,
+            "/api/tips/": 2,
+            "/api/creator-subscriptions/": 2,
+            "/api/playlists/": 3,
+            "/api/comments/": 2,
+            "/api/user-activities/": 2,
+        }
+        for path, budget in budgets.items():
+            with self.subTest(path=path):
+                self.assertQueryBudget(path, budget, grow=self.grow, rows=2)
+
+    def test_middleware_reports_query_stats(self):
+        from podvault_api.middleware import snapshot
+        with self.settings(QUERY_STATS_HEADERS=True):
+            response = self.client.get("/api/likes/")
+        self.assertIn("X-DB-Queries", response)
+        self.assertIn("GET api/likes/", snapshot())
+
+    def test_unresolved_paths_share_one_stats_entry(self):
+        from podvault_api.middleware import snapshot
+        for n in range(3):
+            self.client.get(f"/no-such-page-{n}/")
+        keys = [key for key in snapshot() if "no-such-page" in key]
+        self.assertEqual(keys, [])
+        self.assertGreaterEqual(snapshot()["GET <unresolved>"]["requests"], 3)
+
+
+# ---------------------------------------------------------------------------
+# Sparse fieldsets
+# ---------------------------------------------------------------------------
+
+class TestSparseFieldsets(TestCase):
+
+    def setUp(self):
+        podcast = Podcast.objects.create(title="Vault Cast")
+        self.episode = Episode.objects.create(
+            podcast=podcast, title="Pilot", transcript_content="word " * 500, value={"splits": []},
+        )
+
+    def _episode_sql(self, path, params=None):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        with CaptureQueriesContext(connection) as ctx:
+            body = self.client.get(path, params).json()
+        sql = next(q["sql"] for q in ctx.captured_queries if '"content_episode"."title"' in q["sql"])
+        return body, sql
+
+    def test_list_skips_heavy_columns_by_default(self):
+        body, sql = self._episode_sql("/api/episodes/")
+        self.assertNotIn("transcript_content", body["results"][0])
+        self.assertIn("summary", body["results"][0])
+        self.assertNotIn('"transcript_content"', sql)
+        self.assertNotIn('"value"', sql)
+
+    def test_fields_selects_columns_and_serializer_fields(self):
+        body, sql = self._episode_sql("/api/episodes/", {"fields": "id,title,transcript_content"})
+        self.assertEqual(set(body["results"][0]), {"id", "title", "transcript_content"})
+        self.assertIn('"transcript_content"', sql)
+        self.assertNotIn('"description"', sql)
+
+    def test_detail_is_complete_unless_omitted(self):
+        path = f"/api/episodes/{self.episode.pk}/"
+        self.assertIn("transcript_content", self.client.get(path).json())
+        body, sql = self._episode_sql(path, {"omit": "transcript_content,summary"})
+        self.assertNotIn("transcript_content", body)
+        self.assertNotIn('"summary"', sql)
+
+    def test_podcast_nested_episodes_are_slim(self):
+        podcast = self.client.get("/api/podcasts/").json()["results"][0]
+        self.assertNotIn("transcript_content", podcast["episodes"][0])
+        body = self.client.get("/api/podcasts/", {"fields": "id,title"}).json()
+        self.assertEqual(set(body["results"][0]), {"id", "title"})
+
+
+# ---------------------------------------------------------------------------
+# Conditional GET
+# ---------------------------------------------------------------------------
+
+@override_settings(CACHES=_LOCMEM_CACHE)
+class TestConditionalGet(TestCase):
+
+    def setUp(self):
+        self.category = Category.objects.create(name="Tech", slug="tech")
+        self.podcast = Podcast.objects.create(title="Vault Cast", category=self.category)
+        self.episode = Episode.objects.create(podcast=self.podcast, title="Pilot")
+
+    def test_detail_revalidates_with_a_single_query(self):
+        path = f"/api/episodes/{self.episode.pk}/"
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Last-Modified", response)
+        with self.assertNumQueries(1):
+            again = self.client.get(path, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(again.status_code, 304)
+
+    def test_episode_write_changes_podcast_etag(self):
+        path = f"/api/podcasts/{self.podcast.pk}/"
+        etag = self.client.get(path)["ETag"]
+        self.episode.title = "Pilot (remastered)"
+        self.episode.save()
+        response = self.client.get(path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_list_etag_tracks_deletions_and_query_params(self):
+        etag = self.client.get("/api/episodes/")["ETag"]
+        self.assertEqual(self.client.get("/api/episodes/", HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.assertNotEqual(self.client.get("/api/episodes/", {"fields": "id"})["ETag"], etag)
+        self.episode.delete()
+        self.assertEqual(self.client.get("/api/episodes/", HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_list_revalidation_runs_no_queries(self):
+        etag = self.client.get("/api/episodes/", {"page_size": 1})["ETag"]
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/episodes/", {"page_size": 1}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_categories_support_if_modified_since(self):
+        response = self.client.get("/api/categories/")
+        self.assertEqual(response.json()[0]["slug"], "tech")
+        again = self.client.get("/api/categories/", HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+        self.assertEqual(again.status_code, 304)
+
+
+# ---------------------------------------------------------------------------
+# Engagement counters
+# ---------------------------------------------------------------------------
+
+class TestEngagementCounters(TestCase):
+
+    def setUp(self):
+        from django.contrib.auth import get_user_model
+        self.user = get_user_model().objects.create(username="listener")
+        self.podcast = Podcast.objects.create(title="Vault Cast")
+        self.episode = Episode.objects.create(podcast=self.podcast, title="Pilot")
+
+    def _refresh(self):
+        self.podcast.refresh_from_db()
+        self.episode.refresh_from_db()
+
+    def test_follow_like_and_comment_move_counters(self):
+        from content.models import Follow, Like
+        from users.models import UserActivity
+        follow = Follow.objects.create(user=self.user, podcast=self.podcast)
+        like = Like.objects.create(user=self.user, episode=self.episode)
+        UserActivity.objects.create(user=self.user, episode=self.episode, activity_type="comment")
+        UserActivity.objects.create(user=self.user, episode=self.episode, activity_type="play")
+        self._refresh()
+        self.assertEqual(
+            (self.podcast.subscriber_count, self.episode.like_count, self.episode.comment_count), (1, 1, 1))
+
+        follow.delete()
+        like.delete()
+        self._refresh()
+        self.assertEqual((self.podcast.subscriber_count, self.episode.like_count), (0, 0))
+
+    def test_reconcile_fixes_drift(self):
+        from django.core.management import call_command
+        from content.models import Like
+        Like.objects.create(user=self.user, episode=self.episode)
+        Episode.objects.filter(pk=self.episode.pk).update(like_count=7, comment_count=2)
+        Podcast.objects.filter(pk=self.podcast.pk).update(subscriber_count=3)
+        call_command("reconcile_counters", stdout=StringIO())
+        self._refresh()
+        self.assertEqual(
+            (self.podcast.subscriber_count, self.episode.like_count, self.episode.comment_count), (0, 1, 0))
+
+    def test_counts_are_rendered_without_extra_queries(self):
+        from django.contrib.auth import get_user_model
+        from content.models import Like
+        from users.models import UserActivity
+        other = get_user_model().objects.create(username="other")
+        for user in (self.user, other):
+            Like.objects.create(user=user, episode=self.episode)
+        UserActivity.objects.create(user=self.user, episode=self.episode, activity_type="comment")
+
+        with self.assertNumQueries(3):      # validators, the episode, its cast — no COUNT(*)
+            body = self.client.get(f"/api/episodes/{self.episode.pk}/").json()
+        self.assertEqual((body["like_count"], body["comment_count"]), (2, 1))
+
+
+# ---------------------------------------------------------------------------
+# Viewer state
+# ---------------------------------------------------------------------------
+
+class TestViewerState(TestCase):
+
+    def setUp(self):
+        from django.contrib.auth import get_user_model
+        from rest_framework.test import APIClient
+        from content.models import Follow, Like, Playlist
+        from sync.models import UserProgress
+
+        self.user = get_user_model().objects.create(username="listener")
+        self.podcast = Podcast.objects.create(title="Vault Cast")
+        self.episodes = [Episode.objects.create(podcast=self.podcast, title=f"Ep {n}") for n in range(3)]
+        Like.objects.create(user=self.user, episode=self.episodes[0])
+        Follow.objects.create(user=self.user, podcast=self.podcast)
+        UserProgress.objects.create(user=self.user, episode=self.episodes[1], timestamp_seconds=90)
+        self.playlist = Playlist.objects.create(user=self.user, name="Later")
+        self.playlist.episodes.add(self.episodes[2])
+
+        self.api = APIClient()
+        self.api.force_authenticate(self.user)
+
+    def test_one_query_per_relation(self):
+        ids = ",".join(str(e.pk) for e in self.episodes)
+        with self.assertNumQueries(4):
+            body = self.api.get("/api/viewer-state", {"episodes": ids, "podcasts": str(self.podcast.pk)}).json()
+        first, second, third = (body["episodes"][str(e.pk)] for e in self.episodes)
+        self.assertTrue(first["liked"])
+        self.assertEqual(second["progress"], 90)
+        self.assertEqual(third["playlists"], [str(self.playlist.pk)])
+        self.assertTrue(body["podcasts"][str(self.podcast.pk)]["followed"])
+
+    def test_post_body_and_anonymous_viewer(self):
+        payload = {"episodes": [str(self.episodes[0].pk)]}
+        self.assertTrue(self.api.post("/api/viewer-state", payload, format="json").json()
+                        ["episodes"][str(self.episodes[0].pk)]["liked"])
+        with self.assertNumQueries(0):
+            body = self.client.get("/api/viewer-state", {"episodes": str(self.episodes[0].pk)}).json()
+        self.assertFalse(body["episodes"][str(self.episodes[0].pk)]["liked"])
+
+    def test_malformed_ids_are_rejected(self):
+        self.assertEqual(self.api.get("/api/viewer-state", {"episodes": "nope"}).status_code, 400)
+
+    def test_non_object_body_is_rejected(self):
+        for body in ([str(self.episodes[0].pk)], "episodes", 42):
+            with self.subTest(body=body):
+                response = self.api.post("/api/viewer-state", body, format="json")
+                self.assertEqual(response.status_code, 400)
+
+
+# ---------------------------------------------------------------------------
+# Fast JSON path
+# ---------------------------------------------------------------------------
+
+@override_settings(CACHES=_LOCMEM_CACHE)
+class TestFastJSONPath(TestCase):
+
+    def setUp(self):
+        from content.models import Person
+        cache.clear()
+        category = Category.objects.create(name="Tech", slug="tech")
+        self.podcast = Podcast.objects.create(title="Vault Cast  ", category=category)
+        Podcast.objects.create(title="No category")
+        episode = Episode.objects.create(podcast=self.podcast, title="Pilot", value={"splits": [1.5]})
+        episode.cast.add(Person.objects.create(name="Host"))
+
+    def _both(self, path, params=None):
+        # Bypass the response cache so each path really renders.
+        with patch("content.response_cache.TTL", 0):
+            with self.settings(FAST_JSON_RENDERING=False):
+                slow = self.client.get(path, params)
+            with self.settings(FAST_JSON_RENDERING=True):
+                fast = self.client.get(path, params)
+        self.assertEqual(fast.status_code, 200)
+        return slow.content, fast.content
+
+    def test_output_matches_drf(self):
+        cases = [
+            ("/api/episodes/", None),
+            ("/api/episodes/", {"fields": "id,title,value,published_at"}),
+            ("/api/episodes/", {"cursor": ""}),
+            ("/api/podcasts/", None),
+            ("/api/podcasts/", {"omit": "episodes"}),
+        ]
+        for path, params in cases:
+            with self.subTest(path=path, params=params):
+                slow, fast = self._both(path, params)
+                self.assertEqual(slow, fast)
+
+    def test_feed_snapshot_matches_drf(self):
+        from content.services import FeedSnapshotService
+        with self.settings(FAST_JSON_RENDERING=False):
+            slow = FeedSnapshotService().build()
+        with self.settings(FAST_JSON_RENDERING=True):
+            fast = FeedSnapshotService().build()
+        from podvault_api.fastjson import FastJSONRenderer
+        from rest_framework.renderers import JSONRenderer
+        self.assertEqual(JSONRenderer().render(slow), FastJSONRenderer().render(fast))
+
+    def test_nested_relations_cost_one_query_each(self):
+        with self.settings(FAST_JSON_RENDERING=True):
+            # COUNT, podcasts, episodes, cast
+            with self.assertNumQueries(4):
+                self.client.get("/api/podcasts/")
+
+
+# ---------------------------------------------------------------------------
+# Creator stats
+# ---------------------------------------------------------------------------
+
+class TestCreatorStats(TestCase):
+
+    def setUp(self):
+        from django.contrib.auth import get_user_model
+        User = get_user_model()
+        self.creator = User.objects.create(username="host", email="host@example.com")
+        self.fan = User.objects.create(username="fan")
+        self.podcast = Podcast.objects.create(title="Vault Cast", creator=self.creator)
+
+    def _stats(self):
+        from content.models import CreatorStats
+        return CreatorStats.objects.get(user=self.creator)
+
+    def test_signals_keep_stats_current(self):
+        from content.models import CreatorSubscription, Follow, Tip
+        episode = Episode.objects.create(podcast=self.podcast, title="Pilot", plays=4)
+        Follow.objects.create(user=self.fan, podcast=self.podcast)
+        Tip.objects.create(sender=self.fan, recipient=self.creator, amount="12.50")
+        CreatorSubscription.objects.create(creator=self.creator, subscriber=self.fan, amount="5.00")
+        stats = self._stats()
+        self.assertEqual(
+            (stats.podcast_count, stats.episode_count, stats.total_plays, stats.follower_count,
+             str(stats.tips_received), stats.active_subscriptions),
+            (1, 1, 4, 1, "12.50", 1),
+        )
+
+        episode.delete()
+        self.podcast.delete()
+        stats = self._stats()
+        self.assertEqual((stats.podcast_count, stats.episode_count, stats.follower_count), (0, 0, 0))
+
+    def test_play_flush_credits_creator(self):
+        from content.models import CreatorStats
+        from content.plays import PlayCounter
+        pilot = Episode.objects.create(podcast=self.podcast, title="Pilot")
+        second = Episode.objects.create(podcast=self.podcast, title="Second")
+        fan_show = Podcast.objects.create(title="Fan Show", creator=self.fan)
+        fan_episode = Episode.objects.create(podcast=fan_show, title="Fan Pilot")
+
+        with self.assertNumQueries(5):          # savepoint + 2 episode UPDATEs + 1 stats UPDATE + release
+            PlayCounter.apply({str(pilot.pk): 3, str(second.pk): 2, str(fan_episode.pk): 3})
+
+        self.assertEqual(self._stats().total_plays, 5)
+        self.assertEqual(CreatorStats.objects.get(user=self.fan).total_plays, 3)
+
+    def test_rebuild_matches_incremental(self):
+        from content.creator_stats import refresh
+        from content.models import CreatorStats
+        Episode.objects.create(podcast=self.podcast, title="Pilot", plays=2)
+        before = self._stats()
+        CreatorStats.objects.all().delete()
+        self.assertEqual(refresh(), 1)
+        after = self._stats()
+        self.assertEqual((before.episode_count, before.total_plays), (after.episode_count, after.total_plays))
+
+    def test_viewset_reads_stats_in_one_query(self):
+        Podcast.objects.create(title="Second", creator=self.creator)
+        with self.assertNumQueries(2):      # COUNT + page
+            body = self.client.get("/api/creators/", {"ordering": "-podcast_count"}).json()
+        self.assertEqual(body["results"][0]["id"], self.creator.pk)
+        self.assertEqual(body["results"][0]["podcast_count"], 2)
+
+
+# ---------------------------------------------------------------------------
+# Versioned response cache
+# ---------------------------------------------------------------------------
+
+@override_settings(CACHES=_LOCMEM_CACHE)
+class TestResponseCache(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.podcast = Podcast.objects.create(title="Vault Cast")
+        Episode.objects.create(podcast=self.podcast, title="Pilot")
+
+    def test_hit_skips_the_database(self):
+        first = self.client.get("/api/episodes/", {"limit": 5, "fields": "id,title"})
+        with self.assertNumQueries(0):
+            again = self.client.get("/api/episodes/", {"fields": "id,title", "limit": 5})
+        self.assertEqual(again.content, first.content)
+        with self.assertNumQueries(0):
+            revalidated = self.client.get("/api/episodes/", {"limit": 5, "fields": "id,title"},
+                                          HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(revalidated.status_code, 304)
+
+    def test_catalog_write_moves_to_a_new_generation(self):
+        from content.generation import current_generation
+        self.client.get("/api/podcasts/")
+        generation = current_generation()
+        Episode.objects.create(podcast=self.podcast, title="Second")
+        self.assertGreater(current_generation(), generation)
+        titles = [e["title"] for e in self.client.get("/api/podcasts/").json()["results"][0]["episodes"]]
+        self.assertIn("Second", titles)
+
+    def test_rendering_modes_do_not_share_entries(self):
+        with self.settings(FAST_JSON_RENDERING=False):
+            self.client.get("/api/episodes/")
+        with self.settings(FAST_JSON_RENDERING=True):
+            self.client.get("/api/episodes/")
+            with self.assertNumQueries(0):
+                self.client.get("/api/episodes/")
+        self.assertEqual(len([key for key in cache._cache if ":catalog:resp:" in key]), 2)
+
+    def test_authenticated_requests_bypass_the_cache(self):
+        from django.contrib.auth import get_user_model
+        from rest_framework.test import APIClient
+        api = APIClient()
+        api.force_authenticate(get_user_model().objects.create(username="listener"))
+        api.get("/api/podcasts/")
+        self.assertFalse([key for key in cache._cache if ":catalog:resp:" in key])
+
+
+# ---------------------------------------------------------------------------
+# Podcast detail episode window
+# ---------------------------------------------------------------------------
+
+@override_settings(PODCAST_DETAIL_EPISODES=2)
+class TestPodcastDetailWindow(TestCase):
+
+    def setUp(self):
+        from datetime import timedelta
+        from django.utils import timezone
+        self.podcast = Podcast.objects.create(title="Vault Cast")
+        now = timezone.now()
+        for n in range(3):
+            episode = Episode.objects.create(podcast=self.podcast, title=f"Ep {n}")
+            Episode.objects.filter(pk=episode.pk).update(published_at=now - timedelta(days=3 - n))
+
+    def test_detail_embeds_latest_window_with_next_link(self):
+        # version check, podcast + count, episode window, cast
+        with self.assertNumQueries(4):
+            body = self.client.get(f"/api/podcasts/{self.podcast.pk}/").json()
+        self.assertEqual([e["title"] for e in body["episodes"]], ["Ep 2", "Ep 1"])
+        self.assertEqual(body["episode_count"], 3)
+
+        rest = self.client.get(body["episodes_next"]).json()
+        self.assertEqual([e["title"] for e in rest["results"]], ["Ep 0"])
+        self.assertIsNone(rest["next"])
+
+    def test_no_next_link_when_everything_fits(self):
+        with self.settings(PODCAST_DETAIL_EPISODES=5):
+            body = self.client.get(f"/api/podcasts/{self.podcast.pk}/").json()
+        self.assertEqual(len(body["episodes"]), 3)
+        self.assertIsNone(body["episodes_next"])
+
+
+# ---------------------------------------------------------------------------
+# Time-ordered primary keys
+# ---------------------------------------------------------------------------
+
+class TestTimeOrderedKeys(TestCase):
+
+    def test_new_rows_get_increasing_uuid7_keys(self):
+        podcast = Podcast.objects.create(title="Vault Cast")
+        episodes = [Episode.objects.create(podcast=podcast, title=f"Ep {n}") for n in range(5)]
+        self.assertEqual(podcast.pk.version, 7)
+        self.assertEqual(list(Episode.objects.order_by("id")), episodes)
+
+    def test_uuid7_encodes_creation_time(self):
+        import time
+        from podvault_api.ids import uuid7, uuid7_time
+        self.assertAlmostEqual(uuid7_time(uuid7()), time.time(), delta=1)
@@ -0,0 +1,294 @@
+"""
+content.transcripts
+~~~~~~~~~~~~~~~~~~~
+Transcript search with timestamped snippet hits.
+
+Transcripts are split into :class:`~content.models.TranscriptSegment` rows
+of roughly ``TRANSCRIPT_SEGMENT_WORDS`` words.  The segment table carries
+the same database-native full-text index as podcasts and episodes (see
+:mod:`content.search`), so a query is one ranked index lookup plus two
+primary-key fetches no matter how many hours of audio are indexed.
+
+Each segment stores the character and time span it covers, so a hit
+inside a segment is placed by interpolation:
+
+* plain text (Whisper output) — character offsets are exact, seconds are
+  estimated from ``Episode.duration``;
+* WebVTT / SRT — seconds come from the cue timings.
+
+Indexing is incremental: :func:`index_episode` replaces one episode's
+segments and is called when ``transcribe_episode_task`` finishes.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.html import escape
+
+from .search import _MAX_RESULTS, get_search_backend, tokenize
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_WORDS: int = getattr(settings, "TRANSCRIPT_SEGMENT_WORDS", 80)
+SNIPPET_CHARS: int = getattr(settings, "TRANSCRIPT_SNIPPET_CHARS", 160)
+
+_WORD_RE = re.compile(r"\S+")
+_SENTENCE_END = (".", "!", "?")
+_CUE_TIMING_RE = re.compile(
+    r"^\s*((?:\d+:)?\d{1,2}:\d{2}[.,]\d{1,3})\s*-->\s*((?:\d+:)?\d{1,2}:\d{2}[.,]\d{1,3})"
+)
+_CUE_TAG_RE = re.compile(r"<[^>]+>")
+
+
+@dataclass
+class Segment:
+    """A transcript slice before it is saved as a ``TranscriptSegment``."""
+    start_char: int
+    end_char: int
+    text: str
+    start_seconds: Optional[float] = None
+    end_seconds: Optional[float] = None
+
+
+# ----------------------------------------------------------------------
+# Segmentation
+# ----------------------------------------------------------------------
+
+def parse_timestamp(value: str) -> float:
+    """``01:02:03.500`` / ``02:03,5`` → seconds."""
+    parts = value.replace(",", ".").split(":")
+    seconds = 0.0
+    for part in parts:
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+
+def segment_plain_text(text: str, duration: int = 0) -> List[Segment]:
+    """
+    Cut plain text into ~``SEGMENT_WORDS``-word runs, preferring to break
+    after a sentence.  Seconds are proportional to the character offset.
+    """
+    segments: List[Segment] = []
+    words = list(_WORD_RE.finditer(text))
+    start = 0
+    while start < len(words):
+        end = min(start + SEGMENT_WORDS, len(words))
+        # Run on to the end of the sentence, but never past twice the target.
+        hard_stop = min(start + 2 * SEGMENT_WORDS, len(words))
+        while end < hard_stop and not words[end - 1].group().endswith(_SENTENCE_END):
+            end += 1
+        first, last = words[start], words[end - 1]
+        segments.append(Segment(first.start(), last.end(), text[first.start():last.end()]))
+        start = end
+
+    if duration and text:
+        for segment in segments:
+            segment.start_seconds = round(segment.start_char / len(text) * duration, 2)
+            segment.end_seconds = round(segment.end_char / len(text) * duration, 2)
+    return segments
+
+
+def segment_cues(text: str) -> List[Segment]:
+    """
+    Group WebVTT/SRT cues into ~``SEGMENT_WORDS``-word segments.  Timing
+    lines, cue numbers and voice tags are dropped from the indexed text.
+    """
+    cues = []  # (start_char, end_char, start_seconds, end_seconds, text)
+    timing = None
+    offset = 0
+    for line in text.splitlines(keepends=True):
+        line_start, offset = offset, offset + len(line)
+        stripped = line.strip()
+        match = _CUE_TIMING_RE.match(line)
+        if match:
+            timing = (parse_timestamp(match.group(1)), parse_timestamp(match.group(2)))
+        elif not stripped:
+            timing = None
+        elif timing is not None:
+            cue_text = _CUE_TAG_RE.sub("", stripped)
+            if cue_text:
+                cues.append((line_start, line_start + len(line.rstrip("\r\n")), *timing, cue_text))
+
+    segments: List[Segment] = []
+    batch, batch_words = [], 0
+    for cue in cues:
+        batch.append(cue)
+        batch_words += len(cue[4].split())
+        if batch_words >= SEGMENT_WORDS or cue is cues[-1]:
+            segments.append(Segment(
+                start_char=batch[0][0],
+                end_char=batch[-1][1],
+                text=" ".join(c[4] for c in batch),
+                start_seconds=batch[0][2],
+                end_seconds=batch[-1][3],
+            ))
+            batch, batch_words = [], 0
+    return segments
+
+
+def build_segments(text: str, duration: int = 0) -> List[Segment]:
+    """Segment a transcript, detecting cue-timed formats."""
+    if not text or not text.strip():
+        return []
+    if "-->" in text:
+        segments = segment_cues(text)
+        if segments:
+            return segments
+    return segment_plain_text(text, duration)
+
+
+def index_episode(episode) -> int:
+    """
+    Replace *episode*'s transcript segments.  The full-text index follows
+    through the database triggers / generated columns.
+
+    :returns: Number of segments written.
+    """
+    from .models import TranscriptSegment
+
+    segments = build_segments(episode.transcript_content, episode.duration)
+    with transaction.atomic():
+        TranscriptSegment.objects.filter(episode_id=episode.pk).delete()
+        TranscriptSegment.objects.bulk_create(
+            [
+                TranscriptSegment(
+                    episode_id=episode.pk,
+                    position=position,
+                    start_char=s.start_char,
+                    end_char=s.end_char,
+                    start_seconds=s.start_seconds,
+                    end_seconds=s.end_seconds,
+                    text=s.text,
+                )
+                for position, s in enumerate(segments)
+            ],
+            batch_size=500,
+        )
+    logger.info("[Transcripts] Indexed %d segments for episode %s", len(segments), episode.pk)
+    return len(segments)
+
+
+# ----------------------------------------------------------------------
+# Search
+# ----------------------------------------------------------------------
+
+def highlight_pattern(query: str) -> Optional[re.Pattern]:
+    """Regex matching any query token at the start of a word."""
+    tokens = sorted(set(tokenize(query)), key=len, reverse=True)
+    if not tokens:
+        return None
+    return re.compile(r"\b(?:%s)\w*" % "|".join(re.escape(t) for t in tokens), re.IGNORECASE)
+
+
+def make_hit(segment: Dict, pattern: Optional[re.Pattern]) -> Dict:
+    """
+    Build ``{snippet, char_offset, seconds}`` for the first match in a
+    segment row.  Matches in the snippet are wrapped in ``<mark>``; the
+    rest of the text is HTML-escaped.
+    """
+    text = segment["text"]
+    match = pattern.search(text) if pattern else None
+    hit_at = match.start() if match else 0
+
+    start = max(0, hit_at - SNIPPET_CHARS // 3)
+    if start:
+        space = text.find(" ", start)
+        start = space + 1 if 0 <= space < hit_at else start
+    end = min(len(text), start + SNIPPET_CHARS)
+    if end < len(text):
+        space = text.rfind(" ", hit_at, end)
+        end = space if space > hit_at else end
+
+    window = text[start:end]
+    pieces, cursor = [], 0
+    for m in (pattern.finditer(window) if pattern else ()):
+        pieces.append(escape(window[cursor:m.start()]))
+        pieces.append(f"<mark>{escape(m.group())}</mark>")
+        cursor = m.end()
+    pieces.append(escape(window[cursor:]))
+    snippet = "".join(pieces)
+    if start:
+        snippet = "…" + snippet
+    if end < len(text):
+        snippet += "…"
+
+    fraction = hit_at / len(text) if text else 0.0
+    char_offset = segment["start_char"] + round(fraction * (segment["end_char"] - segment["start_char"]))
+    seconds = segment["start_seconds"]
+    if seconds is not None and segment["end_seconds"] is not None:
+        seconds = round(seconds + fraction * (segment["end_seconds"] - seconds), 1)
+    return {"snippet": snippet, "char_offset": char_offset, "seconds": seconds}
+
+
+def search_transcripts(query: str, limit: int = 20, hits_per_episode: int = 3) -> List[Dict]:
+    """
+    Episodes whose transcripts match *query*, best first, each with up to
+    *hits_per_episode* highlighted snippet hits in transcript order.
+    """
+    from .models import Episode, TranscriptSegment
+
+    if not tokenize(query):
+        return []
+
+    backend = get_search_backend()
+    ids = backend.ranked_ids(TranscriptSegment, query)
+    if ids is None:
+        ids = list(
+            backend.fallback_filter(TranscriptSegment.objects.all(), query)
+            .values_list("id", flat=True)[:_MAX_RESULTS]
+        )
+    if not ids:
+        return []
+
+    rows = {
+        str(row["id"]): row
+        for row in TranscriptSegment.objects.filter(id__in=ids).values(
+            "id", "episode_id", "position", "text",
+            "start_char", "end_char", "start_seconds", "end_seconds",
+        )
+    }
+
+    # Episodes ranked by their best segment; keep the top hits of each.
+    grouped: "OrderedDict[str, List[Dict]]" = OrderedDict()
+    for segment_id in ids:
+        row = rows.get(str(segment_id))
+        if row is None:
+            continue
+        hits = grouped.get(row["episode_id"])
+        if hits is None:
+            if len(grouped) >= limit:
+                continue
+            hits = grouped[row["episode_id"]] = []
+        if len(hits) < hits_per_episode:
+            hits.append(row)
+
+    # values() keeps the (large) transcript_content column out of the fetch.
+    episodes = {
+        row["id"]: row
+        for row in Episode.objects.filter(pk__in=list(grouped)).values(
+            "id", "title", "podcast_id", "podcast__title", "duration",
+        )
+    }
+    pattern = highlight_pattern(query)
+    results = []
+    for episode_id, segments in grouped.items():
+        episode = episodes.get(episode_id)
+        if episode is None:
+            continue
+        segments.sort(key=lambda row: row["position"])
+        results.append({
+            "episode_id": str(episode_id),
+            "episode_title": episode["title"],
+            "podcast_id": str(episode["podcast_id"]),
+            "podcast_title": episode["podcast__title"],
+            "duration": episode["duration"],
+            "hits": [make_hit(row, pattern) for row in segments],
+        })
+    return results
@@ -0,0 +1,279 @@
+"""
+content.trending
+~~~~~~~~~~~~~~~~
+Time-decayed trending scores for episodes and podcasts, kept in Redis
+sorted sets.
+
+Scoring
+-------
+Every engagement event adds ``weight × e^(λ·(t − epoch))`` to the member's
+score ("forward decay").  Because every score is scaled by the same
+``e^(−λ·(now − epoch))`` at read time, ranking by the stored value is the
+same as ranking by the exponentially-decayed value — so an event is a
+single ``ZINCRBY`` and nothing is ever re-scanned.  ``λ = ln 2 / half-life``.
+
+A periodic :meth:`TrendingEngine.rebase` multiplies every set by the
+accumulated decay and moves the epoch forward so stored scores never
+overflow.  The epoch is always "now" when it is first set (including by
+:meth:`TrendingEngine.reset`), never the time of the event being recorded,
+and events old enough to have decayed below ``_MIN_SCORE`` are dropped
+before they reach Redis — so re-seeding years of back-catalogue cannot
+push ``e^(λ·(t − epoch))`` to infinity.
+
+Keys::
+
+    podvault:trending:epoch                    ← unix time scores are relative to
+    podvault:trending:keys                     ← SET of every ranking key (for rebase)
+    podvault:trending:episodes:all             ← ZSET episode_id → score
+    podvault:trending:episodes:<category-slug>
+    podvault:trending:podcasts:all             ← ZSET podcast_id → score
+    podvault:trending:podcasts:<category-slug>
+
+Each set is trimmed to ``TRENDING_MAX_ENTRIES`` so a ranked page is
+``ZREVRANGE`` in O(log n + page size).
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from datetime import datetime
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+
+from podvault_api.redis_client import get_connection
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "podvault:trending"
+_EPOCH_KEY = f"{_KEY_PREFIX}:epoch"
+_REGISTRY_KEY = f"{_KEY_PREFIX}:keys"
+
+# Scores that decay below this are dropped during a rebase.
+_MIN_SCORE = 1e-6
+
+# KEYS[1] = epoch, KEYS[2] = registry, KEYS[3..] = ranking sets
+# ARGV[1] = event time, ARGV[2] = weight, ARGV[3] = λ, ARGV[4] = cap,
+# ARGV[5] = now, ARGV[6..] = member for each ranking set (parallel to KEYS[3..])
+_INCR_SCRIPT = """
+local epoch = tonumber(redis.call('GET', KEYS[1]))
+if not epoch then
+    epoch = tonumber(ARGV[5])
+    redis.call('SET', KEYS[1], ARGV[5])
+end
+local inc = tonumber(ARGV[2]) * math.exp(tonumber(ARGV[3]) * (tonumber(ARGV[1]) - epoch))
+local cap = tonumber(ARGV[4])
+for i = 3, #KEYS do
+    local member = ARGV[i + 3]
+    local score = tonumber(redis.call('ZINCRBY', KEYS[i], inc, member))
+    if score <= 0 then
+        redis.call('ZREM', KEYS[i], member)
+    end
+    if cap > 0 then
+        redis.call('ZREMRANGEBYRANK', KEYS[i], 0, -(cap + 1))
+    end
+    redis.call('SADD', KEYS[2], KEYS[i])
+end
+return tostring(inc)
+"""
+
+# KEYS[1] = epoch, KEYS[2] = registry; ARGV[1] = now, ARGV[2] = λ, ARGV[3] = min score
+_REBASE_SCRIPT = """
+local epoch = tonumber(redis.call('GET', KEYS[1]))
+local now = tonumber(ARGV[1])
+if not epoch then
+    redis.call('SET', KEYS[1], ARGV[1])
+    return 0
+end
+local factor = math.exp(-tonumber(ARGV[2]) * (now - epoch))
+local keys = redis.call('SMEMBERS', KEYS[2])
+for _, key in ipairs(keys) do
+    redis.call('ZUNIONSTORE', key, 1, key, 'WEIGHTS', factor)
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', ARGV[3])
+    if redis.call('EXISTS', key) == 0 then
+        redis.call('SREM', KEYS[2], key)
+    end
+end
+redis.call('SET', KEYS[1], ARGV[1])
+return #keys
+"""
+
+
+def decay_rate(half_life: float) -> float:
+    """Return λ for a given half-life in seconds."""
+    return math.log(2) / half_life
+
+
+def ranking_key(kind: str, category: Optional[str] = None) -> str:
+    """Redis key of the ``kind`` ('episodes' | 'podcasts') ranking for *category*."""
+    return f"{_KEY_PREFIX}:{kind}:{category or 'all'}"
+
+
+class TrendingEngine:
+    """
+    Incremental trending rankings.
+
+    All Redis failures are logged and swallowed: writes become no-ops and
+    reads return an empty list, so callers fall back to a DB ordering.
+    """
+
+    HALF_LIFE: float = getattr(settings, "TRENDING_HALF_LIFE", 48 * 3600)
+    MAX_ENTRIES: int = getattr(settings, "TRENDING_MAX_ENTRIES", 1000)
+
+    # Relative value of each engagement signal.
+    WEIGHTS = {
+        "play": 1.0,
+        "listen": 2.0,     # verified ListeningSession, scaled by completion
+        "like": 3.0,
+        "follow": 5.0,
+    }
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def record_episode_event(
+        self,
+        kind: str,
+        episode_id,
+        podcast_id,
+        category_slug: Optional[str] = None,
+        scale: float = 1.0,
+        at: Optional[datetime] = None,
+    ) -> None:
+        """
+        Credit an episode event to the episode *and* its podcast rankings.
+
+        Pass a negative *scale* with the original ``at`` to retract an event
+        (e.g. an unlike) at exactly the weight it was added with.
+        """
+        members = [
+            (ranking_key("episodes"), episode_id),
+            (ranking_key("podcasts"), podcast_id),
+        ]
+        if category_slug:
+            members += [
+                (ranking_key("episodes", category_slug), episode_id),
+                (ranking_key("podcasts", category_slug), podcast_id),
+            ]
+        self._incr(members, self.WEIGHTS[kind] * scale, at)
+
+    def record_podcast_event(
+        self,
+        kind: str,
+        podcast_id,
+        category_slug: Optional[str] = None,
+        scale: float = 1.0,
+        at: Optional[datetime] = None,
+    ) -> None:
+        """Credit a podcast-level event (e.g. a follow)."""
+        members = [(ranking_key("podcasts"), podcast_id)]
+        if category_slug:
+            members.append((ranking_key("podcasts", category_slug), podcast_id))
+        self._incr(members, self.WEIGHTS[kind] * scale, at)
+
+    def record_episode(self, kind: str, episode_id, scale: float = 1.0, at=None) -> None:
+        """Resolve the episode's podcast and category, then record the event."""
+        from content.models import Episode
+
+        row = (
+            Episode.objects.filter(pk=episode_id)
+            .values_list("podcast_id", "podcast__category__slug")
+            .first()
+        )
+        if row is not None:
+            self.record_episode_event(kind, episode_id, row[0], row[1], scale, at)
+
+    def record_podcast(self, kind: str, podcast_id, scale: float = 1.0, at=None) -> None:
+        """Resolve the podcast's category, then record the event."""
+        from content.models import Podcast
+
+        row = Podcast.objects.filter(pk=podcast_id).values_list("category__slug").first()
+        if row is not None:
+            self.record_podcast_event(kind, podcast_id, row[0], scale, at)
+
+    def rebase(self) -> int:
+        """Apply accumulated decay to every set and reset the epoch."""
+        conn = get_connection()
+        if conn is None:
+            return 0
+        try:
+            return int(
+                conn.eval(
+                    _REBASE_SCRIPT, 2, _EPOCH_KEY, _REGISTRY_KEY,
+                    time.time(), decay_rate(self.HALF_LIFE), _MIN_SCORE,
+                )
+            )
+        except Exception as exc:                                    # noqa: BLE001
+            logger.warning("[Trending] Rebase failed: %s", exc)
+            return 0
+
+    def reset(self) -> None:
+        """
+        Delete every ranking and pin the epoch to now (used by the
+        ``rebuild_trending`` command before it re-seeds).
+        """
+        conn = get_connection()
+        if conn is None:
+            return
+        try:
+            keys = list(conn.smembers(_REGISTRY_KEY))
+            conn.delete(_EPOCH_KEY, _REGISTRY_KEY, *keys)
+            conn.set(_EPOCH_KEY, time.time())
+        except Exception as exc:                                    # noqa: BLE001
+            logger.warning("[Trending] Reset failed: %s", exc)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def top_ids(
+        self,
+        kind: str,
+        category: Optional[str] = None,
+        start: int = 0,
+        stop: int = 19,
+    ) -> List[str]:
+        """
+        Return member IDs ranked ``start..stop`` (inclusive), best first.
+
+        :param kind: ``'episodes'`` or ``'podcasts'``.
+        """
+        conn = get_connection()
+        if conn is None:
+            return []
+        try:
+            raw = conn.zrevrange(ranking_key(kind, category), start, stop)
+        except Exception as exc:                                    # noqa: BLE001
+            logger.warning("[Trending] Read failed for %s/%s: %s", kind, category, exc)
+            return []
+        return [m.decode() if isinstance(m, bytes) else str(m) for m in raw]
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _incr(self, members: Iterable, weight: float, at: Optional[datetime]) -> None:
+        conn = get_connection()
+        if conn is None or not weight:
+            return
+        members = list(members)
+        now = time.time()
+        event_ts = min(at.timestamp(), now) if at else now
+        rate = decay_rate(self.HALF_LIFE)
+        if abs(weight) * math.exp(-rate * (now - event_ts)) < _MIN_SCORE:
+            # Already decayed out of every ranking; recording it would only
+            # risk overflowing the forward-decay factor.
+            return
+        try:
+            conn.eval(
+                _INCR_SCRIPT,
+                2 + len(members),
+                _EPOCH_KEY, _REGISTRY_KEY, *[key for key, _ in members],
+                event_ts, weight, rate, self.MAX_ENTRIES, now,
+                *[str(member) for _, member in members],
+            )
+        except Exception as exc:                                    # noqa: BLE001
+            logger.warning("[Trending] Score update failed: %s", exc)
@@ -1,7 +1,7 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import (
-    PodcastViewSet, FeedView, SearchView, EpisodeViewSet, CreatorViewSet, 
+    PodcastViewSet, CategoryViewSet, FeedView, SearchView, TranscriptSearchView, ViewerStateView, EpisodeViewSet, episode_audio, stream_audio, CreatorViewSet, 
     LikeViewSet, FollowViewSet, PlaylistViewSet, TipViewSet, 
     MerchandiseViewSet, CreatorSubscriptionViewSet
 )
@@ -11,6 +11,7 @@ from sync.views import ListeningSessionViewSet
 router = DefaultRouter()
 router.register(r'podcasts', PodcastViewSet)
 router.register(r'episodes', EpisodeViewSet)
+router.register(r'categories', CategoryViewSet)
 router.register(r'creators', CreatorViewSet)
 router.register(r'comments', CommentViewSet, basename='comments')
 router.register(r'user-activities', UserActivityViewSet, basename='user-activities')
@@ -26,5 +27,10 @@ router.register(r'listening-sessions', ListeningSessionViewSet)
 urlpatterns = [
     path('feed', FeedView.as_view(), name='feed'),
     path('search', SearchView.as_view(), name='search'),
+    path('transcripts/search', TranscriptSearchView.as_view(), name='transcript-search'),
+    path('viewer-state', ViewerStateView.as_view(), name='viewer-state'),
+    # Async streaming proxy; listed before the router so it owns /episodes/<pk>/audio/.
+    path('episodes/<uuid:pk>/audio/', episode_audio, name='episode-audio'),
+    path('stream/<uuid:pk>', stream_audio, name='stream'),
     path('', include(router.urls)),
 ]
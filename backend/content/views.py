@@ -1,21 +1,75 @@
 from rest_framework import viewsets, generics, filters, permissions
 from rest_framework.response import Response
 from rest_framework.decorators import action
-from django.db.models import Q
-from django.http import StreamingHttpResponse, HttpResponse, FileResponse
-from .models import Podcast, Episode, Category, Like, Follow, Playlist, Tip, Merchandise, CreatorSubscription
-from .serializers import PodcastSerializer, EpisodeSerializer, CategorySerializer, LikeSerializer, FollowSerializer, PlaylistSerializer, TipSerializer, MerchandiseSerializer, CreatorSubscriptionSerializer
-import requests
+from django.conf import settings
+from django.db.models import Count, IntegerField, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
+from django.core import signing
+from django.core.files.storage import default_storage
+from django.http import FileResponse, Http404, HttpResponseForbidden, HttpResponseRedirect
+from podvault_api.fastjson import FastJSONMixin
+from podvault_api.pagination import KeysetPagination
+from podvault_api.storage_backends import BunnyStorage
+from .models import Podcast, Episode, Category, Like, Follow, Playlist, Tip, Merchandise, CreatorSubscription, CreatorStats
+from .serializers import PodcastSerializer, PodcastDetailSerializer, PodcastCardSerializer, EpisodeSerializer, CategorySerializer, LikeSerializer, FollowSerializer, PlaylistSerializer, TipSerializer, MerchandiseSerializer, CreatorSubscriptionSerializer, CreatorSerializer
+from .services import FeedSnapshotService
+from .filters import TrendingOrderingFilter, FullTextSearchFilter
+from .search import get_search_backend
+from .trending import TrendingEngine
+from .plays import PlayCounter
+from .audio_proxy import proxy_audio
+from .audio_cache import AudioBlockCache
+from .streaming import read_stream_token, stream_token_response
+from .transcripts import search_transcripts
+from .fieldsets import SparseFieldsetMixin
+from .conditional import ConditionalGetMixin
+from .response_cache import ResponseCacheMixin
+from .viewer_state import parse_ids, viewer_state
 
-class PodcastViewSet(viewsets.ModelViewSet):
+
+def podcast_queryset(episodes=True, latest=None):
+    """
+    Podcasts with creator/category joined and slim nested episodes prefetched.
+
+    With *latest*, only the newest *latest* episodes of each podcast are
+    prefetched (one windowed query) into ``latest_episodes`` and
+    ``episode_count`` is annotated.
+    """
+    queryset = Podcast.objects.select_related('creator', 'category')
+    if latest is not None:
+        queryset = queryset.annotate(episode_count=Coalesce(Subquery(
+            Episode.objects.filter(podcast=OuterRef('pk')).order_by()
+            .values('podcast').annotate(n=Count('pk')).values('n'),
+            output_field=IntegerField(),
+        ), 0))
+    if not episodes:
+        return queryset
+    nested = Episode.objects.defer(*EpisodeSerializer.heavy_fields).prefetch_related('cast')
+    if latest is not None:
+        # A sliced prefetch needs to_attr: without it Django re-filters the
+        # slice for single-object fetches and retrieve() fails.
+        nested = nested.order_by(*EpisodeViewSet.cursor_ordering)[:latest]
+        return queryset.prefetch_related(Prefetch('episodes', queryset=nested, to_attr='latest_episodes'))
+    return queryset.prefetch_related(Prefetch('episodes', queryset=nested))
+
+class PodcastViewSet(ResponseCacheMixin, ConditionalGetMixin, FastJSONMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     queryset = Podcast.objects.all()
     serializer_class = PodcastSerializer
-    filter_backends = [filters.OrderingFilter, filters.SearchFilter] 
+    filter_backends = [TrendingOrderingFilter, FullTextSearchFilter]
+    trending_kind = 'podcasts'
+    trending_fallback = ['-subscriber_count', '-created_at']
     # Add DjangoFilterBackend if installed, or manual filtering in get_queryset.
     # Given the environment, I'll use manual filtering in get_queryset for simplicity and reliability without extra deps.
     
+    def get_serializer_class(self):
+        if self.action == 'retrieve':
+            return PodcastDetailSerializer
+        return super().get_serializer_class()
+
     def get_queryset(self):
-        queryset = super().get_queryset()
+        latest = settings.PODCAST_DETAIL_EPISODES if self.action == 'retrieve' else None
+        queryset = podcast_queryset(episodes=self.is_field_selected('episodes'), latest=latest)
+        queryset = self.apply_sparse_fieldset(queryset)
         category = self.request.query_params.get('category')
         if category:
             # Try matching by slug first (e.g. "news", "technology"),
@@ -26,153 +80,191 @@ class PodcastViewSet(viewsets.ModelViewSet):
             else:
                 queryset = queryset.filter(category__name__icontains=category)
 
-        
-        search = self.request.query_params.get('search')
-        if search:
-             print(f"DEBUG: Searching Podcast by: '{search}'")
-             queryset = queryset.filter(Q(title__icontains=search) | Q(description__icontains=search))
-             
+        # ?search= is handled by FullTextSearchFilter
         return queryset
 
 
 
     @action(detail=True, methods=['get'], url_path='stream-token')
     def stream_token(self, request, pk=None):
-        from django.core.signing import TimestampSigner
-        signer = TimestampSigner()
-        # Create a token valid for 2 hours (7200 seconds)
-        token = signer.sign(pk) # Sign the podcast/episode ID
-        # In a real scenario, you'd check this token in the stream view
-        return Response({
-            'token': token,
-            'expires_in': 7200,
-            'stream_url': f'/api/v1/content/stream/{pk}?token={token}' 
-        })
-
-class FeedView(generics.ListAPIView):
-    serializer_class = PodcastSerializer
+        # Accepts an episode ID, or a podcast ID (streams its newest episode).
+        episode = (
+            Episode.objects.filter(pk=pk).first()
+            or Episode.objects.filter(podcast_id=pk).order_by('-published_at').first()
+        )
+        if episode is None:
+            raise Http404
+        return Response(stream_token_response(episode))
+
+class CategoryViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = Category.objects.order_by('name')
+    serializer_class = CategorySerializer
+    permission_classes = [permissions.AllowAny]
+    pagination_class = None
+
+class FeedView(FastJSONMixin, generics.ListAPIView):
+    serializer_class = PodcastCardSerializer
 
     def get_queryset(self):
-        # Implementation for feed logic (recommendations etc)
-        # For now just return all
-        return Podcast.objects.all()
+        return Podcast.objects.select_related('creator', 'category')
 
     def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response({
-            'categories': CategorySerializer(Category.objects.all(), many=True).data,
-            'trending': serializer.data, # Simplified
-            'recommended': serializer.data # Simplified
-        })
-
-class SearchView(generics.ListAPIView):
+        # Served from the Redis snapshot maintained by FeedSnapshotService;
+        # the rebuild is triggered by content.signals on catalog writes.
+        return Response(FeedSnapshotService().get_snapshot())
+
+class SearchView(ResponseCacheMixin, SparseFieldsetMixin, generics.ListAPIView):
     serializer_class = PodcastSerializer
 
     def get_queryset(self):
         query = self.request.query_params.get('query', '')
-        return Podcast.objects.filter(Q(title__icontains=query) | Q(description__icontains=query))
+        podcasts = self.apply_sparse_fieldset(podcast_queryset(episodes=self.is_field_selected('episodes')))
+        if not query.strip():
+            return podcasts
+        return get_search_backend().filter(podcasts, query)
+
+async def episode_audio(request, pk):
+    """
+    GET /episodes/<pk>/audio/
+
+    Serves the uploaded file, or streams the external enclosure through
+    the block cache in content.audio_cache / content.audio_proxy (avoids
+    CORS on the frontend; Range supported for seeking).  A plain async view rather than a DRF action so the upstream
+    stream is relayed on the event loop.
+    """
+    try:
+        episode = await Episode.objects.only('id', 'audio_file', 'audio_url').aget(pk=pk)
+    except Episode.DoesNotExist:
+        raise Http404
+
+    # 1. Serve local file if available
+    if episode.audio_file:
+        response = FileResponse(episode.audio_file.open('rb'))
+        response['Content-Type'] = 'audio/mpeg' # Adjust based on file type if needed
+        response['Access-Control-Allow-Origin'] = '*'
+        return response
+
+    # 2. Proxy external URL
+    audio_url = episode.audio_url
+    if not audio_url:
+        # Fallback for demo purposes if no URL exists
+        audio_url = 'https://www.soundhelix.com/examples/mp3/SoundHelix-Song-1.mp3'
+    if getattr(settings, 'AUDIO_CACHE_ENABLED', True):
+        return await AudioBlockCache().serve(request, audio_url)
+    return await proxy_audio(request, audio_url)
+
+
+async def stream_audio(request, pk):
+    """
+    GET /stream/<pk>?token=...
+
+    Verifies the signed token from ``stream-token`` (no DB hit: the token
+    carries the audio location).  Bunny-stored files redirect to a signed
+    pull-zone URL so the CDN serves the bytes.
+    """
+    try:
+        payload = read_stream_token(request.GET.get('token', ''), pk)
+    except signing.BadSignature:
+        return HttpResponseForbidden("Invalid or expired stream token")
+
+    if payload['f']:
+        if isinstance(default_storage, BunnyStorage):
+            return HttpResponseRedirect(
+                default_storage.signed_url(payload['f'], getattr(settings, 'BUNNY_SIGNED_URL_TTL', 3600))
+            )
+        response = FileResponse(default_storage.open(payload['f'], 'rb'), content_type='audio/mpeg')
+        response['Access-Control-Allow-Origin'] = '*'
+        return response
+    if not payload['u']:
+        raise Http404
+    if getattr(settings, 'AUDIO_CACHE_ENABLED', True):
+        return await AudioBlockCache().serve(request, payload['u'])
+    return await proxy_audio(request, payload['u'])
+
+
+class TranscriptSearchView(generics.GenericAPIView):
+    """
+    GET /transcripts/search?query=...&limit=20
+
+    Episodes whose transcripts mention the query, each with highlighted
+    snippets and the character / second offset of every hit.
+    """
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request):
+        query = request.query_params.get('query', '').strip()
+        try:
+            limit = max(1, min(int(request.query_params.get('limit', 20)), 50))
+        except ValueError:
+            limit = 20
+        results = search_transcripts(query, limit=limit) if query else []
+        return Response({'query': query, 'count': len(results), 'results': results})
 
-class EpisodeViewSet(viewsets.ReadOnlyModelViewSet):
+class ViewerStateView(generics.GenericAPIView):
+    """
+    GET  /viewer-state?episodes=<id>,<id>&podcasts=<id>,<id>
+    POST /viewer-state  {"episodes": [...], "podcasts": [...]}
+
+    Liked / followed / progress / playlist membership for the current user,
+    one query per relation for the whole page (see content.viewer_state).
+    """
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request):
+        return self.respond(request.query_params.get('episodes'), request.query_params.get('podcasts'))
+
+    def post(self, request):
+        if not isinstance(request.data, dict):
+            return Response({'error': 'expected a JSON object with "episodes" and/or "podcasts"'}, status=400)
+        return self.respond(request.data.get('episodes'), request.data.get('podcasts'))
+
+    def respond(self, episodes, podcasts):
+        try:
+            episode_ids, podcast_ids = parse_ids(episodes), parse_ids(podcasts)
+        except (TypeError, ValueError) as exc:
+            return Response({'error': str(exc)}, status=400)
+        return Response(viewer_state(self.request.user, episode_ids, podcast_ids))
+
+class EpisodeViewSet(ResponseCacheMixin, ConditionalGetMixin, FastJSONMixin, SparseFieldsetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Episode.objects.all()
     serializer_class = EpisodeSerializer
-    filter_backends = [filters.OrderingFilter, filters.SearchFilter]
+    filter_backends = [TrendingOrderingFilter, FullTextSearchFilter]
     ordering_fields = ['published_at', 'title', 'duration']
     ordering = ['-published_at']
-    search_fields = ['title', 'description']
+    trending_kind = 'episodes'
+    trending_fallback = ['-plays', '-published_at']
+    pagination_class = KeysetPagination
+    cursor_ordering = ('-published_at', '-id')
 
     def get_queryset(self):
-        queryset = super().get_queryset()
+        queryset = self.apply_sparse_fieldset(super().get_queryset())
+        if self.is_field_selected('cast'):
+            queryset = queryset.prefetch_related('cast')
         podcast_id = self.request.query_params.get('podcast_id')
         if podcast_id:
             queryset = queryset.filter(podcast_id=podcast_id)
+        category = self.request.query_params.get('category')
+        if category:
+            queryset = queryset.filter(podcast__category__slug__iexact=category)
         return queryset
 
     @action(detail=True, methods=['post'], url_path='record-play', permission_classes=[permissions.AllowAny])
     def record_play(self, request, pk=None):
         episode = self.get_object()
-        episode.plays += 1
-        episode.save()
-
-        # Monetization Logic (Simple Mock: 0.50 KES per play)
-        # Only credit if the podcast has a creator
-        if episode.podcast and episode.podcast.creator:
-             from payouts.models import Wallet, PayoutTransaction
-             wallet, _ = Wallet.objects.get_or_create(user=episode.podcast.creator)
-             
-             # Credit Wallet
-             earnings = 0.50
-             wallet.balance = float(wallet.balance) + earnings
-             wallet.save()
-             
-             # Log Transaction (Optional: concise log or aggregate later)
-             # For now, we won't log every micro-transaction to DB to save space, 
-             # or we can just log it. Let's log it for demo visibility.
-             PayoutTransaction.objects.create(
-                 user=episode.podcast.creator,
-                 amount=earnings,
-                 transaction_type='DEPOSIT',
-                 status='COMPLETED',
-                 description=f"Play Revenue: {episode.title}"
-             )
-
-        return Response({'status': 'played', 'plays': episode.plays})
-
-    @action(detail=True, methods=['get'], url_path='audio', permission_classes=[permissions.AllowAny])
-    def audio_stream(self, request, pk=None):
-        """
-        Proxies the audio file to avoid CORS issues on the frontend.
-        Supports Range requests for seeking.
-        """
-        episode = self.get_object()
-        
-        # 1. Serve local file if available
-        if episode.audio_file:
-            response = FileResponse(episode.audio_file.open('rb'))
-            response['Content-Type'] = 'audio/mpeg' # Adjust based on file type if needed
-            response['Access-Control-Allow-Origin'] = '*'
-            return response
-
-        # 2. Proxy external URL
-        audio_url = episode.audio_url
-        if not audio_url:
-            # Fallback for demo purposes if no URL exists
-            audio_url = 'https://www.soundhelix.com/examples/mp3/SoundHelix-Song-1.mp3'
-        
-        
-        try:
-            # Forward Range header for seeking
-            headers = {}
-            range_header = request.META.get('HTTP_RANGE')
-            if range_header:
-                headers['Range'] = range_header
-
-            # Buffer the content to avoid streaming issues with ASGI/Daphne
-            # Note: For large files this consumes memory, but improves stability for short clips/proxies
-            external_response = requests.get(audio_url, headers=headers, stream=False, timeout=20)
-            
-            response = HttpResponse(
-                external_response.content,
-                content_type=external_response.headers.get('Content-Type', 'audio/mpeg'),
-                status=external_response.status_code
-            )
-            
-            # Forward relevant headers
-            for header in ['Content-Length', 'Accept-Ranges', 'Content-Range']:
-                if header in external_response.headers:
-                    response[header] = external_response.headers[header]
-            
-            # Forward relevant headers
-            for header in ['Content-Length', 'Accept-Ranges', 'Content-Range']:
-                if header in external_response.headers:
-                    response[header] = external_response.headers[header]
-            
-            response['Access-Control-Allow-Origin'] = '*'
-            return response
+        # Buffered in Redis and flushed to Episode.plays by content.tasks.flush_play_counts.
+        plays = PlayCounter().incr(episode.pk, episode.plays)
+        TrendingEngine().record_episode('play', episode.pk)
+
+        # Monetization: appended to the play revenue ledger and settled into
+        # the creator's wallet by payouts.tasks.rollup_play_revenue.
+        from payouts.services import PlayRevenueLedger
+        PlayRevenueLedger().record(episode.podcast.creator_id)
+
+        return Response({'status': 'played', 'plays': plays})
 
-        except Exception as e:
-            print(f"Proxy error: {e}")
-            return HttpResponse("Error fetching audio", status=502)
+    @action(detail=True, methods=['get'], url_path='stream-token')
+    def stream_token(self, request, pk=None):
+        return Response(stream_token_response(self.get_object()))
 
     @action(detail=True, methods=['post'], url_path='generate-summary', permission_classes=[permissions.AllowAny])
     def generate_summary(self, request, pk=None):
@@ -192,18 +284,18 @@ class EpisodeViewSet(viewsets.ReadOnlyModelViewSet):
         
         return Response({'error': 'Failed to generate summary'}, status=500)
 
-from django.contrib.auth import get_user_model
-from .serializers import UserSerializer # Need to ensure this exists or use a simple one
-
 class CreatorViewSet(viewsets.ReadOnlyModelViewSet):
-    # Returns users who are creators (have podcasts)
-    queryset = get_user_model().objects.filter(podcasts__isnull=False).distinct()
-    serializer_class = UserSerializer
+    # Served from the CreatorStats read model kept current by content.creator_stats.
+    queryset = CreatorStats.objects.filter(podcast_count__gt=0).select_related('user')
+    serializer_class = CreatorSerializer
     filter_backends = [filters.OrderingFilter, filters.SearchFilter]
+    ordering_fields = ['username', 'podcast_count', 'episode_count', 'total_plays',
+                       'follower_count', 'tips_received', 'active_subscriptions']
+    ordering = ['username']
     search_fields = ['username']
 class LikeViewSet(viewsets.ModelViewSet):
     """ViewSet for managing user likes on episodes"""
-    queryset = Like.objects.all()
+    queryset = Like.objects.select_related('user', 'episode')
     serializer_class = LikeSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     filter_backends = [filters.OrderingFilter]
@@ -235,7 +327,7 @@ class LikeViewSet(viewsets.ModelViewSet):
 
 class FollowViewSet(viewsets.ModelViewSet):
     """ViewSet for managing user follows on podcasts"""
-    queryset = Follow.objects.all()
+    queryset = Follow.objects.select_related('user', 'podcast')
     serializer_class = FollowSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     filter_backends = [filters.OrderingFilter]
@@ -266,7 +358,9 @@ class FollowViewSet(viewsets.ModelViewSet):
 
 class PlaylistViewSet(viewsets.ModelViewSet):
     """ViewSet for managing user playlists"""
-    queryset = Playlist.objects.all()
+    queryset = Playlist.objects.select_related('user').prefetch_related(
+        Prefetch('episodes', queryset=Episode.objects.only('id'))
+    ).annotate(episode_count=Count('episodes', distinct=True))
     serializer_class = PlaylistSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     filter_backends = [filters.OrderingFilter, filters.SearchFilter]
@@ -289,7 +383,7 @@ class PlaylistViewSet(viewsets.ModelViewSet):
 
 class TipViewSet(viewsets.ModelViewSet):
     """ViewSet for managing supporter tips"""
-    queryset = Tip.objects.all()
+    queryset = Tip.objects.select_related('sender', 'recipient', 'episode')
     serializer_class = TipSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     filter_backends = [filters.OrderingFilter]
@@ -313,7 +407,7 @@ class TipViewSet(viewsets.ModelViewSet):
 
 class MerchandiseViewSet(viewsets.ModelViewSet):
     """ViewSet for managing creator merchandise"""
-    queryset = Merchandise.objects.all()
+    queryset = Merchandise.objects.select_related('creator')
     serializer_class = MerchandiseSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     filter_backends = [filters.OrderingFilter, filters.SearchFilter]
@@ -334,7 +428,7 @@ class MerchandiseViewSet(viewsets.ModelViewSet):
 
 class CreatorSubscriptionViewSet(viewsets.ModelViewSet):
     """ViewSet for managing creator subscriptions"""
-    queryset = CreatorSubscription.objects.all()
+    queryset = CreatorSubscription.objects.select_related('creator', 'subscriber')
     serializer_class = CreatorSubscriptionSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     filter_backends = [filters.OrderingFilter]
@@ -117,6 +117,10 @@ class PodcastIngestionService:
         if episodes_to_create:
             Episode.objects.bulk_create(episodes_to_create, ignore_conflicts=True)
             logger.info(f"Created {len(episodes_to_create)} episodes for {podcast.title}")
+            if podcast.creator_id:
+                # bulk_create skips the per-episode stats signal; recount this creator.
+                from content import creator_stats
+                creator_stats.refresh([podcast.creator_id])
 
         if episodes_to_update:
             Episode.objects.bulk_update(episodes_to_update, fields=[
@@ -124,3 +128,10 @@ class PodcastIngestionService:
                 'guid', 'transcript_url', 'chapters_url', 'value', 'season_number', 'episode_number'
             ])
             logger.info(f"Updated {len(episodes_to_update)} episodes for {podcast.title}")
+
+        if episodes_to_create or episodes_to_update:
+            # Bulk writes bypass post_save, so refresh the feed snapshot explicitly.
+            from content.generation import bump_generation
+            from content.services import FeedSnapshotService
+            transaction.on_commit(FeedSnapshotService.schedule_rebuild)
+            bump_generation()
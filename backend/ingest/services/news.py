@@ -1,8 +1,9 @@
-import requests
 from django.conf import settings
 from datetime import datetime
 import logging
 
+from podvault_api import http_client
+
 logger = logging.getLogger(__name__)
 
 class NewsIngestionService:
@@ -30,7 +31,7 @@ class NewsIngestionService:
         """Fetches from Spaceflight News API (Public)."""
         try:
             url = "https://api.spaceflightnewsapi.net/v4/articles/"
-            response = requests.get(url, params={"limit": limit, "ordering": "-published_at"})
+            response = http_client.get(url, params={"limit": limit, "ordering": "-published_at"})
             response.raise_for_status()
             data = response.json()
             
@@ -66,7 +67,7 @@ class NewsIngestionService:
                 'languages': 'en',
                 'limit': limit
             }
-            response = requests.get(url, params=params)
+            response = http_client.get(url, params=params)
             response.raise_for_status()
             data = response.json()
             
@@ -117,7 +118,7 @@ class NewsIngestionService:
                 "terms": "podcast", 
                 "rows": 5
             }
-            response = requests.get(url, params=params)
+            response = http_client.get(url, params=params)
             # if 404/error, just return empty list gracefully
             if response.status_code != 200:
                 logger.warning(f"LOC extraction failed with status {response.status_code}")
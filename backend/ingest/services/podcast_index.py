@@ -5,6 +5,8 @@ import requests
 import json
 from django.conf import settings
 
+from podvault_api import http_client
+
 class PodcastIndexClient:
     def __init__(self):
         self.api_key = settings.PODCAST_INDEX_KEY
@@ -45,7 +47,7 @@ class PodcastIndexClient:
         url = f"{self.base_url}/search/byterm"
         params = {'q': term}
         try:
-            response = requests.get(url, headers=self._get_auth_headers(), params=params)
+            response = http_client.get(url, headers=self._get_auth_headers(), params=params)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -69,7 +71,7 @@ class PodcastIndexClient:
         """
         url = f"{self.base_url}/podcasts/trending"
         try:
-            response = requests.get(url, headers=self._get_auth_headers())
+            response = http_client.get(url, headers=self._get_auth_headers())
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -83,7 +85,7 @@ class PodcastIndexClient:
         url = f"{self.base_url}/podcasts/byfeedid"
         params = {'id': feed_id}
         try:
-            response = requests.get(url, headers=self._get_auth_headers(), params=params)
+            response = http_client.get(url, headers=self._get_auth_headers(), params=params)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -97,7 +99,7 @@ class PodcastIndexClient:
         url = f"{self.base_url}/episodes/byfeedid"
         params = {'id': feed_id, 'max': max_results}
         try:
-            response = requests.get(url, headers=self._get_auth_headers(), params=params)
+            response = http_client.get(url, headers=self._get_auth_headers(), params=params)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
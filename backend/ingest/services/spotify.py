@@ -1,8 +1,14 @@
-import requests
 import base64
 import time
 from django.conf import settings
 
+from podvault_api import http_client
+
+# Spotify answers bursts with 429 + Retry-After; honour it a few times, then give up.
+_API_RETRY = http_client.RetryPolicy(
+    attempts=3, max_backoff=30.0, statuses=frozenset({429, 502, 503, 504}),
+)
+
 class SpotifyService:
     """
     Service to interact with Spotify Web API.
@@ -62,7 +68,7 @@ class SpotifyService:
         }
         data = {'grant_type': 'client_credentials'}
 
-        response = requests.post(self.TOKEN_URL, headers=headers, data=data)
+        response = http_client.post(self.TOKEN_URL, headers=headers, data=data)
         response.raise_for_status()
         
         token_data = response.json()
@@ -85,7 +91,7 @@ class SpotifyService:
         }
         
         try:
-            response = requests.post(self.TOKEN_URL, headers=headers, data=data)
+            response = http_client.post(self.TOKEN_URL, headers=headers, data=data)
             response.raise_for_status()
             token_data = response.json()
             
@@ -141,14 +147,7 @@ class SpotifyService:
         headers = {'Authorization': f'Bearer {token}'}
         url = f"{self.API_BASE_URL}/{endpoint}"
 
-        response = requests.request(method, url, headers=headers, params=params)
-        
-        if response.status_code == 429:
-            retry_after = int(response.headers.get('Retry-After', 5))
-            print(f"Rate limited. Retrying after {retry_after} seconds.")
-            time.sleep(retry_after)
-            return self._request(endpoint, method, params)
-            
+        response = http_client.request(method, url, headers=headers, params=params, retry=_API_RETRY)
         response.raise_for_status()
         return response.json()
 
@@ -82,6 +82,10 @@ def transcribe_episode_task(episode_id):
 
             episode.transcript_content = transcript
             episode.save()
+
+            # Make the new transcript searchable (content.transcripts).
+            from content.transcripts import index_episode
+            index_episode(episode)
             
             return f"Successfully transcribed: {episode.title}"
 
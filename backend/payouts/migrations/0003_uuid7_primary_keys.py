@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+import podvault_api.ids
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payouts', '0002_playrevenueentry'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='payouttransaction',
+            name='id',
+            field=models.UUIDField(default=podvault_api.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -1,6 +1,6 @@
 from django.db import models
 from django.conf import settings
-import uuid
+from podvault_api.ids import uuid7
 
 class Wallet(models.Model):
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='wallet')
@@ -23,7 +23,7 @@ class PayoutTransaction(models.Model):
         ('FAILED', 'Failed'),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='transactions')
     amount = models.DecimalField(max_digits=10, decimal_places=2)
     transaction_type = models.CharField(max_length=20, choices=TRANSACTION_TYPES)
@@ -35,3 +35,16 @@ class PayoutTransaction(models.Model):
     def __str__(self):
         return f"{self.transaction_type} - {self.amount} - {self.status}"
 
+
+class PlayRevenueEntry(models.Model):
+    """
+    Append-only ledger of per-play earnings.  Rows are insert-only (no
+    wallet lock on the play path) and are folded into one DEPOSIT per
+    creator by payouts.services.PlayRevenueLedger.rollup().
+    """
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='play_revenue')
+    amount = models.DecimalField(max_digits=10, decimal_places=2)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.amount} to {self.user_id}"
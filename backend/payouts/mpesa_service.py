@@ -1,8 +1,9 @@
-import requests
 from django.conf import settings
 import base64
 from datetime import datetime
 
+from podvault_api import http_client
+
 class MpesaPayoutService:
     """Handles disbursements from PodVault to Creators via M-Pesa B2C."""
     
@@ -27,7 +28,7 @@ class MpesaPayoutService:
             
         url = f"{self.base_url}/oauth/v1/generate?grant_type=client_credentials"
         try:
-            r = requests.get(url, auth=(self.consumer_key, self.consumer_secret))
+            r = http_client.get(url, auth=(self.consumer_key, self.consumer_secret))
             r.raise_for_status()
             return r.json().get('access_token')
         except Exception as e:
@@ -65,7 +66,11 @@ class MpesaPayoutService:
 
         try:
             print(f"[MpesaPayoutService] Triggering B2C payout of {amount} to {phone}")
-            response = requests.post(f"{self.base_url}/mpesa/b2c/v1/paymentrequest", json=payload, headers=headers)
+            # Never retried: a repeated B2C request can pay the creator twice.
+            response = http_client.post(
+                f"{self.base_url}/mpesa/b2c/v1/paymentrequest",
+                json=payload, headers=headers, retry=http_client.NO_RETRY,
+            )
             response.raise_for_status()
             return response.json()
         except Exception as e:
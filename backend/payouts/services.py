@@ -0,0 +1,113 @@
+"""
+payouts.services
+~~~~~~~~~~~~~~~~
+Play revenue ledger.
+
+Every counted play used to lock and rewrite the creator's ``Wallet`` (with
+float arithmetic) and insert a ``PayoutTransaction``.  Plays now append a
+narrow :class:`~payouts.models.PlayRevenueEntry` row — an INSERT with no
+row lock — and :meth:`PlayRevenueLedger.rollup` (beat task
+``payouts.tasks.rollup_play_revenue``) periodically folds the ledger into:
+
+* one ``DEPOSIT`` ``PayoutTransaction`` per creator per period, and
+* one ``UPDATE wallet SET balance = balance + total`` per creator,
+
+then deletes exactly the entries it settled, all in a single transaction.
+The entries are read once under ``SELECT … FOR UPDATE`` and both the sums
+and the DELETE work from that id list, so a play committed mid-rollup is
+neither paid without being deleted nor deleted without being paid.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from collections import defaultdict
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+
+from podvault_api.redis_client import release_cache_lock
+
+from .models import PayoutTransaction, PlayRevenueEntry, Wallet
+
+logger = logging.getLogger(__name__)
+
+
+class PlayRevenueLedger:
+    """Append per-play earnings; settle them into wallets in bulk."""
+
+    RATE_PER_PLAY: Decimal = Decimal(str(getattr(settings, "PLAY_REVENUE_PER_PLAY", "0.50")))
+    LOCK_KEY = "payouts:play-revenue-rollup"
+    LOCK_TTL = 600
+    DELETE_BATCH = 500   # ids per DELETE — under SQLite's bound-parameter limit
+
+    def record(self, creator_id, plays: int = 1) -> None:
+        """Append the earnings of *plays* plays for *creator_id*."""
+        if creator_id is None or plays <= 0:
+            return
+        PlayRevenueEntry.objects.create(user_id=creator_id, amount=self.RATE_PER_PLAY * plays)
+
+    def rollup(self) -> int:
+        """
+        Settle every ledger entry written so far.
+
+        Only the entries locked by the rollup's single read are settled and
+        deleted; plays committed afterwards are left for the next period.  A
+        cache lock keeps two workers from settling the same rows, and is
+        released only by the worker that took it.
+
+        :returns: Number of creators credited.
+        """
+        token = uuid.uuid4().hex
+        if not cache.add(self.LOCK_KEY, token, self.LOCK_TTL):
+            logger.info("[PlayRevenue] Rollup already running — skipped.")
+            return 0
+        try:
+            return self._rollup()
+        finally:
+            release_cache_lock(self.LOCK_KEY, token)
+
+    def _rollup(self) -> int:
+        with transaction.atomic():
+            rows = list(
+                PlayRevenueEntry.objects.select_for_update()
+                .order_by("id")
+                .values_list("id", "user_id", "amount")
+            )
+            if not rows:
+                return 0
+            sums = defaultdict(lambda: [Decimal("0"), 0])
+            for _, user_id, amount in rows:
+                sums[user_id][0] += amount
+                sums[user_id][1] += 1
+            totals = [
+                {"user_id": user_id, "total": total, "plays": plays}
+                for user_id, (total, plays) in sorted(sums.items())
+            ]
+
+            PayoutTransaction.objects.bulk_create([
+                PayoutTransaction(
+                    user_id=row["user_id"],
+                    amount=row["total"],
+                    transaction_type="DEPOSIT",
+                    status="COMPLETED",
+                    description=f"Play Revenue: {row['plays']} plays",
+                )
+                for row in totals
+            ])
+            for row in totals:
+                updated = Wallet.objects.filter(user_id=row["user_id"]).update(
+                    balance=F("balance") + row["total"]
+                )
+                if not updated:
+                    Wallet.objects.create(user_id=row["user_id"], balance=row["total"])
+            ids = [row[0] for row in rows]
+            for start in range(0, len(ids), self.DELETE_BATCH):
+                PlayRevenueEntry.objects.filter(id__in=ids[start:start + self.DELETE_BATCH]).delete()
+
+        logger.info("[PlayRevenue] Settled play revenue for %d creator(s).", len(totals))
+        return len(totals)
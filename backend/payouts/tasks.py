@@ -0,0 +1,31 @@
+"""
+payouts.tasks
+~~~~~~~~~~~~~
+Celery background tasks for creator payouts.
+
+``rollup_play_revenue``
+    Folds the play revenue ledger into one DEPOSIT and one wallet update
+    per creator (see :mod:`payouts.services`).
+"""
+
+from __future__ import annotations
+
+import logging
+
+from celery import shared_task
+
+from payouts.services import PlayRevenueLedger
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    name="payouts.tasks.rollup_play_revenue",
+    acks_late=True,
+    ignore_result=True,
+)
+def rollup_play_revenue() -> None:
+    """Background task: settle accumulated play revenue into wallets."""
+    credited = PlayRevenueLedger().rollup()
+    if credited:
+        logger.info("[rollup_play_revenue] ✓ Credited %d creator(s).", credited)
@@ -1,3 +1,86 @@
-from django.test import TestCase
+"""
+payouts.tests
+~~~~~~~~~~~~~
+Unit tests for creator payouts.
 
-# Create your tests here.
+Run with::
+
+    python manage.py test payouts --verbosity=2
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from content.models import Episode, Podcast
+from payouts.models import PayoutTransaction, PlayRevenueEntry, Wallet
+from payouts.services import PlayRevenueLedger
+
+_LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=_LOCMEM_CACHE)
+class TestPlayRevenueLedger(TestCase):
+
+    def setUp(self):
+        User = get_user_model()
+        self.creator = User.objects.create_user(username="host", password="x")
+        self.other = User.objects.create_user(username="guest", password="x")
+        podcast = Podcast.objects.create(title="Vault Cast", creator=self.creator)
+        self.episode = Episode.objects.create(podcast=podcast, title="Ep 1")
+
+    def test_plays_append_to_ledger_without_touching_wallet(self):
+        for _ in range(3):
+            self.client.post(f"/api/episodes/{self.episode.pk}/record-play/")
+
+        self.assertEqual(PlayRevenueEntry.objects.filter(user=self.creator).count(), 3)
+        self.assertEqual(PayoutTransaction.objects.count(), 0)
+        self.assertEqual(Wallet.objects.get(user=self.creator).balance, Decimal("0.00"))
+
+    def test_rollup_writes_one_deposit_per_creator(self):
+        ledger = PlayRevenueLedger()
+        for _ in range(4):
+            ledger.record(self.creator.pk)
+        ledger.record(self.other.pk, plays=2)
+
+        self.assertEqual(ledger.rollup(), 2)
+
+        deposit = PayoutTransaction.objects.get(user=self.creator)
+        self.assertEqual((deposit.transaction_type, deposit.amount), ("DEPOSIT", Decimal("2.00")))
+        self.assertEqual(Wallet.objects.get(user=self.creator).balance, Decimal("2.00"))
+        self.assertEqual(Wallet.objects.get(user=self.other).balance, Decimal("1.00"))
+        self.assertFalse(PlayRevenueEntry.objects.exists())
+        self.assertEqual(ledger.rollup(), 0)
+
+    def test_rollup_settles_exactly_the_rows_it_read(self):
+        ledger = PlayRevenueLedger()
+        ledger.record(self.creator.pk, plays=3)
+        original = PlayRevenueEntry.objects.filter
+
+        def late_play(*args, **kwargs):
+            # A play lands between the read and the DELETE.
+            if "id__in" in kwargs and not original(user=self.other).exists():
+                PlayRevenueEntry.objects.create(user=self.other, amount=Decimal("0.50"))
+            return original(*args, **kwargs)
+
+        with patch.object(PlayRevenueEntry.objects, "filter", side_effect=late_play):
+            self.assertEqual(ledger.rollup(), 1)
+
+        self.assertEqual(Wallet.objects.get(user=self.creator).balance, Decimal("1.50"))
+        self.assertEqual(list(PlayRevenueEntry.objects.values_list("user_id", flat=True)), [self.other.pk])
+
+    def test_rollup_never_releases_another_workers_lock(self):
+        from django.core.cache import cache
+        cache.set(PlayRevenueLedger.LOCK_KEY, "other-worker", 60)
+        self.addCleanup(cache.delete, PlayRevenueLedger.LOCK_KEY)
+        ledger = PlayRevenueLedger()
+        ledger.record(self.creator.pk)
+
+        self.assertEqual(ledger.rollup(), 0)
+
+        self.assertEqual(cache.get(PlayRevenueLedger.LOCK_KEY), "other-worker")
+        self.assertTrue(PlayRevenueEntry.objects.exists())
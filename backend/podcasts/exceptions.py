@@ -44,6 +44,14 @@ class QuotaExhausted(ProviderError):
     """
 
 
+class FetchPending(ProviderError):
+    """
+    Raised when another caller is still fetching the same cold key after
+    ``PODCAST_COALESCE_WAIT``; the client should retry shortly rather than
+    start a second upstream fetch.
+    """
+
+
 class ProviderUnavailable(ProviderError):
     """
     Raised for unexpected provider outages — network errors, 5xx responses,
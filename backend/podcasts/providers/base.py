@@ -14,6 +14,8 @@ from abc import ABC, abstractmethod
 from dataclasses import asdict, dataclass, field
 from typing import Any, Dict, List, Optional
 
+from asgiref.sync import sync_to_async
+
 
 @dataclass
 class NormalizedPodcast:
@@ -68,6 +70,11 @@ class PodcastProvider(ABC):
     :meth:`get_by_id`.  All public methods must return
     :class:`NormalizedPodcast` instances so the service layer stays
     provider-agnostic.
+
+    :meth:`asearch` / :meth:`aget_by_id` are the coroutine forms used by the
+    ASGI views.  The defaults run the sync method on a worker thread;
+    providers override them with native async I/O so an in-flight call
+    holds a socket, not a thread.
     """
 
     # Subclasses should set this to their short name, e.g. "itunes"
@@ -95,3 +102,13 @@ class PodcastProvider(ABC):
         :returns: Normalised podcast or ``None`` if not found.
         :raises ProviderError: On any provider-side failure.
         """
+
+    async def asearch(
+        self, query: str, limit: int = 20
+    ) -> List[NormalizedPodcast]:
+        """Async :meth:`search`."""
+        return await sync_to_async(self.search, thread_sensitive=False)(query, limit=limit)
+
+    async def aget_by_id(self, provider_id: str) -> Optional[NormalizedPodcast]:
+        """Async :meth:`get_by_id`."""
+        return await sync_to_async(self.get_by_id, thread_sensitive=False)(provider_id)
@@ -6,9 +6,11 @@ iTunes Search API provider.
 iTunes is a public, no-auth API that supports broad podcast searches.
 It is used as the primary source for base podcast metadata.
 
-Rate limit: 20 requests per minute (enforced by a shared RateLimiter).
-Retry strategy: exponential back-off (sleep 2^attempt s) for up to 3
-retries on HTTP 429.
+Rate limit: 20 requests per minute across all processes (the "itunes"
+entry of ``PROVIDER_RATE_LIMITS``, enforced by a Redis-backed RateLimiter).
+Retry strategy: jittered exponential back-off (up to 2^attempt s, or the
+server's ``Retry-After``) for up to 3 retries on HTTP 429; connection
+errors and 5xx are retried by :mod:`podvault_api.http_client`.
 
 Reference:
     https://developer.apple.com/library/archive/documentation/AudioVideo/Conceptual/iTuneSearchAPI/
@@ -16,26 +18,31 @@ Reference:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from typing import Any, Dict, List, Optional
 
+import httpx
 import requests
 
 from podcasts.exceptions import ProviderUnavailable, RateLimitExceeded
 from podcasts.rate_limiter import RateLimiter
+from podvault_api import http_client
 
 from .base import NormalizedPodcast, PodcastProvider
 
 logger = logging.getLogger(__name__)
 
-# Module-level singleton — shared across all ITunesProvider instances so
-# the 20 req/min budget is respected regardless of how many views are
-# served concurrently.
-_rate_limiter = RateLimiter(max_calls=20, period=60.0)
+# Module-level singleton over a Redis bucket — the 20 req/min budget holds
+# across every Daphne and Celery process, not just this one.
+_rate_limiter = RateLimiter.for_provider("itunes") or RateLimiter(max_calls=20, period=60.0, name="itunes")
 
 _MAX_RETRIES = 3
-_BASE_BACKOFF = 2  # seconds (doubles each retry: 2 → 4 → 8)
+_BASE_BACKOFF = 2  # seconds (cap doubles each retry: 2 → 4 → 8)
+_RATE_LIMIT_RETRY = http_client.RetryPolicy(
+    attempts=_MAX_RETRIES, backoff=_BASE_BACKOFF, max_backoff=16.0, statuses=frozenset({429}),
+)
 
 
 class ITunesProvider(PodcastProvider):
@@ -69,31 +76,49 @@ class ITunesProvider(PodcastProvider):
 
     def search(self, query: str, limit: int = 20) -> List[NormalizedPodcast]:
         """Search iTunes for podcasts matching *query*."""
-        params: Dict[str, Any] = {
+        data = self._get(self.BASE_URL, params=self._search_params(query, limit))
+        return self._parse_search(query, data)
+
+    async def asearch(self, query: str, limit: int = 20) -> List[NormalizedPodcast]:
+        """Async :meth:`search`."""
+        data = await self._aget(self.BASE_URL, params=self._search_params(query, limit))
+        return self._parse_search(query, data)
+
+    def get_by_id(self, provider_id: str) -> Optional[NormalizedPodcast]:
+        """Fetch a single podcast by its iTunes collection ID."""
+        data = self._get(self.LOOKUP_URL, params={"id": provider_id, "entity": "podcast"})
+        return self._parse_lookup(provider_id, data)
+
+    async def aget_by_id(self, provider_id: str) -> Optional[NormalizedPodcast]:
+        """Async :meth:`get_by_id`."""
+        data = await self._aget(self.LOOKUP_URL, params={"id": provider_id, "entity": "podcast"})
+        return self._parse_lookup(provider_id, data)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _search_params(query: str, limit: int) -> Dict[str, Any]:
+        return {
             "term": query,
             "media": "podcast",
             "entity": "podcast",
             "limit": min(limit, 200),  # iTunes hard cap
         }
-        data = self._get(self.BASE_URL, params=params)
+
+    def _parse_search(self, query: str, data: Dict[str, Any]) -> List[NormalizedPodcast]:
         results = data.get("results", [])
         logger.info("[iTunes] Search '%s' → %d result(s).", query, len(results))
         return [self._normalize(item) for item in results if item.get("feedUrl")]
 
-    def get_by_id(self, provider_id: str) -> Optional[NormalizedPodcast]:
-        """Fetch a single podcast by its iTunes collection ID."""
-        params = {"id": provider_id, "entity": "podcast"}
-        data = self._get(self.LOOKUP_URL, params=params)
+    def _parse_lookup(self, provider_id: str, data: Dict[str, Any]) -> Optional[NormalizedPodcast]:
         results = data.get("results", [])
         if not results:
             logger.warning("[iTunes] get_by_id(%s) → no results.", provider_id)
             return None
         return self._normalize(results[0])
 
-    # ------------------------------------------------------------------
-    # Internal helpers
-    # ------------------------------------------------------------------
-
     def _get(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Perform a rate-limited GET with exponential back-off on 429.
@@ -104,24 +129,11 @@ class ITunesProvider(PodcastProvider):
         for attempt in range(_MAX_RETRIES + 1):
             _rate_limiter.acquire()
             try:
-                response = requests.get(url, params=params, timeout=10)
+                response = http_client.get(url, params=params, timeout=10)
 
                 if response.status_code == 429:
-                    if attempt < _MAX_RETRIES:
-                        wait = _BASE_BACKOFF ** (attempt + 1)
-                        logger.warning(
-                            "[iTunes] 429 received (attempt %d/%d). "
-                            "Back-off %.0fs.",
-                            attempt + 1,
-                            _MAX_RETRIES,
-                            wait,
-                        )
-                        time.sleep(wait)
-                        continue
-                    raise RateLimitExceeded(
-                        f"iTunes returned 429 after {_MAX_RETRIES} retries.",
-                        provider=self.provider_name,
-                    )
+                    time.sleep(self._rate_limit_wait(attempt, response))
+                    continue
 
                 response.raise_for_status()
                 return response.json()
@@ -136,6 +148,45 @@ class ITunesProvider(PodcastProvider):
         # Should never reach here; satisfy type checker
         raise ProviderUnavailable("Unexpected retry loop exit.", provider=self.provider_name)
 
+    async def _aget(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Async :meth:`_get` — the rate limiter and back-off wait on the event loop."""
+        for attempt in range(_MAX_RETRIES + 1):
+            await _rate_limiter.aacquire()
+            try:
+                response = await http_client.aget(url, params=params, timeout=10)
+
+                if response.status_code == 429:
+                    await asyncio.sleep(self._rate_limit_wait(attempt, response))
+                    continue
+
+                response.raise_for_status()
+                return response.json()
+
+            except RateLimitExceeded:
+                raise
+            except (httpx.HTTPError, ValueError) as exc:
+                raise ProviderUnavailable(
+                    f"iTunes request failed: {exc}", provider=self.provider_name
+                ) from exc
+
+        raise ProviderUnavailable("Unexpected retry loop exit.", provider=self.provider_name)
+
+    def _rate_limit_wait(self, attempt: int, response) -> float:
+        """Back-off before retrying a 429, or :class:`RateLimitExceeded` once retries run out."""
+        if attempt >= _MAX_RETRIES:
+            raise RateLimitExceeded(
+                f"iTunes returned 429 after {_MAX_RETRIES} retries.",
+                provider=self.provider_name,
+            )
+        wait = _RATE_LIMIT_RETRY.delay(attempt, response)
+        logger.warning(
+            "[iTunes] 429 received (attempt %d/%d). Back-off %.0fs.",
+            attempt + 1,
+            _MAX_RETRIES,
+            wait,
+        )
+        return wait
+
     def _normalize(self, raw: Dict[str, Any]) -> NormalizedPodcast:
         """Map a raw iTunes item dict to a :class:`NormalizedPodcast`."""
         return NormalizedPodcast(
@@ -36,7 +36,9 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict, List, Optional, Tuple
 
+import httpx
 import requests
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.core.cache import cache
 
@@ -45,6 +47,8 @@ from podcasts.exceptions import (
     QuotaExhausted,
     RateLimitExceeded,
 )
+from podcasts.rate_limiter import RateLimiter
+from podvault_api import http_client
 
 from .base import NormalizedPodcast, PodcastProvider
 
@@ -136,6 +140,12 @@ _ENDPOINT = "https://api.podchaser.com/graphql"
 # Cache them for 364 days so they're refreshed just before expiry.
 _TOKEN_CACHE_TTL = 60 * 60 * 24 * 364  # 364 days
 
+# Queries and the token mutation are safe to repeat: retry 5xx / connection errors.
+_GRAPHQL_RETRY = http_client.RetryPolicy(methods=frozenset({"POST"}))
+
+# Shared request budget, if PROVIDER_RATE_LIMITS configures one for Podchaser.
+_rate_limiter = RateLimiter.for_provider("podchaser")
+
 
 # ---------------------------------------------------------------------------
 # Credential helpers
@@ -216,40 +226,64 @@ class PodchaserProvider(PodcastProvider):
 
     def search(self, query: str, limit: int = 20) -> List[NormalizedPodcast]:
         """Search Podchaser for podcasts matching *query*."""
-        payload = {
+        data = self._post_with_rotation(self._search_payload(query, limit))
+        return self._parse_search(query, data)
+
+    async def asearch(self, query: str, limit: int = 20) -> List[NormalizedPodcast]:
+        """Async :meth:`search`."""
+        data = await self._apost_with_rotation(self._search_payload(query, limit))
+        return self._parse_search(query, data)
+
+    def get_by_id(self, provider_id: str) -> Optional[NormalizedPodcast]:
+        """Fetch a single podcast by its Podchaser ID."""
+        data = self._post_with_rotation({"query": _LOOKUP_QUERY, "variables": {"id": provider_id}})
+        return self._parse_lookup(provider_id, data)
+
+    async def aget_by_id(self, provider_id: str) -> Optional[NormalizedPodcast]:
+        """Async :meth:`get_by_id`."""
+        data = await self._apost_with_rotation({"query": _LOOKUP_QUERY, "variables": {"id": provider_id}})
+        return self._parse_lookup(provider_id, data)
+
+    def get_credits(self, provider_id: str) -> List[Dict[str, Any]]:
+        """
+        Fetch guest/host credits for a podcast.
+
+        Returns a list of credit dicts with ``person``, ``role``, and
+        ``episode`` sub-objects.
+        """
+        data = self._post_with_rotation({"query": _CREDITS_QUERY, "variables": {"id": provider_id}})
+        return self._parse_credits(data)
+
+    async def aget_credits(self, provider_id: str) -> List[Dict[str, Any]]:
+        """Async :meth:`get_credits`."""
+        data = await self._apost_with_rotation({"query": _CREDITS_QUERY, "variables": {"id": provider_id}})
+        return self._parse_credits(data)
+
+    # ------------------------------------------------------------------
+    # Response parsing (shared by the sync and async paths)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _search_payload(query: str, limit: int) -> Dict[str, Any]:
+        return {
             "query": _SEARCH_QUERY,
             "variables": {"term": query, "maxResults": min(limit, 50)},
         }
-        data = self._post_with_rotation(payload)
+
+    def _parse_search(self, query: str, data: Dict[str, Any]) -> List[NormalizedPodcast]:
         items = data.get("data", {}).get("podcasts", {}).get("data", []) or []
         logger.info("[Podchaser] Search '%s' → %d result(s).", query, len(items))
         return [self._normalize(item) for item in items]
 
-    def get_by_id(self, provider_id: str) -> Optional[NormalizedPodcast]:
-        """Fetch a single podcast by its Podchaser ID."""
-        payload = {
-            "query": _LOOKUP_QUERY,
-            "variables": {"id": provider_id},
-        }
-        data = self._post_with_rotation(payload)
+    def _parse_lookup(self, provider_id: str, data: Dict[str, Any]) -> Optional[NormalizedPodcast]:
         item = data.get("data", {}).get("podcast")
         if not item:
             logger.warning("[Podchaser] get_by_id(%s) → no results.", provider_id)
             return None
         return self._normalize(item)
 
-    def get_credits(self, provider_id: str) -> List[Dict[str, Any]]:
-        """
-        Fetch guest/host credits for a podcast.
-
-        Returns a list of credit dicts with ``person``, ``role``, and
-        ``episode`` sub-objects.
-        """
-        payload = {
-            "query": _CREDITS_QUERY,
-            "variables": {"id": provider_id},
-        }
-        data = self._post_with_rotation(payload)
+    @staticmethod
+    def _parse_credits(data: Dict[str, Any]) -> List[Dict[str, Any]]:
         return (
             data.get("data", {})
             .get("podcast", {})
@@ -279,11 +313,12 @@ class PodchaserProvider(PodcastProvider):
             "variables": {"clientId": key, "clientSecret": secret},
         }
         try:
-            resp = requests.post(
+            resp = http_client.post(
                 _ENDPOINT,
                 json=mutation_payload,
                 headers={"Content-Type": "application/json"},
                 timeout=15,
+                retry=_GRAPHQL_RETRY,
             )
             resp.raise_for_status()
             result = resp.json()
@@ -359,7 +394,17 @@ class PodchaserProvider(PodcastProvider):
     # ------------------------------------------------------------------
 
     def _headers(self) -> Dict[str, str]:
-        token = self._get_token(self._current_index)
+        return self._bearer_headers(self._get_token(self._current_index))
+
+    async def _aheaders(self) -> Dict[str, str]:
+        token = await cache.aget(self._token_cache_key(self._current_index))
+        if token is None:
+            # Cold token (about once a year per pair): reuse the sync exchange.
+            token = await sync_to_async(self._get_token, thread_sensitive=False)(self._current_index)
+        return self._bearer_headers(token)
+
+    @staticmethod
+    def _bearer_headers(token: str) -> Dict[str, str]:
         return {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {token}",
@@ -373,24 +418,39 @@ class PodchaserProvider(PodcastProvider):
         :raises RateLimitExceeded: On HTTP 429.
         :raises ProviderUnavailable: On network/server errors.
         """
-        if not self._credentials:
-            raise QuotaExhausted(
-                "No Podchaser credentials configured.", provider=self.provider_name
-            )
-
-        start_index = self._current_index
+        start_index = self._start_rotation()
 
         while True:
             try:
                 return self._post(payload)
             except QuotaExhausted:
-                if not self._rotate_credential():
-                    # Restore so the next service-level call starts fresh
-                    self._current_index = start_index
-                    raise QuotaExhausted(
-                        "All Podchaser credential pairs have reached their monthly quota.",
-                        provider=self.provider_name,
-                    )
+                self._rotate_or_raise(start_index)
+
+    async def _apost_with_rotation(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Async :meth:`_post_with_rotation`."""
+        start_index = self._start_rotation()
+
+        while True:
+            try:
+                return await self._apost(payload)
+            except QuotaExhausted:
+                self._rotate_or_raise(start_index)
+
+    def _start_rotation(self) -> int:
+        if not self._credentials:
+            raise QuotaExhausted(
+                "No Podchaser credentials configured.", provider=self.provider_name
+            )
+        return self._current_index
+
+    def _rotate_or_raise(self, start_index: int) -> None:
+        if not self._rotate_credential():
+            # Restore so the next service-level call starts fresh
+            self._current_index = start_index
+            raise QuotaExhausted(
+                "All Podchaser credential pairs have reached their monthly quota.",
+                provider=self.provider_name,
+            )
 
     def _post(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -398,40 +458,17 @@ class PodchaserProvider(PodcastProvider):
 
         Raises the appropriate domain exception for each HTTP error class.
         """
+        if _rate_limiter is not None:
+            _rate_limiter.acquire()
         try:
-            response = requests.post(
+            response = http_client.post(
                 _ENDPOINT,
                 json=payload,
                 headers=self._headers(),
                 timeout=15,
+                retry=_GRAPHQL_RETRY,
             )
-
-            # 402/403 → quota exhaustion for this credential pair
-            if response.status_code in (402, 403):
-                raise QuotaExhausted(
-                    f"Podchaser quota exceeded for current credential pair (HTTP {response.status_code}).",
-                    provider=self.provider_name,
-                )
-
-            if response.status_code == 429:
-                raise RateLimitExceeded(
-                    "Podchaser returned 429 Too Many Requests.",
-                    provider=self.provider_name,
-                )
-
-            response.raise_for_status()
-            result = response.json()
-
-            if "errors" in result:
-                errors = result["errors"]
-                logger.error("[Podchaser] GraphQL errors: %s", errors)
-                msg = errors[0].get("message", "")
-                if "quota" in msg.lower() or "limit" in msg.lower():
-                    raise QuotaExhausted(msg, provider=self.provider_name)
-                raise ProviderUnavailable(msg, provider=self.provider_name)
-
-            return result
-
+            return self._parse_response(response)
         except (QuotaExhausted, RateLimitExceeded, ProviderUnavailable):
             raise
         except requests.RequestException as exc:
@@ -439,6 +476,54 @@ class PodchaserProvider(PodcastProvider):
                 f"Podchaser request failed: {exc}", provider=self.provider_name
             ) from exc
 
+    async def _apost(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Async :meth:`_post`."""
+        if _rate_limiter is not None:
+            await _rate_limiter.aacquire()
+        try:
+            response = await http_client.apost(
+                _ENDPOINT,
+                json=payload,
+                headers=await self._aheaders(),
+                timeout=15,
+                retry=_GRAPHQL_RETRY,
+            )
+            return self._parse_response(response)
+        except (QuotaExhausted, RateLimitExceeded, ProviderUnavailable):
+            raise
+        except (httpx.HTTPError, ValueError) as exc:
+            raise ProviderUnavailable(
+                f"Podchaser request failed: {exc}", provider=self.provider_name
+            ) from exc
+
+    def _parse_response(self, response) -> Dict[str, Any]:
+        """Map HTTP and GraphQL errors to domain exceptions (sync and async transports)."""
+        # 402/403 → quota exhaustion for this credential pair
+        if response.status_code in (402, 403):
+            raise QuotaExhausted(
+                f"Podchaser quota exceeded for current credential pair (HTTP {response.status_code}).",
+                provider=self.provider_name,
+            )
+
+        if response.status_code == 429:
+            raise RateLimitExceeded(
+                "Podchaser returned 429 Too Many Requests.",
+                provider=self.provider_name,
+            )
+
+        response.raise_for_status()
+        result = response.json()
+
+        if "errors" in result:
+            errors = result["errors"]
+            logger.error("[Podchaser] GraphQL errors: %s", errors)
+            msg = errors[0].get("message", "")
+            if "quota" in msg.lower() or "limit" in msg.lower():
+                raise QuotaExhausted(msg, provider=self.provider_name)
+            raise ProviderUnavailable(msg, provider=self.provider_name)
+
+        return result
+
     # ------------------------------------------------------------------
     # Normaliser
     # ------------------------------------------------------------------
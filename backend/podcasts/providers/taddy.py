@@ -14,15 +14,24 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict, List, Optional
 
+import httpx
 import requests
 from django.conf import settings
 
 from podcasts.exceptions import ProviderUnavailable, RateLimitExceeded
+from podcasts.rate_limiter import RateLimiter
+from podvault_api import http_client
 
 from .base import NormalizedPodcast, PodcastProvider
 
 logger = logging.getLogger(__name__)
 
+# GraphQL reads are safe to repeat, so POSTs retry on 5xx / connection errors.
+_GRAPHQL_RETRY = http_client.RetryPolicy(methods=frozenset({"POST"}))
+
+# Shared request budget, if PROVIDER_RATE_LIMITS configures one for Taddy.
+_rate_limiter = RateLimiter.for_provider("taddy")
+
 # GraphQL query for podcast search
 _SEARCH_QUERY = """
 query SearchPodcasts($term: String!, $limitPerPage: Int) {
@@ -117,40 +126,58 @@ class TaddyProvider(PodcastProvider):
 
     def search(self, query: str, limit: int = 20) -> List[NormalizedPodcast]:
         """Search Taddy for podcasts matching *query*."""
-        payload = {
+        return self._parse_search(query, self._post(self._search_payload(query, limit)))
+
+    async def asearch(self, query: str, limit: int = 20) -> List[NormalizedPodcast]:
+        """Async :meth:`search`."""
+        return self._parse_search(query, await self._apost(self._search_payload(query, limit)))
+
+    def get_by_id(self, provider_id: str) -> Optional[NormalizedPodcast]:
+        """Fetch a single podcast by its Taddy UUID."""
+        return self._parse_lookup(provider_id, self._post(self._lookup_payload(provider_id)))
+
+    async def aget_by_id(self, provider_id: str) -> Optional[NormalizedPodcast]:
+        """Async :meth:`get_by_id`."""
+        return self._parse_lookup(provider_id, await self._apost(self._lookup_payload(provider_id)))
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _search_payload(query: str, limit: int) -> Dict[str, Any]:
+        return {
             "query": _SEARCH_QUERY,
             "variables": {"term": query, "limitPerPage": min(limit, 25)},
         }
-        data = self._post(payload)
-        series_list = (
-            data.get("data", {})
-            .get("getPodcastSeries", {})
-            .get("podcastSeries", []) or []
-        )
-        logger.info("[Taddy] Search '%s' → %d result(s).", query, len(series_list))
-        return [self._normalize(item) for item in series_list]
 
-    def get_by_id(self, provider_id: str) -> Optional[NormalizedPodcast]:
-        """Fetch a single podcast by its Taddy UUID."""
-        payload = {
+    @staticmethod
+    def _lookup_payload(provider_id: str) -> Dict[str, Any]:
+        return {
             "query": _LOOKUP_QUERY,
             "variables": {"uuid": provider_id},
         }
-        data = self._post(payload)
-        series_list = (
+
+    @staticmethod
+    def _series(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return (
             data.get("data", {})
             .get("getPodcastSeries", {})
             .get("podcastSeries", []) or []
         )
+
+    def _parse_search(self, query: str, data: Dict[str, Any]) -> List[NormalizedPodcast]:
+        series_list = self._series(data)
+        logger.info("[Taddy] Search '%s' → %d result(s).", query, len(series_list))
+        return [self._normalize(item) for item in series_list]
+
+    def _parse_lookup(self, provider_id: str, data: Dict[str, Any]) -> Optional[NormalizedPodcast]:
+        series_list = self._series(data)
         if not series_list:
             logger.warning("[Taddy] get_by_id(%s) → no results.", provider_id)
             return None
         return self._normalize(series_list[0])
 
-    # ------------------------------------------------------------------
-    # Internal helpers
-    # ------------------------------------------------------------------
-
     def _headers(self) -> Dict[str, str]:
         return {
             "Content-Type": "application/json",
@@ -165,34 +192,17 @@ class TaddyProvider(PodcastProvider):
         :raises RateLimitExceeded: On HTTP 429.
         :raises ProviderUnavailable: On network or server error.
         """
+        if _rate_limiter is not None:
+            _rate_limiter.acquire()
         try:
-            response = requests.post(
+            response = http_client.post(
                 self.ENDPOINT,
                 json=payload,
                 headers=self._headers(),
                 timeout=15,
+                retry=_GRAPHQL_RETRY,
             )
-
-            if response.status_code == 429:
-                raise RateLimitExceeded(
-                    "Taddy returned 429 Too Many Requests.",
-                    provider=self.provider_name,
-                )
-
-            response.raise_for_status()
-            result = response.json()
-
-            # Surface GraphQL-level errors
-            if "errors" in result:
-                errors = result["errors"]
-                logger.error("[Taddy] GraphQL errors: %s", errors)
-                raise ProviderUnavailable(
-                    f"Taddy GraphQL error: {errors[0].get('message', 'unknown')}",
-                    provider=self.provider_name,
-                )
-
-            return result
-
+            return self._parse_response(response)
         except (RateLimitExceeded, ProviderUnavailable):
             raise
         except requests.RequestException as exc:
@@ -200,6 +210,48 @@ class TaddyProvider(PodcastProvider):
                 f"Taddy request failed: {exc}", provider=self.provider_name
             ) from exc
 
+    async def _apost(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Async :meth:`_post`."""
+        if _rate_limiter is not None:
+            await _rate_limiter.aacquire()
+        try:
+            response = await http_client.apost(
+                self.ENDPOINT,
+                json=payload,
+                headers=self._headers(),
+                timeout=15,
+                retry=_GRAPHQL_RETRY,
+            )
+            return self._parse_response(response)
+        except (RateLimitExceeded, ProviderUnavailable):
+            raise
+        except (httpx.HTTPError, ValueError) as exc:
+            raise ProviderUnavailable(
+                f"Taddy request failed: {exc}", provider=self.provider_name
+            ) from exc
+
+    def _parse_response(self, response) -> Dict[str, Any]:
+        """Status and GraphQL error handling shared by the sync and async transports."""
+        if response.status_code == 429:
+            raise RateLimitExceeded(
+                "Taddy returned 429 Too Many Requests.",
+                provider=self.provider_name,
+            )
+
+        response.raise_for_status()
+        result = response.json()
+
+        # Surface GraphQL-level errors
+        if "errors" in result:
+            errors = result["errors"]
+            logger.error("[Taddy] GraphQL errors: %s", errors)
+            raise ProviderUnavailable(
+                f"Taddy GraphQL error: {errors[0].get('message', 'unknown')}",
+                provider=self.provider_name,
+            )
+
+        return result
+
     def _normalize(self, raw: Dict[str, Any]) -> NormalizedPodcast:
         """Map a raw Taddy series dict to a :class:`NormalizedPodcast`."""
         categories = raw.get("categories") or []
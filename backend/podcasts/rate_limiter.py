@@ -1,29 +1,114 @@
 """
 podcasts.rate_limiter
 ~~~~~~~~~~~~~~~~~~~~~
-Thread-safe token-bucket rate limiter.
+Token-bucket rate limiter shared by every process through Redis.
 
-Designed specifically for the iTunes Search API which enforces a hard
-limit of 20 requests per 60 seconds.  Uses a threading.Lock and a
-monotonic clock so it is safe to share across Django threads.
+A per-process bucket let each Daphne and Celery worker spend the whole
+iTunes budget (20 requests / 60 s) on its own, so N workers sent up to
+20 × N and ate 429s.  A *named* limiter keeps its bucket in Redis and
+refills and takes tokens in one Lua script, so all processes draw on one
+budget::
 
-Usage::
+    podvault:ratelimit:<name>   ← HASH tokens, ts (Redis server time)
 
-    _itunes_limiter = RateLimiter(max_calls=20, period=60.0)
+Budgets are configured per provider in ``PROVIDER_RATE_LIMITS`` and the
+shared instance is obtained with :meth:`RateLimiter.for_provider`::
+
+    _itunes_limiter = RateLimiter.for_provider("itunes")
 
     def make_request():
-        _itunes_limiter.acquire()   # blocks if tokens exhausted
-        return requests.get(URL, ...)
+        _itunes_limiter.acquire()              # blocks until a token is free
+        return http_client.get(URL, ...)
+
+    if _itunes_limiter.try_acquire(timeout=0.5):   # or give up after 0.5 s
+        ...
+
+Callers with a deadline of their own (the ``provider=all`` fan-out) wrap
+provider calls in :func:`wait_until`; inside it ``acquire()`` behaves like
+``try_acquire`` with the time left and raises
+:class:`~podcasts.exceptions.RateLimitExceeded` instead of sleeping past
+the deadline, so an abandoned call frees its worker thread::
+
+    with wait_until(time.monotonic() + 2.5):
+        provider.search(query)
+
+If Redis is unreachable the limiter falls back to an in-process bucket
+for ``_REDIS_RETRY_AFTER`` seconds rather than failing the call.  An
+unnamed limiter is always in-process.  :func:`snapshot` reports every
+limiter's current token level and this process's acquire counters.
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import logging
 import threading
 import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from podcasts.exceptions import RateLimitExceeded
+from podvault_api.redis_client import get_connection
 
 logger = logging.getLogger(__name__)
 
+_KEY_PREFIX = "podvault:ratelimit"
+
+# Seconds to stay on the local bucket after a Redis error before retrying.
+_REDIS_RETRY_AFTER = 30.0
+
+# KEYS[1] = bucket; ARGV[1] = capacity, ARGV[2] = tokens per second,
+# ARGV[3] = tokens requested (0 = just report the level).
+# Returns {granted, tokens left, seconds until enough tokens}.
+_TAKE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if not tokens then
+    tokens = capacity
+    ts = now
+end
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local granted = 0
+local wait = 0
+if tokens >= requested then
+    tokens = tokens - requested
+    granted = 1
+else
+    wait = (requested - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 60)
+return {granted, tostring(tokens), tostring(wait)}
+"""
+
+_registry: Dict[str, "RateLimiter"] = {}
+_registry_lock = threading.Lock()
+
+# time.monotonic() past which acquire() gives up (see wait_until).
+_wait_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "rate_limit_wait_deadline", default=None
+)
+
+
+@contextmanager
+def wait_until(deadline: float) -> Iterator[None]:
+    """Make :meth:`RateLimiter.acquire` give up at *deadline* (``time.monotonic()``) in this block."""
+    token = _wait_deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _wait_deadline.reset(token)
+
 
 class RateLimiter:
     """
@@ -31,14 +116,33 @@ class RateLimiter:
 
     :param max_calls: Maximum number of calls allowed within ``period``.
     :param period:    Refill window in seconds.
+    :param name:      Redis bucket name; ``None`` keeps the bucket in-process.
     """
 
-    def __init__(self, max_calls: int = 20, period: float = 60.0) -> None:
+    def __init__(self, max_calls: int = 20, period: float = 60.0, name: Optional[str] = None) -> None:
         self.max_calls = max_calls
         self.period = period
+        self.name = name
+        self.key = f"{_KEY_PREFIX}:{name}" if name else None
         self._lock = threading.Lock()
         self._tokens: float = float(max_calls)
         self._last_refill: float = time.monotonic()
+        self._redis_down_until = 0.0
+        self.stats = {"acquired": 0, "throttled": 0, "rejected": 0, "waited_ms": 0.0}
+
+    @classmethod
+    def for_provider(cls, provider: str) -> Optional["RateLimiter"]:
+        """
+        The process-wide limiter for *provider* from ``PROVIDER_RATE_LIMITS``,
+        or ``None`` if it has no configured budget.
+        """
+        with _registry_lock:
+            if provider not in _registry:
+                config = getattr(settings, "PROVIDER_RATE_LIMITS", {}).get(provider)
+                if config is None:
+                    return None
+                _registry[provider] = cls(config["max_calls"], config["period"], name=provider)
+            return _registry[provider]
 
     # ------------------------------------------------------------------
     # Public API
@@ -48,27 +152,105 @@ class RateLimiter:
         """
         Block the calling thread until a token is available.
 
-        Refills tokens proportionally based on elapsed time so there is
-        no thundering-herd effect when multiple threads wake simultaneously.
+        Sleeps exactly as long as the bucket says the next token takes, so
+        there is no thundering-herd effect when many callers wait at once.
+        Inside :func:`wait_until` it waits no longer than the deadline.
+
+        :raises RateLimitExceeded: If the :func:`wait_until` deadline passes first.
         """
+        deadline = _wait_deadline.get()
+        if deadline is not None:
+            if not self.try_acquire(timeout=max(0.0, deadline - time.monotonic())):
+                raise RateLimitExceeded(
+                    "No token free before the caller's deadline.", provider=self.name or "unknown"
+                )
+            return
+        started = time.monotonic()
         while True:
-            with self._lock:
-                self._refill()
-                if self._tokens >= 1.0:
-                    self._tokens -= 1.0
-                    return
-                # Calculate how long to wait for the next token
-                wait = self._seconds_per_token()
-
+            granted, _, wait = self._take()
+            if granted:
+                self._count(started)
+                return
             logger.debug(
-                "[RateLimiter] Token pool empty — waiting %.2fs for refill.", wait
+                "[RateLimiter] %s: token pool empty — waiting %.2fs for refill.", self.name, wait
             )
             time.sleep(wait)
 
+    def try_acquire(self, timeout: float = 0.0) -> bool:
+        """
+        Take a token if one is free within *timeout* seconds.
+
+        Returns ``False`` at once when the bucket says the next token is
+        further away than the remaining time, instead of sleeping first.
+        """
+        started = time.monotonic()
+        deadline = started + timeout
+        while True:
+            granted, _, wait = self._take()
+            if granted:
+                self._count(started)
+                return True
+            if time.monotonic() + wait > deadline:
+                with self._lock:
+                    self.stats["rejected"] += 1
+                return False
+            time.sleep(wait)
+
+    async def aacquire(self) -> None:
+        """:meth:`acquire` for coroutines — waits without blocking the event loop."""
+        started = time.monotonic()
+        # The bucket script is a blocking round trip: run it off the loop.
+        take = sync_to_async(self._take, thread_sensitive=False)
+        while True:
+            granted, _, wait = await take()
+            if granted:
+                self._count(started)
+                return
+            await asyncio.sleep(wait)
+
+    def tokens(self) -> float:
+        """Tokens currently in the bucket (refilled to now, nothing taken)."""
+        return self._take(0)[1]
+
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
 
+    def _take(self, requested: int = 1) -> Tuple[bool, float, float]:
+        """``(granted, tokens left, seconds until enough tokens)``."""
+        if self.key and time.monotonic() >= self._redis_down_until:
+            conn = get_connection()
+            if conn is not None:
+                try:
+                    granted, tokens, wait = conn.eval(
+                        _TAKE_SCRIPT, 1, self.key,
+                        self.max_calls, self.max_calls / self.period, requested,
+                    )
+                    return bool(int(granted)), float(tokens), float(wait)
+                except Exception as exc:                            # noqa: BLE001
+                    logger.warning(
+                        "[RateLimiter] %s: Redis unavailable (%s) — using the local bucket.",
+                        self.name, exc,
+                    )
+            self._redis_down_until = time.monotonic() + _REDIS_RETRY_AFTER
+        return self._take_local(requested)
+
+    def _take_local(self, requested: int) -> Tuple[bool, float, float]:
+        with self._lock:
+            self._refill()
+            if self._tokens >= requested:
+                self._tokens -= requested
+                return True, self._tokens, 0.0
+            return False, self._tokens, (requested - self._tokens) * self._seconds_per_token()
+
+    def _count(self, started: float) -> None:
+        waited = time.monotonic() - started
+        with self._lock:
+            self.stats["acquired"] += 1
+            if waited > 0.001:
+                self.stats["throttled"] += 1
+                self.stats["waited_ms"] += waited * 1000
+
     def _refill(self) -> None:
         """Add tokens proportional to elapsed time since last refill."""
         now = time.monotonic()
@@ -80,3 +262,18 @@ class RateLimiter:
     def _seconds_per_token(self) -> float:
         """Seconds it takes to earn one token at the current refill rate."""
         return self.period / self.max_calls
+
+
+def snapshot() -> Dict[str, Dict[str, float]]:
+    """Current token level and budget of every provider limiter, plus this process's counters."""
+    with _registry_lock:
+        limiters = dict(_registry)
+    return {
+        name: {
+            "tokens": limiter.tokens(),
+            "capacity": limiter.max_calls,
+            "period": limiter.period,
+            **limiter.stats,
+        }
+        for name, limiter in limiters.items()
+    }
@@ -23,22 +23,53 @@ Improvements over v1
 
    The user always gets a response in < 5 ms for a warm cache.  The
    background worker silently keeps the payload fresh.
+
+3. **Federated search** — ``provider="all"`` fans the query out to every
+   provider in ``PROVIDER_MAP`` on a shared thread pool, waits at most
+   each provider's deadline, then merges and de-duplicates whatever
+   arrived (see :class:`FederatedSearch`).
+
+4. **Async entry points** — ``asearch`` / ``asearch_all`` / ``aget_detail``
+   / ``aget_credits`` mirror the sync methods for the ASGI views, calling
+   the providers' native ``asearch`` so a slow upstream holds a socket on
+   the event loop instead of a worker thread.
+
+5. **Single-flight fetches** — a cold miss or a stale refresh first takes
+   a short lease on the cache key (``podvault:lease:pod:<slug>``, set with
+   ``add`` = ``SET NX``).  Only the holder calls the providers or enqueues
+   the refresh task; concurrent callers on a cold key poll for the
+   holder's result for up to ``PODCAST_COALESCE_WAIT`` seconds (and get
+   :class:`~podcasts.exceptions.FetchPending` if the holder is still
+   going), and concurrent callers on a stale key just serve the stale
+   payload.  A slug iTunes knows nothing about is remembered for
+   ``PODCAST_NOT_FOUND_TTL`` seconds.  The lease is released with a Lua
+   compare-and-delete, so a holder whose lease expired never drops the
+   next holder's.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import re
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import asdict
-from typing import Any, Dict, List, Optional
+from itertools import zip_longest
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.core.cache import cache
 from django.utils.text import slugify
 
-from podcasts.exceptions import ProviderError, QuotaExhausted
+from podcasts.exceptions import FetchPending, ProviderError, QuotaExhausted
 from podcasts.providers.itunes import ITunesProvider
 from podcasts.providers.podchaser import PodchaserProvider
-from podcasts.providers.registry import get_provider
+from podcasts.providers.registry import PROVIDER_MAP, get_provider
+from podcasts.rate_limiter import wait_until
+from podvault_api.redis_client import release_cache_lock
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +85,19 @@ _MAIN_TTL: int = getattr(settings, "PODCAST_CACHE_TTL", 86_400)       # 24 h
 # payload gets refreshed long before it would expire entirely.
 _FRESH_TTL: int = getattr(settings, "PODCAST_FRESH_TTL", 3_600)        #  1 h
 
+# Federated search — per-provider deadline (seconds) and the shorter TTL
+# used when some provider missed it, so the next search can fill the gap.
+_FANOUT_DEADLINE: float = getattr(settings, "PODCAST_FANOUT_DEADLINE", 2.5)
+_FANOUT_DEADLINES: Dict[str, float] = getattr(settings, "PODCAST_FANOUT_DEADLINES", {})
+_PARTIAL_TTL: int = getattr(settings, "PODCAST_PARTIAL_TTL", 60)
+
+# Single-flight — how long a fetch lease lives if its holder never releases
+# it, and how long callers wait for another caller's cold fetch.
+_LEASE_TTL: int = getattr(settings, "PODCAST_FETCH_LEASE_TTL", 30)
+_COALESCE_WAIT: float = getattr(settings, "PODCAST_COALESCE_WAIT", 3.0)
+_COALESCE_POLL: Tuple[float, float] = (0.05, 0.25)   # first / longest poll interval
+_NOT_FOUND_TTL: int = getattr(settings, "PODCAST_NOT_FOUND_TTL", 60)
+
 
 # ---------------------------------------------------------------------------
 # PodcastSearchService
@@ -88,13 +132,17 @@ class PodcastSearchService:
         closure, no mutable state is shared between calls.
 
         :param query:    Free-text search term.
-        :param provider: One of ``'itunes'``, ``'taddy'``, ``'podchaser'``.
+        :param provider: One of ``'itunes'``, ``'taddy'``, ``'podchaser'``,
+                         or ``'all'`` for :meth:`search_all`.
         :param limit:    Maximum results (1–50).
         :param ttl:      Cache TTL in seconds.
         :returns: List of serialised :class:`NormalizedPodcast` dicts.
         :raises ValueError: If *provider* is not registered.
         :raises ProviderError: On provider-side failures.
         """
+        if provider == "all":
+            return self.search_all(query, limit=limit, ttl=ttl)["results"]
+
         cache_key = f"search:{provider}:{slugify(query)}:{limit}"
 
         # Diagnostic shim — wrap in a logged callable so we know which
@@ -125,6 +173,325 @@ class PodcastSearchService:
 
         return results
 
+    async def asearch(
+        self,
+        query: str,
+        provider: str = "itunes",
+        limit: int = 20,
+        ttl: int = _MAIN_TTL,
+    ) -> List[Dict[str, Any]]:
+        """Async :meth:`search`, on the provider's native ``asearch``."""
+        if provider == "all":
+            return (await self.asearch_all(query, limit=limit, ttl=ttl))["results"]
+
+        cache_key = f"search:{provider}:{slugify(query)}:{limit}"
+        cached = await cache.aget(cache_key)
+        if cached is not None:
+            logger.info("[SearchService] Cache HIT — key: %s", cache_key)
+            return cached
+
+        logger.info("[SearchService] Cache MISS — querying '%s' for '%s'.", provider, query)
+        results = [asdict(r) for r in await get_provider(provider).asearch(query, limit=limit)]
+        await cache.aset(cache_key, results, timeout=ttl)
+        return results
+
+    def search_all(
+        self,
+        query: str,
+        limit: int = 20,
+        ttl: int = _MAIN_TTL,
+    ) -> Dict[str, Any]:
+        """
+        Federated search across every registered provider.
+
+        The merged result is cached as one unit under
+        ``search:all:<slugified-query>:<limit>``; a partial result (some
+        provider late or failing) is cached for ``PODCAST_PARTIAL_TTL``
+        only, and an all-failed result is not cached.
+
+        :returns: ``{"results": [...], "providers": {name: status}}`` where
+                  status is ``'ok'``, ``'timeout'`` or ``'error'``.
+        """
+        cache_key = f"search:all:{slugify(query)}:{limit}"
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.info("[SearchService] Cache HIT — key: %s", cache_key)
+            return cached
+
+        payload = FederatedSearch().search(query, limit=limit)
+        timeout = self._federated_ttl(payload, ttl)
+        if timeout:
+            cache.set(cache_key, payload, timeout=timeout)
+        return payload
+
+    async def asearch_all(
+        self,
+        query: str,
+        limit: int = 20,
+        ttl: int = _MAIN_TTL,
+    ) -> Dict[str, Any]:
+        """Async :meth:`search_all`."""
+        cache_key = f"search:all:{slugify(query)}:{limit}"
+        cached = await cache.aget(cache_key)
+        if cached is not None:
+            logger.info("[SearchService] Cache HIT — key: %s", cache_key)
+            return cached
+
+        payload = await FederatedSearch().asearch(query, limit=limit)
+        timeout = self._federated_ttl(payload, ttl)
+        if timeout:
+            await cache.aset(cache_key, payload, timeout=timeout)
+        return payload
+
+    @staticmethod
+    def _federated_ttl(payload: Dict[str, Any], ttl: int) -> int:
+        """Full TTL if every provider answered, a short one if some did, else 0."""
+        statuses = payload["providers"].values()
+        if all(status == "ok" for status in statuses):
+            return ttl
+        if any(status == "ok" for status in statuses):
+            return min(ttl, _PARTIAL_TTL)
+        return 0
+
+
+# ---------------------------------------------------------------------------
+# FederatedSearch
+# ---------------------------------------------------------------------------
+
+
+# Provider calls outlive their deadline on this pool instead of holding up
+# the request; it is shared so a burst of searches can't spawn unbounded threads.
+_fanout_pool = ThreadPoolExecutor(
+    max_workers=getattr(settings, "PODCAST_FANOUT_WORKERS", 16),
+    thread_name_prefix="podcast-fanout",
+)
+
+
+class FederatedSearch:
+    """
+    Concurrent search across ``PROVIDER_MAP`` with merge and de-duplication.
+
+    Two results are the same show when their normalised ``rss_feed``
+    matches, or failing that their normalised title + author.  Results are
+    interleaved by rank (every provider's #1, then every #2, …) so one
+    provider cannot crowd out the others; the first provider in
+    ``PROVIDER_MAP`` order wins a duplicate and the others only fill its
+    empty fields.  Each merged item lists the providers it came from in
+    ``sources``.
+    """
+
+    def search(self, query: str, limit: int = 20) -> Dict[str, Any]:
+        started = time.monotonic()
+        deadlines = {name: started + self.deadline(name) for name in PROVIDER_MAP}
+        futures = {
+            _fanout_pool.submit(self._call, name, query, limit, deadlines[name]): name
+            for name in PROVIDER_MAP
+        }
+
+        pending = set(futures)
+        while pending:
+            remaining = max(deadlines[futures[f]] for f in pending) - time.monotonic()
+            if remaining <= 0:
+                break
+            _done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+
+        return self._collect(futures, deadlines, started, query, limit)
+
+    async def asearch(self, query: str, limit: int = 20) -> Dict[str, Any]:
+        """Async :meth:`search`; providers still running at the deadline are cancelled."""
+        started = time.monotonic()
+        tasks = {
+            asyncio.ensure_future(self._acall(name, query, limit)): name
+            for name in PROVIDER_MAP
+        }
+        deadlines = {name: started + self.deadline(name) for name in PROVIDER_MAP}
+
+        pending = set(tasks)
+        while pending:
+            remaining = max(deadlines[tasks[t]] for t in pending) - time.monotonic()
+            if remaining <= 0:
+                break
+            _done, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED,
+            )
+        for task in pending:
+            task.cancel()
+
+        return self._collect(tasks, deadlines, started, query, limit)
+
+    @staticmethod
+    def _collect(futures, deadlines: Dict[str, float], started: float, query: str, limit: int) -> Dict[str, Any]:
+        """Statuses plus merged results from thread-pool futures or asyncio tasks."""
+        by_provider: Dict[str, List[Dict[str, Any]]] = {}
+        statuses: Dict[str, str] = {}
+        for future, name in futures.items():
+            if not future.done() or future.cancelled():
+                statuses[name] = "timeout"
+                continue
+            results, finished = future.result()
+            if results is None:
+                statuses[name] = "error"
+            elif finished > deadlines[name]:
+                statuses[name] = "timeout"
+            else:
+                statuses[name] = "ok"
+                by_provider[name] = results
+
+        logger.info(
+            "[FederatedSearch] '%s' in %.0f ms — %s",
+            query, (time.monotonic() - started) * 1000, statuses,
+        )
+        ordered = [by_provider[name] for name in PROVIDER_MAP if name in by_provider]
+        return {"results": merge_results(ordered, limit), "providers": statuses}
+
+    @staticmethod
+    def deadline(name: str) -> float:
+        return _FANOUT_DEADLINES.get(name, _FANOUT_DEADLINE)
+
+    @staticmethod
+    def _call(
+        name: str, query: str, limit: int, deadline: float
+    ) -> Tuple[Optional[List[Dict[str, Any]]], float]:
+        """
+        Run one provider; ``(None, t)`` on failure so the others still count.
+
+        Rate-limit waits stop at *deadline*, so a throttled provider hands
+        its pool thread back instead of sleeping for a result nobody reads.
+        """
+        try:
+            with wait_until(deadline):
+                results = [asdict(r) for r in get_provider(name).search(query, limit=limit)]
+        except Exception as exc:                                    # noqa: BLE001
+            logger.warning("[FederatedSearch] %s failed: %s", name, exc)
+            results = None
+        return results, time.monotonic()
+
+    @staticmethod
+    async def _acall(name: str, query: str, limit: int) -> Tuple[Optional[List[Dict[str, Any]]], float]:
+        try:
+            results = [asdict(r) for r in await get_provider(name).asearch(query, limit=limit)]
+        except Exception as exc:                                    # noqa: BLE001
+            logger.warning("[FederatedSearch] %s failed: %s", name, exc)
+            results = None
+        return results, time.monotonic()
+
+
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def _feed_key(url: Optional[str]) -> Optional[str]:
+    """``https://www.Example.com/feed/`` → ``example.com/feed``."""
+    if not url:
+        return None
+    url = re.sub(r"^[a-z][a-z0-9+.-]*://", "", url.strip().lower())
+    if url.startswith("www."):
+        url = url[4:]
+    return url.rstrip("/") or None
+
+
+def _name_key(item: Dict[str, Any]) -> Optional[str]:
+    title = _NON_WORD.sub("", (item.get("title") or "").casefold())
+    if not title:
+        return None
+    return f"{title}|{_NON_WORD.sub('', (item.get('author') or '').casefold())}"
+
+
+def merge_results(ranked_lists: List[List[Dict[str, Any]]], limit: int) -> List[Dict[str, Any]]:
+    """Interleave *ranked_lists* by rank, folding duplicates into the first occurrence."""
+    merged: List[Dict[str, Any]] = []
+    index: Dict[str, Dict[str, Any]] = {}
+
+    for rank in zip_longest(*ranked_lists):
+        for item in rank:
+            if item is None:
+                continue
+            keys = [k for k in (_feed_key(item.get("rss_feed")), _name_key(item)) if k]
+            existing = next((index[k] for k in keys if k in index), None)
+            if existing is None:
+                existing = dict(item, sources=[item.get("provider")])
+                merged.append(existing)
+            else:
+                for field, value in item.items():
+                    if existing.get(field) in (None, "", [], 0) and value not in (None, "", []):
+                        existing[field] = value
+                if item.get("provider") not in existing["sources"]:
+                    existing["sources"].append(item.get("provider"))
+            for k in keys:
+                index.setdefault(k, existing)
+    return merged[:limit]
+
+
+# ---------------------------------------------------------------------------
+# Single-flight leases
+# ---------------------------------------------------------------------------
+
+
+def acquire_lease(key: str) -> Optional[str]:
+    """
+    Take the fetch lease on cache *key*; returns its token, or ``None`` if
+    another caller (or refresh task) holds it.
+    """
+    token = uuid.uuid4().hex
+    added = cache.add(f"lease:{key}", token, timeout=_LEASE_TTL)
+    # django-redis swallows connection errors (IGNORE_EXCEPTIONS) and returns
+    # None: with nothing to coordinate through, every caller fetches.
+    return token if added or added is None else None
+
+
+def release_lease(key: str, token: Optional[str]) -> None:
+    """Drop the lease on *key* if *token* still holds it."""
+    if token:
+        release_cache_lock(f"lease:{key}", token)
+
+
+async def aacquire_lease(key: str) -> Optional[str]:
+    """Async :func:`acquire_lease`."""
+    token = uuid.uuid4().hex
+    added = await cache.aadd(f"lease:{key}", token, timeout=_LEASE_TTL)
+    return token if added or added is None else None
+
+
+async def arelease_lease(key: str, token: Optional[str]) -> None:
+    """Async :func:`release_lease`."""
+    if token:
+        await sync_to_async(release_lease)(key, token)
+
+
+def _wait_for_value(key: str) -> Any:
+    """
+    Poll *key* while another caller holds its lease.
+
+    Returns the value once the holder has cached it, or ``None`` when the
+    lease ends without one (nothing found, or the holder failed) or
+    ``_COALESCE_WAIT`` runs out.
+    """
+    deadline = time.monotonic() + _COALESCE_WAIT
+    interval, longest = _COALESCE_POLL
+    while time.monotonic() < deadline:
+        time.sleep(min(interval, max(0.0, deadline - time.monotonic())))
+        value = cache.get(key)
+        if value is not None:
+            return value
+        if cache.get(f"lease:{key}") is None:
+            return None
+        interval = min(interval * 2, longest)
+    return None
+
+
+async def _await_value(key: str) -> Any:
+    """Async :func:`_wait_for_value`."""
+    deadline = time.monotonic() + _COALESCE_WAIT
+    interval, longest = _COALESCE_POLL
+    while time.monotonic() < deadline:
+        await asyncio.sleep(min(interval, max(0.0, deadline - time.monotonic())))
+        value = await cache.aget(key)
+        if value is not None:
+            return value
+        if await cache.aget(f"lease:{key}") is None:
+            return None
+        interval = min(interval * 2, longest)
+    return None
+
 
 # ---------------------------------------------------------------------------
 # PodcastDetailService
@@ -141,6 +508,14 @@ class PodcastDetailService:
         podvault:pod:<slug>:fresh    ← freshness sentinel     (FRESH_TTL = 1 h)
         podvault:credits:<slug>      ← credits payload        (MAIN_TTL = 24 h)
         podvault:credits:<slug>:fresh← credits sentinel       (FRESH_TTL = 1 h)
+        podvault:pod:<slug>:missing  ← iTunes found nothing     (NOT_FOUND_TTL = 60 s)
+        podvault:lease:<main key>    ← single-flight fetch lease (LEASE_TTL = 30 s)
+
+    A stale entry enqueues at most one refresh task per lease: the task
+    releases the lease when it finishes.  A cold miss is fetched by the
+    lease holder alone; other callers wait for its result, fetch
+    themselves only if the holder gave up its lease without one, and get
+    :class:`FetchPending` while it is still fetching.
     """
 
     # ------------------------------------------------------------------
@@ -175,19 +550,23 @@ class PodcastDetailService:
         if cached is not None:
             if cache.get(fresh_key) is None:
                 # Data is stale — serve immediately then revalidate in BG
-                logger.info(
-                    "[DetailService] STALE — serving cached data for '%s', "
-                    "dispatching background refresh.",
-                    slug,
-                )
-                self._dispatch_refresh(slug, main_ttl, fresh_ttl)
+                lease = acquire_lease(main_key)
+                if lease:
+                    logger.info(
+                        "[DetailService] STALE — serving cached data for '%s', "
+                        "dispatching background refresh.",
+                        slug,
+                    )
+                    self._dispatch_refresh(slug, main_ttl, fresh_ttl, lease)
+                else:
+                    logger.info("[DetailService] STALE — refresh already running for '%s'.", slug)
             else:
                 logger.info("[DetailService] FRESH HIT — key: %s", main_key)
             return cached
 
         # Cold start — no data at all; fetch synchronously
         logger.info("[DetailService] COLD MISS — fetching '%s' synchronously.", slug)
-        return self._fetch_and_cache(slug, main_ttl, fresh_ttl)
+        return self._coalesce(main_key, lambda: self._fetch_and_cache(slug, main_ttl, fresh_ttl))
 
     # ------------------------------------------------------------------
     # Public — credits
@@ -217,18 +596,138 @@ class PodcastDetailService:
 
         if cached is not None:
             if cache.get(fresh_key) is None:
-                logger.info(
-                    "[CreditsService] STALE — serving cached credits for '%s', "
-                    "dispatching background refresh.",
-                    slug,
-                )
-                self._dispatch_credits_refresh(slug, main_ttl, fresh_ttl)
+                lease = acquire_lease(main_key)
+                if lease:
+                    logger.info(
+                        "[CreditsService] STALE — serving cached credits for '%s', "
+                        "dispatching background refresh.",
+                        slug,
+                    )
+                    self._dispatch_credits_refresh(slug, main_ttl, fresh_ttl, lease)
+                else:
+                    logger.info("[CreditsService] STALE — refresh already running for '%s'.", slug)
             else:
                 logger.info("[CreditsService] FRESH HIT — key: %s", main_key)
             return cached
 
         logger.info("[CreditsService] COLD MISS — fetching credits for '%s'.", slug)
-        return self._fetch_and_cache_credits(slug, main_ttl, fresh_ttl)
+        return self._coalesce(main_key, lambda: self._fetch_and_cache_credits(slug, main_ttl, fresh_ttl))
+
+    # ------------------------------------------------------------------
+    # Public — async (ASGI views)
+    # ------------------------------------------------------------------
+
+    async def aget_detail(
+        self,
+        slug: str,
+        main_ttl: int = _MAIN_TTL,
+        fresh_ttl: int = _FRESH_TTL,
+    ) -> Optional[Dict[str, Any]]:
+        """Async :meth:`get_detail` — same SWR states, cold fetch on the event loop."""
+        main_key = f"pod:{slug}"
+        cached = await cache.aget(main_key)
+
+        if cached is not None:
+            if await cache.aget(f"pod:{slug}:fresh") is None:
+                lease = await aacquire_lease(main_key)
+                if lease:
+                    logger.info(
+                        "[DetailService] STALE — serving cached data for '%s', "
+                        "dispatching background refresh.",
+                        slug,
+                    )
+                    await sync_to_async(self._dispatch_refresh)(slug, main_ttl, fresh_ttl, lease)
+                else:
+                    logger.info("[DetailService] STALE — refresh already running for '%s'.", slug)
+            else:
+                logger.info("[DetailService] FRESH HIT — key: pod:%s", slug)
+            return cached
+
+        logger.info("[DetailService] COLD MISS — fetching '%s'.", slug)
+        return await self._acoalesce(main_key, lambda: self._afetch_and_cache(slug, main_ttl, fresh_ttl))
+
+    async def aget_credits(
+        self,
+        slug: str,
+        main_ttl: int = _MAIN_TTL,
+        fresh_ttl: int = _FRESH_TTL,
+    ) -> Dict[str, Any]:
+        """Async :meth:`get_credits`."""
+        main_key = f"credits:{slug}"
+        cached = await cache.aget(main_key)
+
+        if cached is not None:
+            if await cache.aget(f"credits:{slug}:fresh") is None:
+                lease = await aacquire_lease(main_key)
+                if lease:
+                    logger.info(
+                        "[CreditsService] STALE — serving cached credits for '%s', "
+                        "dispatching background refresh.",
+                        slug,
+                    )
+                    await sync_to_async(self._dispatch_credits_refresh)(slug, main_ttl, fresh_ttl, lease)
+                else:
+                    logger.info("[CreditsService] STALE — refresh already running for '%s'.", slug)
+            else:
+                logger.info("[CreditsService] FRESH HIT — key: credits:%s", slug)
+            return cached
+
+        logger.info("[CreditsService] COLD MISS — fetching credits for '%s'.", slug)
+        return await self._acoalesce(
+            main_key, lambda: self._afetch_and_cache_credits(slug, main_ttl, fresh_ttl)
+        )
+
+    # ------------------------------------------------------------------
+    # Single-flight cold fetch
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _coalesce(key: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Run *fetch* only if this caller wins the lease on *key*; otherwise
+        wait for the winner's result.  If the winner found nothing the
+        answer is ``None``; if it failed (its lease is gone) the caller
+        takes the lease and fetches itself; if it is still fetching the
+        caller raises :class:`FetchPending` instead of joining the stampede.
+        """
+        if cache.get(f"{key}:missing"):
+            return None
+        lease = acquire_lease(key)
+        if lease is None:
+            logger.info("[DetailService] COALESCED — waiting for in-flight fetch of %s.", key)
+            value = _wait_for_value(key)
+            if value is not None:
+                return value
+            if cache.get(f"{key}:missing"):
+                return None
+            lease = acquire_lease(key)
+            if lease is None:
+                raise FetchPending(f"{key} is still being fetched", provider="podvault")
+        try:
+            return fetch()
+        finally:
+            release_lease(key, lease)
+
+    @staticmethod
+    async def _acoalesce(key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Async :meth:`_coalesce`."""
+        if await cache.aget(f"{key}:missing"):
+            return None
+        lease = await aacquire_lease(key)
+        if lease is None:
+            logger.info("[DetailService] COALESCED — waiting for in-flight fetch of %s.", key)
+            value = await _await_value(key)
+            if value is not None:
+                return value
+            if await cache.aget(f"{key}:missing"):
+                return None
+            lease = await aacquire_lease(key)
+            if lease is None:
+                raise FetchPending(f"{key} is still being fetched", provider="podvault")
+        try:
+            return await fetch()
+        finally:
+            await arelease_lease(key, lease)
 
     # ------------------------------------------------------------------
     # Fetch helpers (synchronous — used on cold start)
@@ -244,13 +743,14 @@ class PodcastDetailService:
 
         if not results:
             logger.warning("[DetailService] iTunes returned nothing for '%s'.", slug)
+            cache.set(f"pod:{slug}:missing", True, timeout=_NOT_FOUND_TTL)
             return None
 
         payload = asdict(results[0])
         payload  = _hydrate_with_podchaser(payload, query)
 
-        cache.set(main_key  := f"pod:{slug}",         payload,  timeout=main_ttl)
-        cache.set(fresh_key := f"pod:{slug}:fresh",   True,     timeout=fresh_ttl)
+        cache.set(f"pod:{slug}",         payload,  timeout=main_ttl)
+        cache.set(f"pod:{slug}:fresh",   True,     timeout=fresh_ttl)
         logger.info(
             "[DetailService] Primed main (%ds) + fresh (%ds) keys for '%s'.",
             main_ttl, fresh_ttl, slug,
@@ -278,28 +778,71 @@ class PodcastDetailService:
         cache.set(f"credits:{slug}:fresh",  True,     timeout=fresh_ttl)
         return payload
 
+    async def _afetch_and_cache(
+        self, slug: str, main_ttl: int, fresh_ttl: int
+    ) -> Optional[Dict[str, Any]]:
+        """Async :meth:`_fetch_and_cache`."""
+        query = slug.replace("-", " ")
+        results = await ITunesProvider().asearch(query, limit=1)
+
+        if not results:
+            logger.warning("[DetailService] iTunes returned nothing for '%s'.", slug)
+            await cache.aset(f"pod:{slug}:missing", True, timeout=_NOT_FOUND_TTL)
+            return None
+
+        payload = await _ahydrate_with_podchaser(asdict(results[0]), query)
+
+        await cache.aset(f"pod:{slug}",        payload, timeout=main_ttl)
+        await cache.aset(f"pod:{slug}:fresh",  True,    timeout=fresh_ttl)
+        return payload
+
+    async def _afetch_and_cache_credits(
+        self, slug: str, main_ttl: int, fresh_ttl: int
+    ) -> Dict[str, Any]:
+        """Async :meth:`_fetch_and_cache_credits`."""
+        podchaser = PodchaserProvider()
+        credits_list: List[Dict[str, Any]] = []
+
+        try:
+            results = await podchaser.asearch(slug.replace("-", " "), limit=1)
+            if results:
+                credits_list = await podchaser.aget_credits(results[0].remote_id)
+        except (QuotaExhausted, ProviderError) as exc:
+            logger.warning("[CreditsService] Podchaser error: %s", exc)
+
+        payload = {"slug": slug, "provider": "podchaser", "credits": credits_list}
+        await cache.aset(f"credits:{slug}",        payload, timeout=main_ttl)
+        await cache.aset(f"credits:{slug}:fresh",  True,    timeout=fresh_ttl)
+        return payload
+
     # ------------------------------------------------------------------
     # Celery dispatch
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _dispatch_refresh(slug: str, main_ttl: int, fresh_ttl: int) -> None:
-        """Fire-and-forget: enqueue the background detail refresh task."""
+    def _dispatch_refresh(
+        slug: str, main_ttl: int, fresh_ttl: int, lease: Optional[str] = None
+    ) -> None:
+        """Fire-and-forget: enqueue the background detail refresh task (it releases *lease*)."""
         try:
             from podcasts.tasks import refresh_podcast_detail
-            refresh_podcast_detail.delay(slug, main_ttl, fresh_ttl)
+            refresh_podcast_detail.delay(slug, main_ttl, fresh_ttl, lease)
         except Exception as exc:                                    # noqa: BLE001
             # Celery may not be running in development — log and continue.
             logger.warning("[DetailService] Could not dispatch refresh task: %s", exc)
+            release_lease(f"pod:{slug}", lease)
 
     @staticmethod
-    def _dispatch_credits_refresh(slug: str, main_ttl: int, fresh_ttl: int) -> None:
-        """Fire-and-forget: enqueue the background credits refresh task."""
+    def _dispatch_credits_refresh(
+        slug: str, main_ttl: int, fresh_ttl: int, lease: Optional[str] = None
+    ) -> None:
+        """Fire-and-forget: enqueue the background credits refresh task (it releases *lease*)."""
         try:
             from podcasts.tasks import refresh_podcast_credits
-            refresh_podcast_credits.delay(slug, main_ttl, fresh_ttl)
+            refresh_podcast_credits.delay(slug, main_ttl, fresh_ttl, lease)
         except Exception as exc:                                    # noqa: BLE001
             logger.warning("[CreditsService] Could not dispatch credits task: %s", exc)
+            release_lease(f"credits:{slug}", lease)
 
 
 # ---------------------------------------------------------------------------
@@ -319,21 +862,34 @@ def _hydrate_with_podchaser(
     Returns *base* unmodified if Podchaser is unavailable.
     """
     try:
-        podchaser = PodchaserProvider()
-        pc_results = podchaser.search(query, limit=1)
-        if not pc_results:
-            return base
+        return _apply_podchaser(base, PodchaserProvider().search(query, limit=1))
+    except (QuotaExhausted, ProviderError) as exc:
+        logger.warning("[Hydration] Podchaser unavailable — iTunes-only data returned. %s", exc)
+    return base
 
-        pc_data = asdict(pc_results[0])
-        base["rating"]  = pc_data.get("rating")  or base.get("rating")
-        base["credits"] = pc_data.get("credits") or []
 
-        logger.info(
-            "[Hydration] rating=%s, credits=%d",
-            base["rating"],
-            len(base["credits"] or []),
-        )
+async def _ahydrate_with_podchaser(
+    base: Dict[str, Any], query: str
+) -> Dict[str, Any]:
+    """Async :func:`_hydrate_with_podchaser`."""
+    try:
+        return _apply_podchaser(base, await PodchaserProvider().asearch(query, limit=1))
     except (QuotaExhausted, ProviderError) as exc:
         logger.warning("[Hydration] Podchaser unavailable — iTunes-only data returned. %s", exc)
+    return base
+
+
+def _apply_podchaser(base: Dict[str, Any], pc_results: List[Any]) -> Dict[str, Any]:
+    if not pc_results:
+        return base
+
+    pc_data = asdict(pc_results[0])
+    base["rating"]  = pc_data.get("rating")  or base.get("rating")
+    base["credits"] = pc_data.get("credits") or []
 
+    logger.info(
+        "[Hydration] rating=%s, credits=%d",
+        base["rating"],
+        len(base["credits"] or []),
+    )
     return base
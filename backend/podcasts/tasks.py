@@ -18,17 +18,22 @@ Task overview
     Re-fetches Podchaser credits for a given slug and refreshes both
     cache keys.
 
+Both take the single-flight *lease* the service acquired before
+dispatching and release it when the refresh ends, so only one refresh per
+key is queued or running at a time.  While a retry is pending the lease is
+kept (it expires on its own after ``PODCAST_FETCH_LEASE_TTL``).
+
 Usage (internal — called automatically by the service layer)::
 
     from podcasts.tasks import refresh_podcast_detail
-    refresh_podcast_detail.delay("the-daily", 86400, 3600)
+    refresh_podcast_detail.delay("the-daily", 86400, 3600, lease_token)
 """
 
 from __future__ import annotations
 
 import logging
 from dataclasses import asdict
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from celery import shared_task
 from django.core.cache import cache
@@ -36,7 +41,7 @@ from django.core.cache import cache
 from podcasts.exceptions import ProviderError, QuotaExhausted
 from podcasts.providers.itunes import ITunesProvider
 from podcasts.providers.podchaser import PodchaserProvider
-from podcasts.services import _hydrate_with_podchaser
+from podcasts.services import _hydrate_with_podchaser, release_lease
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +63,7 @@ def refresh_podcast_detail(
     slug: str,
     main_ttl: int = 86_400,
     fresh_ttl: int = 3_600,
+    lease: Optional[str] = None,
 ) -> None:
     """
     Background task: re-fetch and cache hydrated podcast detail for *slug*.
@@ -73,9 +79,11 @@ def refresh_podcast_detail(
     :param slug:      URL-friendly podcast identifier.
     :param main_ttl:  Seconds until the full payload expires.
     :param fresh_ttl: Seconds until the freshness sentinel expires.
+    :param lease:     Single-flight lease token on ``pod:<slug>`` to release.
     """
     logger.info("[refresh_podcast_detail] Starting background refresh for slug='%s'.", slug)
 
+    retrying = False
     try:
         itunes = ITunesProvider()
         query = slug.replace("-", " ")
@@ -105,6 +113,7 @@ def refresh_podcast_detail(
             "[refresh_podcast_detail] Provider error for '%s': %s. "
             "Retrying...", slug, exc
         )
+        retrying = True
         raise self.retry(exc=exc)
 
     except Exception as exc:                                        # noqa: BLE001
@@ -113,6 +122,10 @@ def refresh_podcast_detail(
             "Will not retry.", slug, exc
         )
 
+    finally:
+        if not retrying:
+            release_lease(f"pod:{slug}", lease)
+
 
 # ---------------------------------------------------------------------------
 # Credits refresh
@@ -132,6 +145,7 @@ def refresh_podcast_credits(
     slug: str,
     main_ttl: int = 86_400,
     fresh_ttl: int = 3_600,
+    lease: Optional[str] = None,
 ) -> None:
     """
     Background task: re-fetch and cache Podchaser credits for *slug*.
@@ -147,9 +161,11 @@ def refresh_podcast_credits(
     :param slug:      URL-friendly podcast identifier.
     :param main_ttl:  Seconds until credits payload expires.
     :param fresh_ttl: Seconds until freshness sentinel expires.
+    :param lease:     Single-flight lease token on ``credits:<slug>`` to release.
     """
     logger.info("[refresh_podcast_credits] Starting refresh for slug='%s'.", slug)
 
+    retrying = False
     try:
         podchaser = PodchaserProvider()
         query = slug.replace("-", " ")
@@ -187,9 +203,14 @@ def refresh_podcast_credits(
             "[refresh_podcast_credits] Provider error for '%s': %s. "
             "Retrying...", slug, exc
         )
+        retrying = True
         raise self.retry(exc=exc)
 
     except Exception as exc:                                        # noqa: BLE001
         logger.error(
             "[refresh_podcast_credits] Unexpected error for '%s': %s.", slug, exc
         )
+
+    finally:
+        if not retrying:
+            release_lease(f"credits:{slug}", lease)
@@ -14,7 +14,7 @@ from __future__ import annotations
 import json
 import unittest
 from dataclasses import asdict
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from django.test import SimpleTestCase, override_settings
 
@@ -82,7 +82,7 @@ class TestITunesProvider(SimpleTestCase):
         mock_resp.raise_for_status = MagicMock()
         return mock_resp
 
-    @patch("podcasts.providers.itunes.requests.get")
+    @patch("podcasts.providers.itunes.http_client.get")
     @patch("podcasts.providers.itunes._rate_limiter.acquire", return_value=None)
     def test_search_returns_normalized_list(self, _mock_limiter, mock_get):
         mock_get.return_value = self._make_response([_ITUNES_ITEM])
@@ -99,7 +99,7 @@ class TestITunesProvider(SimpleTestCase):
         self.assertEqual(pod.total_episodes, 55)
         self.assertEqual(pod.provider, "itunes")
 
-    @patch("podcasts.providers.itunes.requests.get")
+    @patch("podcasts.providers.itunes.http_client.get")
     @patch("podcasts.providers.itunes._rate_limiter.acquire", return_value=None)
     def test_search_skips_items_without_feed_url(self, _mock_limiter, mock_get):
         item_no_feed = {**_ITUNES_ITEM, "feedUrl": None}
@@ -109,12 +109,13 @@ class TestITunesProvider(SimpleTestCase):
         results = provider.search("test")
         self.assertEqual(results, [])
 
-    @patch("podcasts.providers.itunes.requests.get")
+    @patch("podcasts.providers.itunes.http_client.get")
     @patch("podcasts.providers.itunes._rate_limiter.acquire", return_value=None)
     @patch("podcasts.providers.itunes.time.sleep", return_value=None)
     def test_search_raises_rate_limit_after_retries(self, _sleep, _limiter, mock_get):
         mock_resp = MagicMock()
         mock_resp.status_code = 429
+        mock_resp.headers = {}
         mock_get.return_value = mock_resp
         from podcasts.providers.itunes import ITunesProvider
         from podcasts.exceptions import RateLimitExceeded
@@ -150,7 +151,7 @@ class TestTaddyProvider(SimpleTestCase):
         return mock_resp
 
     @override_settings(TADDY_API_KEY="testkey", TADDY_USER_ID="testuser")
-    @patch("podcasts.providers.taddy.requests.post")
+    @patch("podcasts.providers.taddy.http_client.post")
     def test_search_returns_normalized_list(self, mock_post):
         mock_post.return_value = self._make_response([_TADDY_ITEM])
         from podcasts.providers.taddy import TaddyProvider
@@ -165,7 +166,7 @@ class TestTaddyProvider(SimpleTestCase):
         self.assertEqual(pod.provider, "taddy")
 
     @override_settings(TADDY_API_KEY="testkey", TADDY_USER_ID="testuser")
-    @patch("podcasts.providers.taddy.requests.post")
+    @patch("podcasts.providers.taddy.http_client.post")
     def test_429_raises_rate_limit_exceeded(self, mock_post):
         mock_resp = MagicMock()
         mock_resp.status_code = 429
@@ -208,7 +209,7 @@ class TestPodchaserProvider(SimpleTestCase):
 
     @override_settings(PODCHASER_CREDENTIALS="key1:secret1,key2:secret2")
     @patch("podcasts.providers.podchaser.cache")
-    @patch("podcasts.providers.podchaser.requests.post")
+    @patch("podcasts.providers.podchaser.http_client.post")
     def test_search_normalizes_correctly(self, mock_post, mock_cache):
         mock_cache.get_or_set.return_value = "MOCK_TOKEN"
         mock_resp = MagicMock()
@@ -233,7 +234,7 @@ class TestPodchaserProvider(SimpleTestCase):
 
     @override_settings(PODCHASER_CREDENTIALS="key1:secret1,key2:secret2")
     @patch("podcasts.providers.podchaser.cache")
-    @patch("podcasts.providers.podchaser.requests.post")
+    @patch("podcasts.providers.podchaser.http_client.post")
     def test_key_rotation_on_quota_exhausted(self, mock_post, mock_cache):
         """First credential returns 402; provider rotates to key2 which succeeds."""
         mock_cache.get_or_set.return_value = "MOCK_TOKEN"
@@ -259,7 +260,7 @@ class TestPodchaserProvider(SimpleTestCase):
 
     @override_settings(PODCHASER_CREDENTIALS="key1:secret1")
     @patch("podcasts.providers.podchaser.cache")
-    @patch("podcasts.providers.podchaser.requests.post")
+    @patch("podcasts.providers.podchaser.http_client.post")
     def test_all_credentials_exhausted_raises_quota_exhausted(self, mock_post, mock_cache):
         mock_cache.get_or_set.return_value = "MOCK_TOKEN"
         failed_resp = MagicMock()
@@ -343,6 +344,124 @@ class TestPodcastSearchService(SimpleTestCase):
         self.assertEqual(results[0]["title"], "Cached Result")
 
 
+# ---------------------------------------------------------------------------
+# Federated search — provider=all
+# ---------------------------------------------------------------------------
+
+class TestFederatedSearch(SimpleTestCase):
+    """Fan-out merge / de-duplication and the per-provider deadline."""
+
+    def _pod(self, provider, title, author="A", rss_feed=None, **extra):
+        from podcasts.providers.base import NormalizedPodcast
+        return NormalizedPodcast(
+            provider=provider, remote_id=title, title=title, author=author,
+            description=None, cover_url=None, rss_feed=rss_feed, genre=None,
+            total_episodes=None, **extra,
+        )
+
+    def _providers(self, **results):
+        def get_provider(name):
+            provider = MagicMock()
+            value = results.get(name, [])
+            if callable(value):
+                provider.search.side_effect = value
+            else:
+                provider.search.return_value = value
+            return provider
+        return get_provider
+
+    def test_merge_dedups_on_feed_and_on_title_author(self):
+        from podcasts.services import FederatedSearch
+        providers = self._providers(
+            itunes=[self._pod("itunes", "Vault Cast", rss_feed="https://rss.example.com/feed")],
+            taddy=[self._pod("taddy", "Vault Cast (HD)", rss_feed="http://www.rss.example.com/feed/",
+                             rating=4.5)],
+            podchaser=[self._pod("podchaser", "vault cast!", author="a"),
+                       self._pod("podchaser", "Other Show")],
+        )
+        with patch("podcasts.services.get_provider", side_effect=providers):
+            payload = FederatedSearch().search("vault")
+
+        titles = [r["title"] for r in payload["results"]]
+        self.assertEqual(titles, ["Vault Cast", "Other Show"])
+        first = payload["results"][0]
+        self.assertEqual(first["sources"], ["itunes", "taddy", "podchaser"])
+        self.assertEqual(first["rating"], 4.5)  # filled in from the duplicate
+        self.assertEqual(set(payload["providers"].values()), {"ok"})
+
+    def test_slow_provider_is_dropped_at_its_deadline(self):
+        import threading
+        import time
+        from podcasts.services import FederatedSearch
+
+        release = threading.Event()
+
+        def slow(query, limit):
+            release.wait(5)
+            return [self._pod("podchaser", "Late Show")]
+
+        providers = self._providers(itunes=[self._pod("itunes", "Quick Show")], podchaser=slow)
+        try:
+            with patch("podcasts.services.get_provider", side_effect=providers), \
+                    patch("podcasts.services._FANOUT_DEADLINE", 0.2):
+                started = time.monotonic()
+                payload = FederatedSearch().search("show")
+                elapsed = time.monotonic() - started
+        finally:
+            release.set()
+
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual([r["title"] for r in payload["results"]], ["Quick Show"])
+        self.assertEqual(payload["providers"]["podchaser"], "timeout")
+
+    def test_throttled_provider_frees_its_thread_at_the_deadline(self):
+        import time
+        from podcasts.rate_limiter import RateLimiter
+        from podcasts.services import FederatedSearch
+
+        limiter = RateLimiter(max_calls=1, period=60.0)
+        limiter.acquire()
+        finished = []
+
+        def throttled(query, limit):
+            try:
+                limiter.acquire()
+                return [self._pod("podchaser", "Late Show")]
+            finally:
+                finished.append(time.monotonic())
+
+        providers = self._providers(itunes=[self._pod("itunes", "Quick Show")], podchaser=throttled)
+        with patch("podcasts.services.get_provider", side_effect=providers), \
+                patch("podcasts.services._FANOUT_DEADLINE", 0.2):
+            started = time.monotonic()
+            payload = FederatedSearch().search("show")
+
+        deadline = time.monotonic() + 1.0
+        while not finished and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(finished and finished[0] - started < 1.0)    # not the bucket's 60 s
+        self.assertEqual(payload["providers"]["podchaser"], "error")
+
+    @patch("podcasts.services.cache")
+    def test_partial_result_is_cached_briefly(self, mock_cache):
+        from podcasts.services import _PARTIAL_TTL, PodcastSearchService
+
+        def broken(query, limit):
+            raise RuntimeError("down")
+
+        mock_cache.get.return_value = None
+        providers = self._providers(itunes=[self._pod("itunes", "Only Show")], taddy=broken)
+        with patch("podcasts.services.get_provider", side_effect=providers):
+            results = PodcastSearchService().search("show", provider="all")
+
+        self.assertEqual([r["title"] for r in results], ["Only Show"])
+        mock_cache.set.assert_called_once()
+        key, payload = mock_cache.set.call_args.args
+        self.assertEqual(key, "search:all:show:20")
+        self.assertEqual(payload["providers"]["taddy"], "error")
+        self.assertEqual(mock_cache.set.call_args.kwargs["timeout"], _PARTIAL_TTL)
+
+
 # ---------------------------------------------------------------------------
 # PodcastDetailService — Stale-While-Revalidate (SWR)
 # ---------------------------------------------------------------------------
@@ -437,6 +556,101 @@ class TestSWRDetailService(SimpleTestCase):
         mock_dispatch.assert_called_once()
 
 
+# ---------------------------------------------------------------------------
+# Single-flight leases
+# ---------------------------------------------------------------------------
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class TestSingleFlight(SimpleTestCase):
+
+    def setUp(self):
+        from django.core.cache import cache
+        cache.clear()
+
+    def test_stale_burst_dispatches_one_refresh(self):
+        from django.core.cache import cache
+        from podcasts.services import PodcastDetailService
+        cache.set("pod:the-daily", {"title": "The Daily"})   # fresh sentinel absent → stale
+
+        with patch.object(PodcastDetailService, "_dispatch_refresh") as mock_dispatch:
+            for _ in range(5):
+                self.assertEqual(PodcastDetailService().get_detail("the-daily")["title"], "The Daily")
+
+        mock_dispatch.assert_called_once()
+        lease = mock_dispatch.call_args.args[3]
+        self.assertEqual(cache.get("lease:pod:the-daily"), lease)
+
+    def test_cold_miss_waits_for_lease_holder(self):
+        import threading
+        from django.core.cache import cache
+        from podcasts.services import PodcastDetailService, acquire_lease
+        self.assertIsNotNone(acquire_lease("credits:the-daily"))   # another caller is fetching
+        payload = {"slug": "the-daily", "provider": "podchaser", "credits": []}
+        threading.Timer(0.1, cache.set, args=("credits:the-daily", payload)).start()
+
+        with patch("podcasts.services.PodchaserProvider") as mock_podchaser:
+            result = PodcastDetailService().get_credits("the-daily")
+
+        self.assertEqual(result, payload)
+        mock_podchaser.assert_not_called()
+
+    @patch("podcasts.services._COALESCE_WAIT", 0.2)
+    def test_cold_miss_reports_pending_while_holder_is_still_fetching(self):
+        from podcasts.exceptions import FetchPending
+        from podcasts.services import PodcastDetailService, acquire_lease
+        acquire_lease("credits:the-daily")
+
+        with patch("podcasts.services.PodchaserProvider") as mock_podchaser:
+            with self.assertRaises(FetchPending):
+                PodcastDetailService().get_credits("the-daily")
+
+        mock_podchaser.assert_not_called()
+
+    def test_cold_miss_fetches_itself_when_holder_gave_up(self):
+        import threading
+        from podcasts.services import PodcastDetailService, acquire_lease, release_lease
+        token = acquire_lease("credits:the-daily")
+        threading.Timer(0.1, release_lease, args=("credits:the-daily", token)).start()
+
+        with patch("podcasts.services.PodchaserProvider") as mock_podchaser:
+            mock_podchaser.return_value.search.return_value = []
+            result = PodcastDetailService().get_credits("the-daily")
+
+        self.assertEqual(result["credits"], [])
+        mock_podchaser.return_value.search.assert_called_once()
+
+    def test_not_found_is_remembered(self):
+        from podcasts.services import PodcastDetailService
+        with patch("podcasts.services.ITunesProvider") as mock_itunes:
+            mock_itunes.return_value.search.return_value = []
+            self.assertIsNone(PodcastDetailService().get_detail("no-such-show"))
+            self.assertIsNone(PodcastDetailService().get_detail("no-such-show"))
+
+        mock_itunes.return_value.search.assert_called_once()
+
+    def test_release_only_drops_own_lease(self):
+        from django.core.cache import cache
+        from podcasts.services import acquire_lease, release_lease
+        token = acquire_lease("pod:x")
+        self.assertIsNone(acquire_lease("pod:x"))
+        release_lease("pod:x", "someone-else")
+        self.assertEqual(cache.get("lease:pod:x"), token)
+        release_lease("pod:x", token)
+        self.assertIsNotNone(acquire_lease("pod:x"))
+
+    def test_release_on_redis_is_one_compare_and_delete(self):
+        from django.core.cache import cache
+        from podcasts.services import release_lease
+        from podvault_api.redis_client import _COMPARE_AND_DELETE
+        conn = MagicMock()
+        client = MagicMock(encode=lambda value: f"enc:{value}".encode())
+        with patch("podvault_api.redis_client.get_connection", return_value=conn), \
+                patch.object(cache, "client", client, create=True):
+            release_lease("pod:x", "token")
+        conn.eval.assert_called_once_with(_COMPARE_AND_DELETE, 1, cache.make_key("lease:pod:x"), b"enc:token")
+        conn.get.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # RateLimiter
 # ---------------------------------------------------------------------------
@@ -455,3 +669,261 @@ class TestRateLimiter(SimpleTestCase):
         for _ in range(3):
             limiter.acquire()
         self.assertAlmostEqual(limiter._tokens, 0.0, delta=0.1)
+
+    def _redis(self, *replies):
+        conn = MagicMock()
+        conn.eval.side_effect = list(replies)
+        return conn
+
+    @patch("podcasts.rate_limiter.time.sleep", return_value=None)
+    def test_named_limiter_takes_tokens_from_redis(self, mock_sleep):
+        from podcasts.rate_limiter import RateLimiter
+        limiter = RateLimiter(max_calls=20, period=60.0, name="itunes")
+        conn = self._redis([0, "0", "1.5"], [1, "0", "0"])
+        with patch("podcasts.rate_limiter.get_connection", return_value=conn):
+            limiter.acquire()
+        mock_sleep.assert_called_once_with(1.5)       # slept as long as the bucket said
+        key, capacity, rate, requested = conn.eval.call_args.args[2:]
+        self.assertEqual((key, capacity, requested), ("podvault:ratelimit:itunes", 20, 1))
+        self.assertAlmostEqual(rate, 20 / 60)
+
+    @patch("podcasts.rate_limiter.time.sleep", return_value=None)
+    def test_try_acquire_gives_up_without_sleeping_past_timeout(self, mock_sleep):
+        from podcasts.rate_limiter import RateLimiter
+        limiter = RateLimiter(max_calls=20, period=60.0, name="itunes")
+        with patch("podcasts.rate_limiter.get_connection", return_value=self._redis([0, "0", "3.0"])):
+            self.assertFalse(limiter.try_acquire(timeout=0.5))
+        mock_sleep.assert_not_called()
+        self.assertEqual(limiter.stats["rejected"], 1)
+
+    def test_acquire_stops_at_the_callers_deadline(self):
+        import time
+        from podcasts.exceptions import RateLimitExceeded
+        from podcasts.rate_limiter import RateLimiter, wait_until
+        limiter = RateLimiter(max_calls=1, period=60.0)
+        limiter.acquire()                              # bucket empty for the next minute
+
+        started = time.monotonic()
+        with wait_until(started + 0.1), self.assertRaises(RateLimitExceeded):
+            limiter.acquire()
+        self.assertLess(time.monotonic() - started, 0.5)
+
+    def test_falls_back_to_local_bucket_when_redis_fails(self):
+        from podcasts.rate_limiter import RateLimiter
+        limiter = RateLimiter(max_calls=2, period=60.0, name="itunes")
+        conn = self._redis(ConnectionError("down"))
+        with patch("podcasts.rate_limiter.get_connection", return_value=conn):
+            self.assertTrue(limiter.try_acquire())
+            self.assertTrue(limiter.try_acquire())
+            self.assertFalse(limiter.try_acquire())
+        self.assertEqual(conn.eval.call_count, 1)      # Redis not retried immediately
+
+    async def test_aacquire_runs_the_bucket_script_off_the_event_loop(self):
+        import threading
+        from podcasts.rate_limiter import RateLimiter
+        limiter = RateLimiter(max_calls=20, period=60.0, name="itunes")
+        threads = []
+
+        def take(*args):
+            threads.append(threading.current_thread())
+            return [1, "19", "0"]
+
+        conn = MagicMock()
+        conn.eval.side_effect = take
+        with patch("podcasts.rate_limiter.get_connection", return_value=conn):
+            await limiter.aacquire()
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+
+    @override_settings(PROVIDER_RATE_LIMITS={"taddy": {"max_calls": 5, "period": 10.0}})
+    def test_snapshot_reports_token_levels_per_provider(self):
+        from podcasts import rate_limiter
+        with patch.dict(rate_limiter._registry, clear=True), \
+                patch("podcasts.rate_limiter.get_connection", return_value=None):
+            limiter = rate_limiter.RateLimiter.for_provider("taddy")
+            self.assertIs(limiter, rate_limiter.RateLimiter.for_provider("taddy"))
+            self.assertIsNone(rate_limiter.RateLimiter.for_provider("unknown"))
+            limiter.acquire()
+            stats = rate_limiter.snapshot()["taddy"]
+        self.assertEqual(stats["capacity"], 5)
+        self.assertAlmostEqual(stats["tokens"], 4.0, delta=0.1)
+        self.assertEqual(stats["acquired"], 1)
+
+
+# ---------------------------------------------------------------------------
+# Async providers, services and views
+# ---------------------------------------------------------------------------
+
+class TestAsyncPaths(SimpleTestCase):
+
+    def _response(self, status, payload):
+        response = MagicMock()
+        response.status_code = status
+        response.headers = {}
+        response.json.return_value = payload
+        return response
+
+    @patch("podcasts.providers.itunes._rate_limiter.aacquire", new_callable=AsyncMock)
+    async def test_itunes_asearch_uses_async_client(self, _limiter):
+        from podcasts.providers.itunes import ITunesProvider
+        with patch("podcasts.providers.itunes.http_client.aget", new_callable=AsyncMock,
+                   return_value=self._response(200, {"results": [_ITUNES_ITEM]})) as mock_aget, \
+                patch("podcasts.providers.itunes.http_client.get") as mock_get:
+            results = await ITunesProvider().asearch("vault cast", limit=1)
+        self.assertEqual([pod.title for pod in results], ["Vault Cast"])
+        mock_aget.assert_awaited_once()
+        mock_get.assert_not_called()
+
+    @override_settings(TADDY_API_KEY="testkey", TADDY_USER_ID="testuser")
+    async def test_taddy_async_429_raises_rate_limit_exceeded(self):
+        from podcasts.exceptions import RateLimitExceeded
+        from podcasts.providers.taddy import TaddyProvider
+        with patch("podcasts.providers.taddy.http_client.apost", new_callable=AsyncMock,
+                   return_value=self._response(429, {})):
+            with self.assertRaises(RateLimitExceeded):
+                await TaddyProvider().asearch("test")
+
+    async def test_federated_asearch_cancels_late_providers(self):
+        import asyncio
+        from podcasts.providers.base import NormalizedPodcast
+        from podcasts.services import FederatedSearch
+
+        pod = NormalizedPodcast(
+            provider="itunes", remote_id="1", title="Quick Show", author="A",
+            description="", cover_url="", rss_feed="", genre="", total_episodes=0,
+        )
+
+        def get_provider(name):
+            provider = MagicMock()
+            if name == "itunes":
+                provider.asearch = AsyncMock(return_value=[pod])
+            else:
+                async def hang(query, limit):
+                    await asyncio.sleep(5)
+                provider.asearch = hang
+            return provider
+
+        with patch("podcasts.services.get_provider", side_effect=get_provider), \
+                patch("podcasts.services._FANOUT_DEADLINE", 0.1):
+            payload = await asyncio.wait_for(FederatedSearch().asearch("show"), timeout=1)
+
+        self.assertEqual([r["title"] for r in payload["results"]], ["Quick Show"])
+        self.assertEqual(payload["providers"]["taddy"], "timeout")
+
+    async def test_search_view_awaits_service(self):
+        from podcasts.services import PodcastSearchService
+        with patch.object(PodcastSearchService, "asearch", new_callable=AsyncMock,
+                          return_value=[{"title": "Vault Cast"}]) as mock_asearch:
+            response = await self.async_client.get("/api/v1/podcasts/search/", {"q": "vault"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"count": 1, "provider": "itunes", "results": [{"title": "Vault Cast"}]})
+        mock_asearch.assert_awaited_once_with("vault", provider="itunes", limit=20)
+
+    async def test_detail_view_maps_provider_errors(self):
+        from podcasts.exceptions import QuotaExhausted
+        from podcasts.services import PodcastDetailService
+        with patch.object(PodcastDetailService, "aget_detail", new_callable=AsyncMock,
+                          side_effect=QuotaExhausted("spent", provider="podchaser")):
+            response = await self.async_client.get("/api/v1/podcasts/the-daily/")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()["error"], "QuotaExhausted")
+
+    def test_middleware_chain_is_async_end_to_end(self):
+        from django.conf import settings
+        from django.core.handlers.asgi import ASGIHandler
+        from django.utils.module_loading import import_string
+        for path in settings.MIDDLEWARE:
+            with self.subTest(middleware=path):
+                self.assertTrue(getattr(import_string(path), "async_capable", False))
+        with self.assertNoLogs("django.request", level="DEBUG"):   # "... adapted for middleware ..."
+            ASGIHandler()
+
+    async def test_static_files_are_served_ahead_of_django(self):
+        import tempfile
+        from pathlib import Path
+        from asgiref.testing import ApplicationCommunicator
+        from podvault_api.static import StaticFilesASGIHandler
+
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        Path(root.name, "app.js").write_text("console.log(1);")
+        seen = []
+
+        async def django_app(scope, receive, send):
+            seen.append(scope["path"])
+            await send({"type": "http.response.start", "status": 204, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        async def get(app, path):
+            scope = {"type": "http", "method": "GET", "path": path, "query_string": b"", "headers": []}
+            communicator = ApplicationCommunicator(app, scope)
+            await communicator.send_input({"type": "http.request", "body": b""})
+            start = await communicator.receive_output(timeout=5)
+            body = b""
+            while True:
+                message = await communicator.receive_output(timeout=5)
+                body += message.get("body", b"")
+                if not message.get("more_body"):
+                    return start["status"], body
+
+        with self.settings(STATIC_ROOT=root.name, WHITENOISE_AUTOREFRESH=False, WHITENOISE_USE_FINDERS=False):
+            app = StaticFilesASGIHandler(django_app)
+        self.assertEqual(await get(app, "/static/app.js"), (200, b"console.log(1);"))
+        self.assertEqual(await get(app, "/api/v1/podcasts/search/"), (204, b""))
+        self.assertEqual(seen, ["/api/v1/podcasts/search/"])
+
+    async def test_detail_view_asks_to_retry_while_fetch_is_pending(self):
+        from podcasts.exceptions import FetchPending
+        from podcasts.services import PodcastDetailService
+        with patch.object(PodcastDetailService, "aget_detail", new_callable=AsyncMock,
+                          side_effect=FetchPending("pod:the-daily", provider="podvault")):
+            response = await self.async_client.get("/api/v1/podcasts/the-daily/")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers["Retry-After"], "1")
+        self.assertEqual(response.json()["error"], "FetchPending")
+
+
+# ---------------------------------------------------------------------------
+# Shared outbound HTTP client
+# ---------------------------------------------------------------------------
+
+class TestHTTPClient(SimpleTestCase):
+
+    def _response(self, status):
+        response = MagicMock()
+        response.status_code = status
+        response.headers = {}
+        return response
+
+    def setUp(self):
+        from podvault_api import http_client
+        http_client.reset_metrics()
+
+    @patch("podvault_api.http_client.time.sleep", return_value=None)
+    def test_retries_retryable_status_and_records_metrics(self, mock_sleep):
+        from podvault_api.http_client import HTTPClient, snapshot
+        client = HTTPClient()
+        with patch("requests.Session.request",
+                   side_effect=[self._response(503), self._response(200)]) as mock_request:
+            response = client.get("https://api.example.com/x")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(mock_request.call_args.kwargs["timeout"], client.timeout)
+        mock_sleep.assert_called_once()
+        stats = snapshot()["api.example.com"]
+        self.assertEqual((stats["requests"], stats["retries"], stats["errors"]), (2, 1, 1))
+        self.assertEqual(stats["5xx"], 1)
+
+    def test_post_is_not_retried_by_default(self):
+        from podvault_api.http_client import HTTPClient
+        with patch("requests.Session.request", return_value=self._response(503)) as mock_request:
+            response = HTTPClient().post("https://api.example.com/pay", json={})
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(mock_request.call_count, 1)
+
+    def test_one_pooled_session_per_host(self):
+        from podvault_api.http_client import HTTPClient
+        client = HTTPClient()
+        self.assertIs(client.session("a.example.com"), client.session("a.example.com"))
+        self.assertIsNot(client.session("a.example.com"), client.session("b.example.com"))
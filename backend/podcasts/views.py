@@ -3,9 +3,13 @@ podcasts.views
 ~~~~~~~~~~~~~~
 DRF proxy views for the versioned /api/v1/podcasts/ endpoint group.
 
-All three endpoints are public (AllowAny) because the API keys live on
-the server — the client never interacts with Taddy, Podchaser or iTunes
-directly.
+All three endpoints are public because the API keys live on the server —
+the client never interacts with Taddy, Podchaser or iTunes directly.
+
+They are async Django views (not DRF ``APIView``, which cannot await):
+under Daphne a slow provider call waits on the event loop instead of
+tying up a worker thread, so one process holds hundreds of in-flight
+provider calls.  Responses are the same JSON payloads as before.
 
 Endpoint map
 ------------
@@ -18,12 +22,11 @@ from __future__ import annotations
 
 import logging
 
-from rest_framework.permissions import AllowAny
-from rest_framework.request import Request
-from rest_framework.response import Response
-from rest_framework.views import APIView
+from django.http import HttpRequest, JsonResponse
+from django.views import View
 
 from podcasts.exceptions import (
+    FetchPending,
     ProviderError,
     ProviderUnavailable,
     QuotaExhausted,
@@ -42,9 +45,9 @@ logger = logging.getLogger(__name__)
 
 def _error_response(
     exc: ProviderError, status_code: int = 502
-) -> Response:
+) -> JsonResponse:
     """Build a consistent error payload from a :class:`ProviderError`."""
-    return Response(
+    return JsonResponse(
         {
             "error": type(exc).__name__,
             "detail": str(exc),
@@ -54,46 +57,53 @@ def _error_response(
     )
 
 
+def _pending_response(exc: FetchPending) -> JsonResponse:
+    """503 asking the client to retry once the in-flight fetch has landed."""
+    response = _error_response(exc, status_code=503)
+    response["Retry-After"] = "1"
+    return response
+
+
 # ---------------------------------------------------------------------------
 # Views
 # ---------------------------------------------------------------------------
 
 
-class PodcastSearchView(APIView):
+class PodcastSearchView(View):
     """
     Global podcast search — delegates to the named provider via Redis Cache-Aside.
 
     Query params
     ------------
     q        : str   — Search term (required).
-    provider : str   — One of 'itunes', 'taddy', 'podchaser' (default: 'itunes').
+    provider : str   — One of 'itunes', 'taddy', 'podchaser', or 'all' for a
+                       federated search of every provider (default: 'itunes').
     limit    : int   — Max results to return, 1–50 (default: 20).
     """
 
-    permission_classes = [AllowAny]
     _service = PodcastSearchService()
 
-    def get(self, request: Request) -> Response:
-        query = request.query_params.get("q", "").strip()
+    async def get(self, request: HttpRequest) -> JsonResponse:
+        query = request.GET.get("q", "").strip()
         if not query:
-            return Response(
+            return JsonResponse(
                 {"error": "ValidationError", "detail": "Query parameter 'q' is required."},
                 status=400,
             )
 
-        provider = request.query_params.get("provider", "itunes").lower()
-        if provider not in AVAILABLE_PROVIDERS:
-            return Response(
+        provider = request.GET.get("provider", "itunes").lower()
+        if provider != "all" and provider not in AVAILABLE_PROVIDERS:
+            return JsonResponse(
                 {
                     "error": "ValidationError",
                     "detail": f"Unknown provider '{provider}'.",
-                    "available": AVAILABLE_PROVIDERS,
+                    "available": [*AVAILABLE_PROVIDERS, "all"],
                 },
                 status=400,
             )
 
         try:
-            limit = max(1, min(int(request.query_params.get("limit", 20)), 50))
+            limit = max(1, min(int(request.GET.get("limit", 20)), 50))
         except (TypeError, ValueError):
             limit = 20
 
@@ -101,9 +111,18 @@ class PodcastSearchView(APIView):
             "[PodcastSearchView] q='%s' provider='%s' limit=%d", query, provider, limit
         )
 
+        if provider == "all":
+            payload = await self._service.asearch_all(query, limit=limit)
+            return JsonResponse({
+                "count": len(payload["results"]),
+                "provider": provider,
+                "providers": payload["providers"],
+                "results": payload["results"],
+            })
+
         try:
-            results = self._service.search(query, provider=provider, limit=limit)
-            return Response({"count": len(results), "provider": provider, "results": results})
+            results = await self._service.asearch(query, provider=provider, limit=limit)
+            return JsonResponse({"count": len(results), "provider": provider, "results": results})
         except RateLimitExceeded as exc:
             logger.warning("[PodcastSearchView] Rate limit: %s", exc)
             return _error_response(exc, status_code=429)
@@ -122,7 +141,7 @@ class PodcastSearchView(APIView):
             )
 
 
-class PodcastDetailView(APIView):
+class PodcastDetailView(View):
     """
     Hydrated podcast detail — iTunes base data enriched with Podchaser social fields.
 
@@ -131,14 +150,15 @@ class PodcastDetailView(APIView):
     slug : str — URL-friendly podcast identifier (e.g. 'the-daily').
     """
 
-    permission_classes = [AllowAny]
     _service = PodcastDetailService()
 
-    def get(self, request: Request, slug: str) -> Response:
+    async def get(self, request: HttpRequest, slug: str) -> JsonResponse:
         logger.info("[PodcastDetailView] Fetching detail for slug '%s'.", slug)
 
         try:
-            detail = self._service.get_detail(slug)
+            detail = await self._service.aget_detail(slug)
+        except FetchPending as exc:
+            return _pending_response(exc)
         except RateLimitExceeded as exc:
             return _error_response(exc, status_code=429)
         except QuotaExhausted as exc:
@@ -147,15 +167,15 @@ class PodcastDetailView(APIView):
             return _error_response(exc, status_code=502)
 
         if detail is None:
-            return Response(
+            return JsonResponse(
                 {"error": "NotFound", "detail": f"No podcast found for slug '{slug}'."},
                 status=404,
             )
 
-        return Response(detail)
+        return JsonResponse(detail)
 
 
-class PodcastCreditsView(APIView):
+class PodcastCreditsView(View):
     """
     Guest and host credits sourced exclusively from Podchaser.
 
@@ -167,15 +187,16 @@ class PodcastCreditsView(APIView):
     are exhausted or unconfigured, so the UI degrades gracefully.
     """
 
-    permission_classes = [AllowAny]
     _service = PodcastDetailService()
 
-    def get(self, request: Request, slug: str) -> Response:
+    async def get(self, request: HttpRequest, slug: str) -> JsonResponse:
         logger.info("[PodcastCreditsView] Fetching credits for slug '%s'.", slug)
 
         try:
-            payload = self._service.get_credits(slug)
+            payload = await self._service.aget_credits(slug)
+        except FetchPending as exc:
+            return _pending_response(exc)
         except ProviderError as exc:
             return _error_response(exc, status_code=502)
 
-        return Response(payload)
+        return JsonResponse(payload)
@@ -13,4 +13,10 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'podvault_api.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# Static files are answered ahead of Django (see podvault_api.static), so the
+# middleware chain stays async for every view.
+from podvault_api.static import StaticFilesASGIHandler  # noqa: E402
+
+application = StaticFilesASGIHandler(django_application)
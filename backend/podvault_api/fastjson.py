@@ -0,0 +1,211 @@
+"""
+podvault_api.fastjson
+~~~~~~~~~~~~~~~~~~~~~
+Opt-in fast path for the hot read endpoints (episodes, podcasts, feed).
+
+DRF spends most of a large list response in per-field ``get_attribute`` /
+``to_representation`` calls on model instances and in the stdlib ``json``
+encoder.  With ``FAST_JSON_RENDERING = True``:
+
+* :class:`ValuesSerializer` compiles a ``ModelSerializer`` once per
+  request into a flat plan — output name, ``values()`` lookup, optional
+  converter — and applies it to ``values()`` rows.  Nested ``many=True``
+  serializers become one extra ``values()`` query each, grouped by parent;
+* :class:`FastJSONRenderer` encodes with ``orjson`` when it is installed.
+
+Output is the same JSON the DRF serializer and ``JSONRenderer`` produce,
+down to keys DRF drops: a dotted source through a NULL relation (e.g.
+``creator.username`` with no creator) falls back to the field's default,
+``null`` if ``allow_null``, or is omitted, as ``Field.get_attribute`` does.
+Fields the compiler cannot express as a column raise
+``ImproperlyConfigured``; serializers map them with ``values_lookups``
+(e.g. ``{'category': 'category__name'}`` for a ``StringRelatedField``).
+``SerializerMethodField`` methods are called with the row dict.
+
+``manage.py bench_serializers`` compares both paths on 1k-row pages.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db.models import F, QuerySet
+from rest_framework.fields import empty
+from rest_framework import fields as drf_fields
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:                                                 # pragma: no cover
+    orjson = None
+
+#: DRF fields whose representation differs from the raw column value.
+_CONVERTED_FIELDS = (
+    drf_fields.DateTimeField, drf_fields.DateField, drf_fields.TimeField,
+    drf_fields.DecimalField, drf_fields.DurationField, drf_fields.FloatField,
+)
+
+#: Guard fallback meaning "leave the key out" (DRF's ``SkipField``).
+_SKIP = object()
+
+
+def fast_json_enabled() -> bool:
+    return getattr(settings, 'FAST_JSON_RENDERING', False)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """``JSONRenderer`` producing identical bytes through ``orjson``."""
+
+    _encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            # Datetimes go through DRF's encoder so UTC keeps its "Z" suffix.
+            ret = orjson.dumps(data, default=self._encoder.default,
+                               option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            # Same JavaScript-safety escaping as JSONRenderer.
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
+
+class ValuesSerializer:
+    """A ``ModelSerializer`` instance compiled into a ``values()`` row mapping."""
+
+    def __init__(self, serializer: serializers.ModelSerializer, extra: Iterable[str] = ()):
+        self.model = serializer.Meta.model
+        self.pk = self.model._meta.pk.attname
+        lookups = getattr(serializer, 'values_lookups', {})
+        columns = {self.pk: None}
+        #: (output name, row key, converter, guard); a row key of None means
+        #: ``converter(row)``.  A guard is ``(relation row keys, fallback)``:
+        #: when any of those relations is NULL the fallback replaces the value.
+        self.plan: List[Tuple[str, Optional[str], Any, Optional[Tuple[List[str], Any]]]] = []
+        #: (output name, child ValuesSerializer, lookup from child back to parent)
+        self.nested: List[Tuple[str, 'ValuesSerializer', str]] = []
+
+        for name, field in serializer.fields.items():
+            if name in lookups:
+                columns[lookups[name]] = None
+                self.plan.append((name, lookups[name], None, None))
+            elif isinstance(field, serializers.ListSerializer):
+                self.plan.append((name, name, None, None))
+                self.nested.append((name, ValuesSerializer(field.child), self._parent_lookup(field.source)))
+            elif isinstance(field, serializers.SerializerMethodField):
+                self.plan.append((name, None, getattr(serializer, field.method_name), None))
+            elif isinstance(field, serializers.ManyRelatedField) or (
+                    isinstance(field, serializers.RelatedField)
+                    and not isinstance(field, serializers.PrimaryKeyRelatedField)):
+                raise ImproperlyConfigured(
+                    f"{type(serializer).__name__}.{name}: add it to values_lookups for the fast path")
+            else:
+                lookup = '__'.join(field.source_attrs)
+                columns[lookup] = None
+                convert = field.to_representation if isinstance(field, _CONVERTED_FIELDS) else None
+                guard = None
+                if len(field.source_attrs) > 1:
+                    relations = ['__'.join(field.source_attrs[:i]) for i in range(1, len(field.source_attrs))]
+                    for relation in relations:
+                        columns[relation] = None
+                    guard = (relations, self._missing(field))
+                self.plan.append((name, lookup, convert, guard))
+        for name in extra:
+            columns[name] = None
+        self.columns = list(columns)
+
+    @staticmethod
+    def _missing(field) -> Any:
+        """What DRF renders for *field* when a relation on its source is NULL."""
+        if field.default is not empty:
+            return field.get_default()
+        if field.allow_null:
+            return None
+        return _SKIP
+
+    def _parent_lookup(self, source: str) -> str:
+        """Lookup on the child model that yields the parent's primary key."""
+        try:
+            relation = self.model._meta.get_field(source)
+        except FieldDoesNotExist:
+            raise ImproperlyConfigured(f"{self.model.__name__}.{source} is not a relation")
+        if relation.auto_created and not relation.concrete:
+            return relation.field.name                  # reverse FK / reverse M2M
+        return relation.related_query_name()            # forward M2M
+
+    def values(self, queryset: QuerySet) -> QuerySet:
+        return queryset.prefetch_related(None).values(*self.columns)
+
+    def serialize(self, queryset: QuerySet) -> List[Dict[str, Any]]:
+        return self.to_representation(list(self.values(queryset)))
+
+    def to_representation(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        children = {}
+        if self.nested and rows:
+            ids = [row[self.pk] for row in rows]
+            for name, child, parent in self.nested:
+                child_rows = list(
+                    child.model._default_manager.filter(**{f'{parent}__in': ids})
+                    .values(*child.columns, _parent_pk=F(parent))
+                )
+                grouped = defaultdict(list)
+                for row, data in zip(child_rows, child.to_representation(child_rows)):
+                    grouped[row['_parent_pk']].append(data)
+                children[name] = grouped
+
+        plan = self.plan
+        out = []
+        for row in rows:
+            data = {}
+            for name, key, convert, guard in plan:
+                if guard is not None and any(row[relation] is None for relation in guard[0]):
+                    if guard[1] is not _SKIP:
+                        data[name] = guard[1]
+                    continue
+                if key is None:
+                    data[name] = convert(row)
+                elif name in children:
+                    data[name] = children[name].get(row[self.pk], [])
+                else:
+                    value = row[key]
+                    data[name] = value if convert is None or value is None else convert(value)
+            out.append(data)
+        return out
+
+
+class FastJSONMixin:
+    """
+    View mixin: with ``FAST_JSON_RENDERING`` on, render with
+    :class:`FastJSONRenderer` and answer ``list`` from ``values()`` rows.
+    """
+
+    def get_renderers(self):
+        renderers = super().get_renderers()
+        if not fast_json_enabled():
+            return renderers
+        return [FastJSONRenderer() if type(r) is JSONRenderer else r for r in renderers]
+
+    def list(self, request, *args, **kwargs):
+        if not fast_json_enabled():
+            return super().list(request, *args, **kwargs)
+        fast = ValuesSerializer(self.get_serializer(), extra=self.fast_extra_columns())
+        queryset = fast.values(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(fast.to_representation(page))
+        return Response(fast.to_representation(list(queryset)))
+
+    def fast_extra_columns(self) -> List[str]:
+        # Keyset pagination builds its cursor from the last row.
+        return [name.lstrip('-') for name in getattr(self, 'cursor_ordering', ())]
@@ -0,0 +1,352 @@
+"""
+podvault_api.http_client
+~~~~~~~~~~~~~~~~~~~~~~~~
+Shared client for outbound calls to third-party APIs.
+
+Integrations used to call bare ``requests.get`` / ``requests.post``: no
+session, so every call paid a fresh TCP + TLS handshake, and several had
+no timeout at all.  They now go through this module, a drop-in for the
+``requests`` functions::
+
+    from podvault_api import http_client
+
+    response = http_client.get(url, params=params)
+
+* **Keep-alive pools per host** — one ``requests.Session`` per host, its
+  adapter holding up to ``HTTP_POOL_SIZE`` idle connections, so repeat
+  calls reuse a warm connection.  Sessions never store cookies, so nothing
+  leaks from one caller's call into another's.
+* **Default timeouts** — ``(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)``
+  unless the caller passes ``timeout=``.
+* **Jittered retries** — a :class:`RetryPolicy` retries connection errors,
+  timeouts and its retryable statuses with full-jitter exponential
+  back-off (``Retry-After`` wins when the server sends one).  Only
+  idempotent methods are retried unless a policy lists ``POST``; pass
+  ``retry=NO_RETRY`` where a repeat would be unsafe (payments).
+* **Per-host metrics** — attempts, retries, errors, status classes and
+  latency, readable with :func:`snapshot`.
+
+Responses and exceptions are plain ``requests`` objects, so callers keep
+their ``raise_for_status()`` / ``except requests.RequestException``.
+
+Async code paths (ASGI views) use :func:`arequest` / :func:`aget` /
+:func:`apost` instead: same timeouts, retry policies and metrics, on one
+pooled ``httpx.AsyncClient`` per event loop, so hundreds of in-flight
+calls cost sockets rather than threads.  Those return ``httpx`` responses
+and raise ``httpx.HTTPError``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+import time
+import weakref
+from collections import defaultdict
+from dataclasses import dataclass
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, FrozenSet, Optional
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "PodVault/1.0"
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How many times, on what, and how long to wait between attempts."""
+
+    attempts: int = getattr(settings, "HTTP_RETRIES", 2)   # retries after the first try
+    backoff: float = getattr(settings, "HTTP_RETRY_BACKOFF", 0.5)
+    max_backoff: float = 8.0
+    statuses: FrozenSet[int] = frozenset({502, 503, 504})
+    methods: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def applies_to(self, method: str) -> bool:
+        return self.attempts > 0 and method.upper() in self.methods
+
+    def delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Seconds to sleep before retry number *attempt* (0-based)."""
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+
+DEFAULT_RETRY = RetryPolicy()
+NO_RETRY = RetryPolicy(attempts=0)
+
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+_metrics_lock = threading.Lock()
+_host_stats: Dict[str, Dict[str, float]] = defaultdict(
+    lambda: {"requests": 0, "retries": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0,
+             "2xx": 0, "3xx": 0, "4xx": 0, "5xx": 0}
+)
+
+
+def _record(host: str, elapsed: float, status: Optional[int], retry: bool) -> None:
+    ms = elapsed * 1000
+    with _metrics_lock:
+        stats = _host_stats[host]
+        stats["requests"] += 1
+        stats["retries"] += retry
+        stats["total_ms"] += ms
+        stats["max_ms"] = max(stats["max_ms"], ms)
+        if status is None or status >= 500:
+            stats["errors"] += 1
+        if status is not None:
+            status_class = f"{status // 100}xx"
+            stats[status_class] = stats.get(status_class, 0) + 1
+
+
+def snapshot() -> Dict[str, Dict[str, float]]:
+    """Per-host totals with ``avg_ms`` and ``error_rate`` added."""
+    with _metrics_lock:
+        return {
+            host: {
+                **stats,
+                "avg_ms": stats["total_ms"] / stats["requests"],
+                "error_rate": stats["errors"] / stats["requests"],
+            }
+            for host, stats in _host_stats.items()
+        }
+
+
+def reset_metrics() -> None:
+    with _metrics_lock:
+        _host_stats.clear()
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+
+class HTTPClient:
+    """Per-host pooled sessions with default timeouts, retries and metrics."""
+
+    def __init__(
+        self,
+        timeout=None,
+        pool_size: Optional[int] = None,
+        retry: RetryPolicy = DEFAULT_RETRY,
+    ):
+        self.timeout = timeout or (
+            getattr(settings, "HTTP_CONNECT_TIMEOUT", 3.05),
+            getattr(settings, "HTTP_READ_TIMEOUT", 15.0),
+        )
+        self.pool_size = pool_size or getattr(settings, "HTTP_POOL_SIZE", 10)
+        self.retry = retry
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def session(self, host: str) -> requests.Session:
+        session = self._sessions.get(host)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(host)
+                if session is None:
+                    session = self._sessions[host] = self._build_session()
+        return session
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["User-Agent"] = USER_AGENT
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        return session
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        retry: Optional[RetryPolicy] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Send one request, retrying per *retry* (the client default if None).
+
+        The last response is returned even if its status was retryable; the
+        last exception is re-raised if every attempt failed in transport.
+        """
+        retry = self.retry if retry is None else retry
+        kwargs.setdefault("timeout", self.timeout)
+        host = urlsplit(url).netloc.lower()
+        session = self.session(host)
+        attempts = retry.attempts + 1 if retry.applies_to(method) else 1
+
+        attempt = 0
+        while True:
+            last = attempt + 1 >= attempts
+            started = time.perf_counter()
+            try:
+                response = session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                _record(host, time.perf_counter() - started, None, attempt > 0)
+                if last:
+                    raise
+                wait = retry.delay(attempt)
+                logger.warning("[http] %s %s failed (%s); retry in %.2fs", method, host, exc, wait)
+            else:
+                _record(host, time.perf_counter() - started, response.status_code, attempt > 0)
+                if last or response.status_code not in retry.statuses:
+                    return response
+                wait = retry.delay(attempt, response)
+                logger.warning("[http] %s %s → %d; retry in %.2fs", method, host, response.status_code, wait)
+                response.close()
+            time.sleep(wait)
+            attempt += 1
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> requests.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> requests.Response:
+        return self.request("DELETE", url, **kwargs)
+
+
+#: Process-wide client used by the module-level helpers.
+client = HTTPClient()
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    return client.request(method, url, **kwargs)
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return client.get(url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    return client.post(url, **kwargs)
+
+
+def put(url: str, **kwargs) -> requests.Response:
+    return client.put(url, **kwargs)
+
+
+def delete(url: str, **kwargs) -> requests.Response:
+    return client.delete(url, **kwargs)
+
+
+# ---------------------------------------------------------------------------
+# Async client
+# ---------------------------------------------------------------------------
+
+
+class AsyncHTTPClient:
+    """:class:`HTTPClient` for coroutines, on one ``httpx.AsyncClient`` per event loop."""
+
+    def __init__(self, timeout=None, retry: RetryPolicy = DEFAULT_RETRY):
+        self.timeout = _httpx_timeout(timeout or client.timeout)
+        self.retry = retry
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _build_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=getattr(settings, "HTTP_ASYNC_MAX_CONNECTIONS", 200),
+                max_keepalive_connections=getattr(settings, "HTTP_ASYNC_MAX_KEEPALIVE", 50),
+            ),
+            headers={"User-Agent": USER_AGENT},
+        )
+
+    def get_client(self) -> httpx.AsyncClient:
+        """Pooled client for the running event loop (clients cannot cross loops)."""
+        loop = asyncio.get_running_loop()
+        pooled = self._clients.get(loop)
+        if pooled is None or pooled.is_closed:
+            pooled = self._clients[loop] = self._build_client()
+        return pooled
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        retry: Optional[RetryPolicy] = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """Async :meth:`HTTPClient.request`."""
+        retry = self.retry if retry is None else retry
+        if "timeout" in kwargs:
+            kwargs["timeout"] = _httpx_timeout(kwargs["timeout"])
+        host = urlsplit(url).netloc.lower()
+        pooled = self.get_client()
+        attempts = retry.attempts + 1 if retry.applies_to(method) else 1
+
+        attempt = 0
+        while True:
+            last = attempt + 1 >= attempts
+            started = time.perf_counter()
+            try:
+                response = await pooled.request(method, url, **kwargs)
+            except httpx.TransportError as exc:
+                _record(host, time.perf_counter() - started, None, attempt > 0)
+                if last:
+                    raise
+                wait = retry.delay(attempt)
+                logger.warning("[http] %s %s failed (%s); retry in %.2fs", method, host, exc, wait)
+            else:
+                _record(host, time.perf_counter() - started, response.status_code, attempt > 0)
+                if last or response.status_code not in retry.statuses:
+                    return response
+                wait = retry.delay(attempt, response)
+                logger.warning("[http] %s %s → %d; retry in %.2fs", method, host, response.status_code, wait)
+            await asyncio.sleep(wait)
+            attempt += 1
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+
+def _httpx_timeout(timeout) -> httpx.Timeout:
+    """``requests``-style ``(connect, read)`` or seconds → ``httpx.Timeout``."""
+    if isinstance(timeout, httpx.Timeout):
+        return timeout
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+#: Process-wide async client used by the module-level helpers.
+async_client = AsyncHTTPClient()
+
+
+async def arequest(method: str, url: str, **kwargs) -> httpx.Response:
+    return await async_client.request(method, url, **kwargs)
+
+
+async def aget(url: str, **kwargs) -> httpx.Response:
+    return await async_client.get(url, **kwargs)
+
+
+async def apost(url: str, **kwargs) -> httpx.Response:
+    return await async_client.post(url, **kwargs)
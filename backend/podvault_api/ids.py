@@ -0,0 +1,55 @@
+"""
+podvault_api.ids
+~~~~~~~~~~~~~~~~
+Time-ordered primary keys.
+
+``uuid4`` keys land at random points of the primary-key index, so every
+insert of a bulk ingest touches a different page and "newest rows" scans
+jump all over it.  :func:`uuid7` produces RFC 9562 version-7 UUIDs::
+
+    48 bits  Unix time in milliseconds
+     4 bits  version (7)
+    12 bits  sequence within the millisecond (monotonic per process)
+     2 bits  variant
+    62 bits  random
+
+New keys sort after older ones, so inserts append to the right edge of
+the index and id order follows creation order.  They are ordinary UUIDs:
+the column type and existing ``uuid4`` rows are unaffected, and the two
+kinds mix freely (old rows simply keep their random positions).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+
+_lock = threading.Lock()
+_last_ms = 0
+_sequence = 0
+
+
+def uuid7() -> uuid.UUID:
+    """A new version-7 UUID, strictly increasing within this process."""
+    global _last_ms, _sequence
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms, _sequence = now_ms, 0
+        else:
+            # Same millisecond (or the clock stepped back): keep counting.
+            _sequence += 1
+            if _sequence > 0xFFF:
+                _last_ms, _sequence = _last_ms + 1, 0
+        ms, sequence = _last_ms, _sequence
+
+    rand = int.from_bytes(os.urandom(8), 'big') & ((1 << 62) - 1)
+    value = (ms & ((1 << 48) - 1)) << 80 | 0x7 << 76 | sequence << 64 | 0b10 << 62 | rand
+    return uuid.UUID(int=value)
+
+
+def uuid7_time(value: uuid.UUID) -> float:
+    """Creation time (Unix seconds) encoded in a version-7 UUID."""
+    return (value.int >> 80) / 1000
@@ -0,0 +1,152 @@
+"""
+podvault_api.middleware
+~~~~~~~~~~~~~~~~~~~~~~~
+Per-request database instrumentation.
+
+:class:`QueryStatsMiddleware` counts and times every SQL statement issued
+while a request is handled and reports:
+
+* ``X-DB-Queries`` / ``X-DB-Time-Ms`` response headers when
+  ``QUERY_STATS_HEADERS`` is on (defaults to ``DEBUG``);
+* a warning log line when a request exceeds ``QUERY_BUDGET_WARN`` queries;
+* running per-endpoint totals (``METHOD route``), readable with
+  :func:`snapshot`.  Requests that match no route share one
+  ``METHOD <unresolved>`` entry and unknown methods are folded into
+  ``OTHER``, so client-chosen paths cannot grow the table without bound.
+
+The counter lives in a context variable and every connection carries an
+``execute_wrapper`` that reads it, so statements are attributed correctly
+under Daphne too, where sync views run on worker threads (asgiref copies
+the request context into them) with their own connections.  Works with
+``DEBUG=False``.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger(__name__)
+
+_current: contextvars.ContextVar[Optional["QueryCounter"]] = contextvars.ContextVar(
+    "query_counter", default=None
+)
+_lock = threading.Lock()
+_KNOWN_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+_endpoint_stats: Dict[str, Dict[str, float]] = defaultdict(
+    lambda: {"requests": 0, "queries": 0, "db_ms": 0.0, "max_queries": 0}
+)
+
+
+class QueryCounter:
+    """Query count and DB seconds for one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+
+def _count_queries(execute, sql, params, many, context):
+    counter = _current.get()
+    if counter is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        counter.count += 1
+        counter.seconds += time.perf_counter() - started
+
+
+def install(connection) -> None:
+    """Attach the counting wrapper to *connection* (idempotent)."""
+    if _count_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_count_queries)
+
+
+def _on_connection_created(sender, connection, **kwargs):
+    install(connection)
+
+
+connection_created.connect(_on_connection_created, dispatch_uid="podvault_query_stats")
+
+
+def endpoint_key(request) -> str:
+    """``GET api/episodes/`` — the route pattern, so IDs don't split the stats."""
+    method = request.method if request.method in _KNOWN_METHODS else "OTHER"
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return f"{method} <unresolved>"
+    return f"{method} {match.route.lstrip('^').rstrip('$') or '/'}"
+
+
+def snapshot() -> Dict[str, Dict[str, float]]:
+    """Per-endpoint totals with per-request averages added."""
+    with _lock:
+        return {
+            key: {
+                **stats,
+                "avg_queries": stats["queries"] / stats["requests"],
+                "avg_db_ms": stats["db_ms"] / stats["requests"],
+            }
+            for key, stats in _endpoint_stats.items()
+        }
+
+
+class QueryStatsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.headers = getattr(settings, "QUERY_STATS_HEADERS", settings.DEBUG)
+        self.warn_at = getattr(settings, "QUERY_BUDGET_WARN", 50)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        for connection in connections.all(initialized_only=True):
+            install(connection)
+        counter = QueryCounter()
+        token = _current.set(counter)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.report(request, response, counter)
+
+    async def __acall__(self, request):
+        counter = QueryCounter()
+        token = _current.set(counter)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.report(request, response, counter)
+
+    def report(self, request, response, counter: QueryCounter):
+        key = endpoint_key(request)
+        db_ms = counter.seconds * 1000
+        with _lock:
+            stats = _endpoint_stats[key]
+            stats["requests"] += 1
+            stats["queries"] += counter.count
+            stats["db_ms"] += db_ms
+            stats["max_queries"] = max(stats["max_queries"], counter.count)
+        if counter.count > self.warn_at:
+            logger.warning("[QueryStats] %s ran %d queries (%.1f ms DB)", key, counter.count, db_ms)
+        if self.headers:
+            response["X-DB-Queries"] = str(counter.count)
+            response["X-DB-Time-Ms"] = f"{db_ms:.1f}"
+        return response
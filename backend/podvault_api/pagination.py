@@ -0,0 +1,137 @@
+"""
+podvault_api.pagination
+~~~~~~~~~~~~~~~~~~~~~~~
+Opt-in keyset (cursor) pagination.
+
+:class:`KeysetPagination` behaves exactly like the project-wide
+``LimitOffsetPagination`` unless the request carries ``?cursor=`` (empty
+for the first page).  In cursor mode it seeks on the view's
+``cursor_ordering`` — a sort key plus ``id`` as tie-breaker, e.g.
+``('-published_at', '-id')`` — instead of ``OFFSET``, and skips the
+``COUNT(*)``::
+
+    WHERE published_at < %s OR (published_at = %s AND id < %s)
+    ORDER BY published_at DESC, id DESC
+    LIMIT n + 1
+
+Backed by a composite index on the same columns, page N costs the same as
+page 1.  Responses carry ``next`` (and ``previous: null``) but no
+``count``.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import uuid
+from datetime import datetime
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(LimitOffsetPagination):
+    """LimitOffsetPagination with an opt-in ``?cursor=`` keyset mode."""
+
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        ordering = getattr(view, 'cursor_ordering', None)
+        if not ordering or self.cursor_query_param not in request.query_params:
+            return super().paginate_queryset(queryset, request, view)
+        if request.query_params.get('ordering'):
+            # Explicit ordering can't use the keyset index; page by offset.
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.keyset = tuple(ordering)
+        self.limit = self.get_limit(request) or self.default_limit
+        queryset = queryset.order_by(*self.keyset)
+
+        position = self.decode_cursor(request.query_params[self.cursor_query_param])
+        if position is not None:
+            queryset = queryset.filter(self.seek_filter(position))
+
+        rows = list(queryset[:self.limit + 1])
+        self.has_next = len(rows) > self.limit
+        self.page = rows[:self.limit]
+        return self.page
+
+    def get_paginated_response(self, data):
+        if self.keyset is None:
+            return super().get_paginated_response(data)
+        return Response({
+            'next': self.get_next_link(),
+            'previous': None,
+            'results': data,
+        })
+
+    def get_next_link(self):
+        if self.keyset is None:
+            return super().get_next_link()
+        if not self.has_next or not self.page:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.offset_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page[-1]))
+
+    # ------------------------------------------------------------------
+    # Cursor encoding
+    # ------------------------------------------------------------------
+
+    def seek_filter(self, position):
+        """``(k1, k2, …) <`` / ``>`` *position* in the keyset's direction."""
+        condition = Q()
+        equal = Q()
+        for field, value in zip(self.keyset, position):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            condition |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+        return condition
+
+    @classmethod
+    def cursor_for(cls, keyset, instance) -> str:
+        """Cursor for the page following *instance* in *keyset* order."""
+        paginator = cls()
+        paginator.keyset = tuple(keyset)
+        return paginator.encode_cursor(instance)
+
+    def encode_cursor(self, instance):
+        values = []
+        for field in self.keyset:
+            name = field.lstrip('-')
+            # Model instances, or values() rows on the fast path.
+            value = instance[name] if isinstance(instance, dict) else getattr(instance, name)
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            elif isinstance(value, uuid.UUID):
+                value = str(value)
+            values.append(value)
+        return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip('=')
+
+    def decode_cursor(self, raw):
+        if not raw:
+            return None
+        try:
+            padded = raw + '=' * (-len(raw) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            if not isinstance(values, list) or len(values) != len(self.keyset):
+                raise ValueError
+            return [self._parse(value) for value in values]
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    @staticmethod
+    def _parse(value):
+        if isinstance(value, str):
+            parsed = parse_datetime(value)
+            if parsed is not None:
+                return parsed
+        return value
@@ -0,0 +1,64 @@
+"""
+podvault_api.redis_client
+~~~~~~~~~~~~~~~~~~~~~~~~~
+Raw Redis access behind the default cache, for the Lua scripts and data
+structures the Django cache API cannot express (sorted sets, hashes,
+atomic read-and-delete)::
+
+    from podvault_api.redis_client import get_connection
+
+    conn = get_connection()
+    if conn is not None:
+        conn.eval(SCRIPT, 1, key, ...)
+
+:func:`get_connection` returns ``None`` when the default cache is not
+django-redis (the LocMem cache in tests, local development), so every
+caller keeps a fallback path instead of failing.
+
+:func:`release_cache_lock` is the matching release for locks taken with
+``cache.add(key, token)``: it deletes the key only while *token* still
+holds it, in one round trip.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Optional
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1] = lock key, ARGV[1] = the holder's (encoded) token
+_COMPARE_AND_DELETE = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def get_connection() -> Optional[Any]:
+    """Raw Redis client behind the default cache, or ``None``."""
+    try:
+        from django_redis import get_redis_connection
+        return get_redis_connection("default")
+    except Exception as exc:                                        # noqa: BLE001
+        # NotImplementedError when the cache is not django-redis.
+        logger.debug("[Redis] Raw connection unavailable: %s", exc)
+        return None
+
+
+
+def release_cache_lock(key: str, token: str) -> None:
+    """Delete cache *key* if it still holds *token* (set by ``cache.add``)."""
+    conn = get_connection()
+    if conn is None:
+        if cache.get(key) == token:
+            cache.delete(key)
+        return
+    try:
+        # The cache stores the token serialized; compare the same bytes.
+        conn.eval(_COMPARE_AND_DELETE, 1, cache.make_key(key), cache.client.encode(token))
+    except Exception as exc:                                        # noqa: BLE001
+        logger.warning("[Redis] Lock release failed for %s: %s", key, exc)
@@ -4,6 +4,8 @@ from django.conf import settings
 from botocore.exceptions import ClientError
 import logging
 
+from podvault_api import http_client
+
 logger = logging.getLogger(__name__)
 
 class RumbleService:
@@ -71,7 +73,7 @@ class RumbleService:
             # Hypothetical endpoint based on typical platform APIs
             url = f"https://rumble.com/api/v1/channel/{channel_id}/live"
             headers = {"Authorization": f"Bearer {self.api_key}"}
-            response = requests.get(url, headers=headers)
+            response = http_client.get(url, headers=headers)
             response.raise_for_status()
             data = response.json()
             return data.get('is_live', False)
@@ -93,7 +95,7 @@ class RumbleService:
                 "end": end_date
             }
             headers = {"Authorization": f"Bearer {self.api_key}"}
-            response = requests.get(f"{self.ad_api_url}/stats", params=payload, headers=headers)
+            response = http_client.get(f"{self.ad_api_url}/stats", params=payload, headers=headers)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/6.0/ref/settings/
 
 from pathlib import Path
 import os
+import tempfile
 from dotenv import load_dotenv
 
 
@@ -69,9 +70,11 @@ INSTALLED_APPS = [
     'podcasts',  # Multi-provider podcast integration layer
 ]
 
+# Every entry must be async-capable, or Django adapts the chain and async
+# views hold a thread.  Static files are served by podvault_api.static.
 MIDDLEWARE = [
+    'podvault_api.middleware.QueryStatsMiddleware',  # first, so every query is counted
     'django.middleware.security.SecurityMiddleware',
-    "whitenoise.middleware.WhiteNoiseMiddleware",
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -176,6 +179,25 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 
+CELERY_BEAT_SCHEDULE = {
+    'rebuild-feed-snapshot': {
+        'task': 'content.tasks.rebuild_feed_snapshot',
+        'schedule': 300.0,
+    },
+    'rebase-trending-scores': {
+        'task': 'content.tasks.rebase_trending_scores',
+        'schedule': 86400.0,
+    },
+    'flush-play-counts': {
+        'task': 'content.tasks.flush_play_counts',
+        'schedule': float(os.getenv('PLAY_FLUSH_INTERVAL', 30)),
+    },
+    'rollup-play-revenue': {
+        'task': 'payouts.tasks.rollup_play_revenue',
+        'schedule': float(os.getenv('PLAY_REVENUE_ROLLUP_INTERVAL', 3600)),
+    },
+}
+
 CORS_ALLOW_ALL_ORIGINS = True
 CSRF_TRUSTED_ORIGINS = os.getenv('CSRF_TRUSTED_ORIGINS', '').split(',') if os.getenv('CSRF_TRUSTED_ORIGINS') else [
     'https://mc-7f8atnj8om.bunny.run',
@@ -236,6 +258,85 @@ CACHES = {
 PODCAST_CACHE_TTL  = int(os.getenv("PODCAST_CACHE_TTL",  86400))  # 24 h — main Redis TTL
 PODCAST_FRESH_TTL  = int(os.getenv("PODCAST_FRESH_TTL",  3600))   #  1 h — SWR sentinel TTL
 
+# Single-flight detail/credits fetches: one lease per cache key, so a burst on
+# a cold or stale slug makes one provider fetch / enqueues one refresh task.
+PODCAST_FETCH_LEASE_TTL = int(os.getenv("PODCAST_FETCH_LEASE_TTL", 30))        # lease expiry if never released
+PODCAST_COALESCE_WAIT   = float(os.getenv("PODCAST_COALESCE_WAIT", 3.0))       # wait for another caller's fetch
+PODCAST_NOT_FOUND_TTL   = int(os.getenv("PODCAST_NOT_FOUND_TTL", 60))          # remember "iTunes has nothing" this long
+
+# Request budgets per podcast provider, shared by every process through Redis
+# (podcasts.rate_limiter).  Providers without an entry are not limited.
+PROVIDER_RATE_LIMITS = {
+    "itunes": {"max_calls": int(os.getenv("ITUNES_RATE_LIMIT", 20)), "period": 60.0},
+    # "taddy":     {"max_calls": 60, "period": 60.0},
+    # "podchaser": {"max_calls": 60, "period": 60.0},
+}
+
+# provider=all federated search: each provider gets this long (seconds) before
+# the merged result is returned without it; partial results cache briefly.
+PODCAST_FANOUT_DEADLINE = float(os.getenv("PODCAST_FANOUT_DEADLINE", 2.5))
+PODCAST_FANOUT_DEADLINES = {}  # per-provider overrides, e.g. {"podchaser": 1.5}
+PODCAST_FANOUT_WORKERS = int(os.getenv("PODCAST_FANOUT_WORKERS", 16))
+PODCAST_PARTIAL_TTL = int(os.getenv("PODCAST_PARTIAL_TTL", 60))
+
+# Home feed snapshot (content.services.FeedSnapshotService).
+FEED_SNAPSHOT_TTL  = int(os.getenv("FEED_SNAPSHOT_TTL",  86400))  # 24 h — rebuilt on catalog writes
+FEED_SECTION_SIZE  = int(os.getenv("FEED_SECTION_SIZE",  50))     # podcasts per feed section
+FEED_REBUILD_DELAY = int(os.getenv("FEED_REBUILD_DELAY", 10))     # debounce window (seconds)
+
+# Trending rankings (content.trending.TrendingEngine).
+TRENDING_HALF_LIFE   = int(os.getenv("TRENDING_HALF_LIFE",   172800))  # 48 h — score half-life
+TRENDING_MAX_ENTRIES = int(os.getenv("TRENDING_MAX_ENTRIES", 1000))    # members kept per sorted set
+
+# Full-text search (content.search) — ranked IDs read from the index per query.
+SEARCH_MAX_RESULTS = int(os.getenv("SEARCH_MAX_RESULTS", 500))
+
+# Play revenue credited to the creator per counted play (payouts.services).
+PLAY_REVENUE_PER_PLAY = os.getenv("PLAY_REVENUE_PER_PLAY", "0.50")
+
+# Streaming audio proxy (content.audio_proxy) — served under Daphne/ASGI.
+AUDIO_PROXY_CHUNK_SIZE      = int(os.getenv("AUDIO_PROXY_CHUNK_SIZE", 64 * 1024))  # bytes relayed per send
+AUDIO_PROXY_CONNECT_TIMEOUT = float(os.getenv("AUDIO_PROXY_CONNECT_TIMEOUT", 5))
+AUDIO_PROXY_READ_TIMEOUT    = float(os.getenv("AUDIO_PROXY_READ_TIMEOUT", 20))
+# Every listener holds one upstream connection for the whole episode, so the
+# pool is uncapped by default; set a cap to shed load with a fast 503 instead.
+AUDIO_PROXY_MAX_CONNECTIONS = int(os.getenv("AUDIO_PROXY_MAX_CONNECTIONS", 0)) or None
+AUDIO_PROXY_POOL_TIMEOUT    = float(os.getenv("AUDIO_PROXY_POOL_TIMEOUT", 1))    # wait for a pooled connection
+AUDIO_PROXY_MAX_KEEPALIVE   = int(os.getenv("AUDIO_PROXY_MAX_KEEPALIVE", 20))
+
+# Disk block cache in front of the audio proxy (content.audio_cache).
+AUDIO_CACHE_ENABLED    = os.getenv("AUDIO_CACHE_ENABLED", "true").lower() == "true"
+AUDIO_CACHE_DIR        = os.getenv("AUDIO_CACHE_DIR", os.path.join(tempfile.gettempdir(), "podvault-audio-cache"))
+AUDIO_CACHE_BLOCK_SIZE = int(os.getenv("AUDIO_CACHE_BLOCK_SIZE", 1024 * 1024))      # 1 MiB blocks
+AUDIO_CACHE_MAX_BYTES  = int(os.getenv("AUDIO_CACHE_MAX_BYTES", 2 * 1024 ** 3))     # 2 GiB LRU cap
+AUDIO_CACHE_MAX_AGE    = int(os.getenv("AUDIO_CACHE_MAX_AGE", 3600))                # revalidate upstream after 1 h
+
+# Shared outbound HTTP client for third-party APIs (podvault_api.http_client).
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", 3.05))
+HTTP_READ_TIMEOUT    = float(os.getenv("HTTP_READ_TIMEOUT", 15))
+HTTP_POOL_SIZE       = int(os.getenv("HTTP_POOL_SIZE", 10))      # keep-alive connections per host
+HTTP_RETRIES         = int(os.getenv("HTTP_RETRIES", 2))         # retries of idempotent requests
+HTTP_RETRY_BACKOFF   = float(os.getenv("HTTP_RETRY_BACKOFF", 0.5))  # full-jitter base (seconds)
+HTTP_ASYNC_MAX_CONNECTIONS = int(os.getenv("HTTP_ASYNC_MAX_CONNECTIONS", 200))  # per event loop (async views)
+HTTP_ASYNC_MAX_KEEPALIVE   = int(os.getenv("HTTP_ASYNC_MAX_KEEPALIVE", 50))
+
+# Per-request DB instrumentation (podvault_api.middleware.QueryStatsMiddleware).
+QUERY_STATS_HEADERS = os.getenv("QUERY_STATS_HEADERS", str(DEBUG)).lower() == "true"  # X-DB-Queries / X-DB-Time-Ms
+QUERY_BUDGET_WARN   = int(os.getenv("QUERY_BUDGET_WARN", 50))   # log requests running more queries than this
+
+# values()-row serializers + orjson renderer for episodes/podcasts/feed (podvault_api.fastjson).
+FAST_JSON_RENDERING = os.getenv("FAST_JSON_RENDERING", "false").lower() == "true"
+
+# Newest episodes embedded in a podcast detail response; the rest via episodes_next.
+PODCAST_DETAIL_EPISODES = int(os.getenv("PODCAST_DETAIL_EPISODES", 20))
+
+# Rendered anonymous catalog list responses (content.response_cache); 0 disables.
+RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", 300))
+
+# Transcript search (content.transcripts).
+TRANSCRIPT_SEGMENT_WORDS = int(os.getenv("TRANSCRIPT_SEGMENT_WORDS", 80))   # words per indexed segment
+TRANSCRIPT_SNIPPET_CHARS = int(os.getenv("TRANSCRIPT_SNIPPET_CHARS", 160))  # highlighted snippet length
+
 # Taddy GraphQL API
 TADDY_API_KEY  = os.getenv("TADDY_API_KEY", "")
 TADDY_USER_ID  = os.getenv("TADDY_USER_ID", "")
@@ -252,6 +353,9 @@ BUNNY_STORAGE_ZONE_NAME = os.getenv('BUNNY_STORAGE_ZONE_NAME')
 BUNNY_STORAGE_PASSWORD = os.getenv('BUNNY_STORAGE_PASSWORD')
 BUNNY_PULL_ZONE_URL = os.getenv('BUNNY_PULL_ZONE_URL')
 BUNNY_STORAGE_REGION = os.getenv('BUNNY_STORAGE_REGION', 'de')
+BUNNY_PULL_ZONE_SECURITY_KEY = os.getenv('BUNNY_PULL_ZONE_SECURITY_KEY')  # enables signed pull-zone URLs
+BUNNY_SIGNED_URL_TTL = int(os.getenv('BUNNY_SIGNED_URL_TTL', 3600))
+STREAM_TOKEN_MAX_AGE = int(os.getenv('STREAM_TOKEN_MAX_AGE', 7200))
 
 # Rumble Integration Configuration
 RUMBLE_API_KEY = os.getenv('RUMBLE_API_KEY')
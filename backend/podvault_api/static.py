@@ -0,0 +1,82 @@
+"""
+podvault_api.static
+~~~~~~~~~~~~~~~~~~~
+Static files served in front of Django instead of from ``MIDDLEWARE``.
+
+``WhiteNoiseMiddleware`` is sync-only.  Listed in ``MIDDLEWARE`` it made
+Django adapt the middleware chain under Daphne, so every async view (the
+podcast views, the audio proxy) went through ``sync_to_async`` and held a
+worker thread.  The same WhiteNoise file table (configured from the
+``STATIC_*`` / ``WHITENOISE_*`` settings exactly as the middleware would
+be) now wraps the application::
+
+    application = StaticFilesASGIHandler(get_asgi_application())   # asgi.py
+    application = StaticFilesWSGIHandler(get_wsgi_application())   # wsgi.py
+
+Requests for a known static file are answered by WhiteNoise, and
+everything else goes to Django with a middleware chain that is async
+end to end.
+"""
+
+from __future__ import annotations
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import get_path_info
+from whitenoise.base import WhiteNoise
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+
+def static_files() -> WhiteNoiseMiddleware:
+    """WhiteNoise's file table, configured from settings but not mounted as middleware."""
+    return WhiteNoiseMiddleware(get_response=None)
+
+
+def _lookup(static: WhiteNoiseMiddleware, path: str):
+    return static.find_file(path) if static.autorefresh else static.files.get(path)
+
+
+class StaticFilesASGIHandler(ASGIHandler):
+    """
+    ASGI wrapper answering static file requests before *application* sees
+    them.  Like Django's ``ASGIStaticFilesHandler`` it loads no middleware.
+    """
+
+    def __init__(self, application):
+        self.application = application
+        self.static = static_files()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            path, root = scope["path"], scope.get("root_path", "")
+            if _lookup(self.static, path[len(root):] if root and path.startswith(root) else path) is not None:
+                return await super().__call__(scope, receive, send)
+        return await self.application(scope, receive, send)
+
+    async def get_response_async(self, request):
+        static_file = _lookup(self.static, request.path_info)
+        response = await sync_to_async(self.static.serve, thread_sensitive=False)(static_file, request)
+        response._resource_closers.append(request.close)
+        # FileResponse iterates a file synchronously; read it off the loop.
+        chunks = response.streaming_content
+
+        async def body():
+            for part in await sync_to_async(list, thread_sensitive=False)(chunks):
+                yield part
+
+        response.streaming_content = body()
+        return response
+
+
+class StaticFilesWSGIHandler:
+    """WSGI wrapper answering static file requests before *application* sees them."""
+
+    def __init__(self, application):
+        self.application = application
+        self.static = static_files()
+
+    def __call__(self, environ, start_response):
+        static_file = _lookup(self.static, get_path_info(environ))
+        if static_file is None:
+            return self.application(environ, start_response)
+        return WhiteNoise.serve(static_file, environ, start_response)
@@ -1,16 +1,24 @@
-import requests
+import base64
+import hashlib
+import time
 from django.core.files.storage import Storage
 from django.core.files.base import ContentFile
 from django.conf import settings
 from django.utils.deconstruct import deconstructible
 import os
 
+from podvault_api import http_client
+
 @deconstructible
 class BunnyStorage(Storage):
+    # (connect, read) seconds — uploads of full episodes need longer than the client default.
+    UPLOAD_TIMEOUT = (5, 120)
+
     def __init__(self):
         self.storage_zone_name = settings.BUNNY_STORAGE_ZONE_NAME
         self.storage_password = settings.BUNNY_STORAGE_PASSWORD
         self.pull_zone_url = settings.BUNNY_PULL_ZONE_URL
+        self.security_key = getattr(settings, 'BUNNY_PULL_ZONE_SECURITY_KEY', None)
         self.region = getattr(settings, 'BUNNY_STORAGE_REGION', 'de')
         
         # Construct the base URL for the storage API
@@ -31,7 +39,7 @@ class BunnyStorage(Storage):
         # for reading as a file object immediately because it's an HTTP API.
         # For simple read operations, we can fetch the content.
         url = self.url(name)
-        response = requests.get(url)
+        response = http_client.get(url)
         if response.status_code == 200:
             return ContentFile(response.content)
         raise FileNotFoundError(f"File {name} not found.")
@@ -45,7 +53,7 @@ class BunnyStorage(Storage):
         
         # Upload to Bunny.net
         upload_url = self.base_url + name
-        response = requests.put(upload_url, data=file_content, headers=self.headers)
+        response = http_client.put(upload_url, data=file_content, headers=self.headers, timeout=self.UPLOAD_TIMEOUT)
         
         if response.status_code == 201:
             return name
@@ -90,7 +98,22 @@ class BunnyStorage(Storage):
         # Return the Pull Zone URL
         return f"{self.pull_zone_url.rstrip('/')}/{name.lstrip('/')}"
 
+    def signed_url(self, name, expires_in=3600):
+        """
+        Pull Zone URL with Bunny token authentication, valid for
+        ``expires_in`` seconds: token = urlsafe-base64(sha256(key + path + expires)).
+        Falls back to the plain URL when no security key is configured.
+        """
+        url = self.url(name)
+        if not self.security_key:
+            return url
+        path = '/' + name.lstrip('/')
+        expires = int(time.time()) + expires_in
+        digest = hashlib.sha256(f"{self.security_key}{path}{expires}".encode()).digest()
+        token = base64.urlsafe_b64encode(digest).decode().rstrip('=')
+        return f"{url}?token={token}&expires={expires}"
+
     def delete(self, name):
         name = name.lstrip('/')
         delete_url = self.base_url + name
-        requests.delete(delete_url, headers=self.headers)
+        http_client.delete(delete_url, headers=self.headers)
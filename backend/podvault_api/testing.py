@@ -0,0 +1,45 @@
+"""
+podvault_api.testing
+~~~~~~~~~~~~~~~~~~~~
+Test helpers shared by the app test suites.
+"""
+
+from __future__ import annotations
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryBudgetMixin:
+    """
+    Mixin for ``TestCase`` classes that pins how many queries an endpoint
+    may run::
+
+        class TestLikes(QueryBudgetMixin, TestCase):
+            def test_list(self):
+                self.assertQueryBudget("/api/likes/", budget=3, grow=self.add_like)
+    """
+
+    def measure_queries(self, path, data=None):
+        """GET *path* and return ``(response, number of queries)``."""
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(path, data)
+        self.assertEqual(response.status_code, 200, response.content[:200])
+        return response, len(ctx.captured_queries)
+
+    def assertQueryBudget(self, path, budget, data=None, grow=None, rows=5):
+        """
+        Assert GET *path* runs at most *budget* queries.  With *grow* (a
+        callable adding one row the endpoint lists), also assert the count
+        stays the same after *rows* more rows — i.e. no per-row queries.
+        """
+        _, before = self.measure_queries(path, data)
+        self.assertLessEqual(before, budget, f"{path} ran {before} queries (budget {budget})")
+        if grow is None:
+            return
+        for _ in range(rows):
+            grow()
+        _, after = self.measure_queries(path, data)
+        self.assertEqual(
+            after, before, f"{path} went from {before} to {after} queries with {rows} more rows"
+        )
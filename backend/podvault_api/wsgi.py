@@ -13,4 +13,8 @@ from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'podvault_api.settings')
 
-application = get_wsgi_application()
+django_application = get_wsgi_application()
+
+from podvault_api.static import StaticFilesWSGIHandler  # noqa: E402
+
+application = StaticFilesWSGIHandler(django_application)
@@ -2,6 +2,8 @@ from django.db.models.signals import post_save
 from django.dispatch import receiver
 from .models import ListeningSession
 from users.models import UserPreference
+from content.trending import TrendingEngine
+from django.db import transaction
 import logging
 
 logger = logging.getLogger(__name__)
@@ -49,3 +51,21 @@ def update_interest_on_listen(sender, instance, created, **kwargs):
             
     except Exception as e:
         logger.error(f"Failed to update interest vector for {instance.user.username}: {e}")
+
+@receiver(post_save, sender=ListeningSession)
+def trend_on_listen(sender, instance, created, **kwargs):
+    """
+    Credit a verified listen to the trending rankings, scaled by completion.
+    """
+    if not created:
+        return
+
+    episode = instance.episode
+    completion = min(instance.duration_seconds / episode.duration, 1.0) if episode.duration > 0 else 0.0
+    if completion <= 0:
+        return
+
+    category_slug = episode.podcast.category.slug if episode.podcast.category_id else None
+    transaction.on_commit(lambda: TrendingEngine().record_episode_event(
+        'listen', episode.pk, episode.podcast_id, category_slug,
+        scale=completion, at=instance.verified_at))
@@ -48,6 +48,12 @@ class UserActivity(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Keyset pagination seeks (podvault_api.pagination.KeysetPagination)
+            models.Index(fields=['-created_at', '-id'], name='activity_created_keyset'),
+            models.Index(fields=['user', '-created_at', '-id'], name='activity_user_keyset'),
+            models.Index(fields=['activity_type', 'episode', '-created_at', '-id'], name='activity_type_episode_keyset'),
+        ]
 
     def __str__(self):
         return f"{self.user} {self.activity_type} {self.episode or 'content'}"
@@ -1,3 +1,37 @@
+"""
+users.tests
+~~~~~~~~~~~
+Unit tests for user activity endpoints.
+
+Run with::
+
+    python manage.py test users --verbosity=2
+"""
+
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
 
-# Create your tests here.
+from content.models import Episode, Podcast
+from users.models import UserActivity
+
+
+class TestCommentCursorPagination(TestCase):
+
+    def setUp(self):
+        user = get_user_model().objects.create_user(username="listener", password="x")
+        self.episode = Episode.objects.create(podcast=Podcast.objects.create(title="Vault Cast"), title="Ep 1")
+        UserActivity.objects.bulk_create([
+            UserActivity(user=user, episode=self.episode, activity_type="comment", metadata={"text": str(i)})
+            for i in range(5)
+        ])
+
+    def test_comments_page_by_cursor(self):
+        seen, url, params = [], "/api/comments/", {"episode_id": self.episode.pk, "cursor": "", "limit": 2}
+        while url:
+            body = self.client.get(url, params).json()
+            seen += [c["id"] for c in body["results"]]
+            url, params = body["next"], None
+        expected = list(UserActivity.objects.order_by("-created_at", "-id").values_list("id", flat=True))
+        self.assertEqual(seen, expected)
@@ -3,6 +3,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.contrib.auth import get_user_model
 from django.db.models import Q
+from podvault_api.pagination import KeysetPagination
 from .models import UserActivity, UserPreference
 from .serializers import UserActivitySerializer, UserPreferenceSerializer
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -149,12 +150,14 @@ class CommentViewSet(viewsets.ModelViewSet):
     """
     API endpoint for comments (stored as UserActivity).
     """
-    queryset = UserActivity.objects.filter(activity_type='comment')
+    queryset = UserActivity.objects.filter(activity_type='comment').select_related('user')
     serializer_class = UserActivitySerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     filter_backends = [filters.OrderingFilter]
     ordering_fields = ['created_at']
     ordering = ['-created_at']
+    pagination_class = KeysetPagination
+    cursor_ordering = ('-created_at', '-id')
 
     def get_queryset(self):
         queryset = super().get_queryset()
@@ -173,12 +176,14 @@ class UserActivityViewSet(viewsets.ModelViewSet):
     """
     API endpoint for user activities (likes, plays, follows, comments, shares).
     """
-    queryset = UserActivity.objects.all()
+    queryset = UserActivity.objects.select_related('user')
     serializer_class = UserActivitySerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     filter_backends = [filters.OrderingFilter, filters.SearchFilter]
     ordering_fields = ['created_at', 'activity_type']
     ordering = ['-created_at']
+    pagination_class = KeysetPagination
+    cursor_ordering = ('-created_at', '-id')
     search_fields = ['activity_type']
 
     def get_queryset(self):